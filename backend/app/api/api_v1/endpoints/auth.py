@@ -1,8 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from ....crud.player import crud_player
-from ....db.session import get_db_dependency
+from ....db.session import get_async_db_dependency
 from ....schemas.auth import ChallengeRequest, ChallengeResponse, VerifyRequest
 from ....schemas.player import PlayerCreate
 from ....schemas.token import Token
@@ -16,7 +16,7 @@ _auth_provider = JWTAuthProvider()
 async def request_challenge(body: ChallengeRequest):
     nonce = await _auth_provider.create_challenge(body.wallet_address)
     return ChallengeResponse(
-        wallet_address=body.wallet_address.lower(),
+        wallet_address=body.wallet_address,
         nonce=nonce,
     )
 
@@ -24,7 +24,7 @@ async def request_challenge(body: ChallengeRequest):
 @router.post("/verify", response_model=Token)
 async def verify_signature(
     body: VerifyRequest,
-    db: Session = Depends(get_db_dependency),
+    db: AsyncSession = Depends(get_async_db_dependency),
 ):
     is_valid = await _auth_provider.verify_challenge(
         wallet_address=body.wallet_address,
@@ -37,10 +37,8 @@ async def verify_signature(
             detail="Invalid signature or expired nonce",
         )
 
-    addr = body.wallet_address.lower()
-    player = crud_player.get_by_wallet_address(db, wallet_address=addr)
-    if player is None:
-        player = crud_player.create(db, obj_in=PlayerCreate(wallet_address=addr))
+    addr = body.wallet_address
+    player = await crud_player.aget_or_create(db, obj_in=PlayerCreate(wallet_address=addr))
 
     access_token = await _auth_provider.generate_token(
         wallet_address=addr,
@@ -1,14 +1,18 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
-from ....db.session import get_db_dependency
-from ....models.models import Player
+from ...deps import set_next_cursor
+from ....core.cache import entity_cache
+from ....db.session import get_async_db_dependency, get_db_dependency
 from ....schemas.character import Character, CharacterCreate, CharacterUpdate
+from ....schemas.player import Player as PlayerSchema
 from ....schemas.owned_character import OwnedCharacter
+from ....crud.base import as_schema
 from ....crud.character import crud_character
 from ....services.auth.dependencies import get_current_player
-from ....services.character_inventory import CharacterInventoryService
+from ....services.character_inventory import get_character_inventory_service
 from core.config.config_loader import load_config
 from pydantic import BaseModel
 
@@ -33,10 +37,10 @@ class RevivalFeeResponse(BaseModel):
 @router.post("/purchase", response_model=List[OwnedCharacter])
 async def purchase_characters(
     body: PurchaseRequest,
-    current_player: Player = Depends(get_current_player),
+    current_player: PlayerSchema = Depends(get_current_player),
     db: Session = Depends(get_db_dependency),
 ):
-    service = CharacterInventoryService()
+    service = get_character_inventory_service()
     try:
         return await service.purchase_characters(
             db,
@@ -50,11 +54,11 @@ async def purchase_characters(
 
 @router.get("/inventory", response_model=List[OwnedCharacter])
 def get_inventory(
-    current_player: Player = Depends(get_current_player),
+    current_player: PlayerSchema = Depends(get_current_player),
     alive_only: bool = False,
     db: Session = Depends(get_db_dependency),
 ):
-    service = CharacterInventoryService()
+    service = get_character_inventory_service()
     return service.get_player_inventory(db, player_id=current_player.id, alive_only=alive_only)
 
 
@@ -71,10 +75,10 @@ def get_revival_fee(character_id: int):
 async def revive_character(
     character_id: int,
     body: ReviveRequest,
-    current_player: Player = Depends(get_current_player),
+    current_player: PlayerSchema = Depends(get_current_player),
     db: Session = Depends(get_db_dependency),
 ):
-    service = CharacterInventoryService()
+    service = get_character_inventory_service()
     try:
         return await service.revive_character(
             db,
@@ -90,52 +94,65 @@ async def revive_character(
 
 
 @router.get("/", response_model=List[Character])
-def read_characters(
-    db: Session = Depends(get_db_dependency),
+async def read_characters(
+    response: Response,
+    db: AsyncSession = Depends(get_async_db_dependency),
     skip: int = 0,
     limit: int = 100,
+    after_id: Optional[int] = None,
 ):
-    return crud_character.get_multi(db, skip=skip, limit=limit)
+    items = await crud_character.aget_multi(db, skip=skip, limit=limit, after_id=after_id)
+    if after_id is not None:
+        set_next_cursor(response, items, limit)
+    return items
 
 
 @router.post("/", response_model=Character)
-def create_character(
+async def create_character(
     character_in: CharacterCreate,
-    db: Session = Depends(get_db_dependency),
+    db: AsyncSession = Depends(get_async_db_dependency),
 ):
-    return crud_character.create(db, obj_in=character_in)
+    return await crud_character.acreate(db, obj_in=character_in)
 
 
 @router.get("/{character_id}", response_model=Character)
-def read_character(
+async def read_character(
     character_id: int,
-    db: Session = Depends(get_db_dependency),
+    db: AsyncSession = Depends(get_async_db_dependency),
 ):
-    character = crud_character.get(db, id=character_id)
+    cached = entity_cache.get(("character", character_id))
+    if cached is not None:
+        return cached
+    character = await crud_character.aget(db, character_id)
     if not character:
         raise HTTPException(status_code=404, detail="Character not found")
-    return character
+    result = as_schema(Character, character)
+    entity_cache.set(("character", character_id), result)
+    return result
 
 
 @router.put("/{character_id}", response_model=Character)
-def update_character(
+async def update_character(
     character_id: int,
     character_in: CharacterUpdate,
-    db: Session = Depends(get_db_dependency),
+    db: AsyncSession = Depends(get_async_db_dependency),
 ):
-    character = crud_character.get(db, id=character_id)
+    character = await crud_character.aupdate_by_id(db, id=character_id, obj_in=character_in)
     if not character:
         raise HTTPException(status_code=404, detail="Character not found")
-    return crud_character.update(db, db_obj=character, obj_in=character_in)
+    entity_cache.pop(("character", character_id))
+    return character
 
 
 @router.post("/{character_id}/assign-to-match/{match_id}", response_model=Character)
-def assign_character_to_match(
+async def assign_character_to_match(
     character_id: int,
     match_id: int,
-    db: Session = Depends(get_db_dependency),
+    db: AsyncSession = Depends(get_async_db_dependency),
 ):
-    character = crud_character.get(db, id=character_id)
+    # One UPDATE ... RETURNING; no row back means no such character
+    character = await crud_character.aupdate_by_id(db, id=character_id, obj_in={"match_id": match_id})
     if not character:
         raise HTTPException(status_code=404, detail="Character not found")
-    return crud_character.assign_to_match(db, character_id=character_id, match_id=match_id)
+    entity_cache.pop(("character", character_id))
+    return character
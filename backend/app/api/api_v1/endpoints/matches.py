@@ -1,22 +1,30 @@
-from typing import List, Optional
+import asyncio
+from typing import AsyncIterator, List, Optional, Tuple
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from sqlalchemy import func
-from sqlalchemy.orm import Session
-
+from sqlalchemy import and_, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, sessionmaker
+from starlette.concurrency import run_in_threadpool
+
+from ...deps import set_next_cursor
+from ....core.cache import entity_cache, match_results_cache, open_matches_cache
+from ....crud.base import as_schema, list_load_options
 from ....crud.match import crud_match
 from ....crud.match_event import crud_match_event
-from ....crud.pending_payout import crud_pending_payout
-from ....db.session import get_db_dependency
-from ....models.models import Character, Match, MatchEvent as MatchEventModel, Player
+from ....db.session import get_async_db_dependency, get_db_dependency, get_session_factory
+from ....models.models import Character, Match, PendingPayout
 from ....schemas.match import Match as MatchSchema, MatchCreate, MatchUpdate
 from ....schemas.match_event import MatchEvent as MatchEventSchema
 from ....schemas.match_join_request import MatchJoinRequest as MatchJoinRequestSchema
 from ....schemas.pending_payout import PendingPayout as PendingPayoutSchema
+from ....schemas.player import Player as PlayerSchema
 from ....services.auth.dependencies import get_current_player
-from ....services.match_lobby import MatchLobbyService
-from ....services.settlement import SettlementService
+from ....services.match_event_stream import match_event_notifier
+from ....services.match_lobby import get_match_lobby_service
+from ....services.settlement import get_settlement_service
 
 router = APIRouter()
 
@@ -65,10 +73,10 @@ class MatchResultsResponse(BaseModel):
 @router.post("/create", response_model=MatchSchema)
 async def create_match_lobby(
     body: CreateLobbyRequest,
-    current_player: Player = Depends(get_current_player),
+    current_player: PlayerSchema = Depends(get_current_player),
     db: Session = Depends(get_db_dependency),
 ):
-    service = MatchLobbyService()
+    service = get_match_lobby_service()
     try:
         return await service.create_match_lobby(
             db,
@@ -94,23 +102,30 @@ def get_open_matches(
     limit: int = 50,
     db: Session = Depends(get_db_dependency),
 ):
-    q = db.query(Match).filter(Match.status == "filling")
+    cache_key = (min_fee, max_fee, has_slots, skip, limit)
+    cached = open_matches_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    q = (
+        db.query(Match)
+        .options(*list_load_options())
+        .filter(Match.status == "filling")
+    )
     if min_fee is not None:
         q = q.filter(Match.entry_fee >= min_fee)
     if max_fee is not None:
         q = q.filter(Match.entry_fee <= max_fee)
-    matches = q.offset(skip).limit(limit).all()
     if has_slots:
-        result = []
-        for m in matches:
-            count = (
-                db.query(func.count(Character.id))
-                .filter(Character.match_id == m.id)
-                .scalar()
-            ) or 0
-            if count < m.max_characters:
-                result.append(m)
-        return result
+        # Count characters per match in the same query instead of one
+        # COUNT per returned match
+        q = (
+            q.outerjoin(Character, Character.match_id == Match.id)
+            .group_by(Match.id)
+            .having(func.count(Character.id) < Match.max_characters)
+        )
+    matches = [as_schema(MatchSchema, m) for m in q.offset(skip).limit(limit).all()]
+    open_matches_cache.set(cache_key, matches)
     return matches
 
 
@@ -118,10 +133,10 @@ def get_open_matches(
 async def join_match(
     match_id: int,
     body: JoinMatchRequest,
-    current_player: Player = Depends(get_current_player),
+    current_player: PlayerSchema = Depends(get_current_player),
     db: Session = Depends(get_db_dependency),
 ):
-    service = MatchLobbyService()
+    service = get_match_lobby_service()
     try:
         return await service.join_match(
             db,
@@ -149,25 +164,92 @@ def get_match_events(
     )
 
 
+_STREAM_PAGE_SIZE = 100
+_STREAM_KEEPALIVE_SECONDS = 15.0
+_ENDED_STATUSES = ("completed", "failed", "cancelled")
+
+
+def _read_stream_page(
+    session_factory: sessionmaker, match_id: int, after_event_id: Optional[int],
+) -> Tuple[List[MatchEventSchema], Optional[str]]:
+    # A session per page: the connection goes back to the pool between
+    # pages instead of idling in a transaction for the whole stream
+    with session_factory() as db:
+        events = crud_match_event.get_by_match_id(
+            db, match_id, after_event_id=after_event_id, limit=_STREAM_PAGE_SIZE,
+        )
+        status = db.scalar(select(Match.status).where(Match.id == match_id))
+        return [as_schema(MatchEventSchema, e) for e in events], status
+
+
+def _match_exists(session_factory: sessionmaker, match_id: int) -> bool:
+    with session_factory() as db:
+        return db.scalar(select(Match.id).where(Match.id == match_id)) is not None
+
+
+@router.get("/{match_id}/events/stream", response_class=StreamingResponse)
+async def stream_match_events(
+    match_id: int,
+    after_event_id: Optional[int] = None,
+    session_factory: sessionmaker = Depends(get_session_factory),
+):
+    """Server-sent events feed of a match's events, replacing /events polling.
+
+    Sends every event after ``after_event_id``, then waits for commits of new
+    events and closes once the match has ended and everything was sent.
+    """
+    if not await run_in_threadpool(_match_exists, session_factory, match_id):
+        raise HTTPException(status_code=404, detail="Match not found")
+
+    async def event_source() -> AsyncIterator[str]:
+        last_id = after_event_id
+        with match_event_notifier.subscribe(match_id) as wakeup:
+            while True:
+                # Clear before reading so a commit landing mid-read re-wakes us
+                wakeup.clear()
+                events, status = await run_in_threadpool(
+                    _read_stream_page, session_factory, match_id, last_id,
+                )
+                for e in events:
+                    last_id = e.id
+                    yield f"id: {e.id}\ndata: {e.model_dump_json()}\n\n"
+                if len(events) == _STREAM_PAGE_SIZE:
+                    continue
+                if status in _ENDED_STATUSES:
+                    return
+                try:
+                    await asyncio.wait_for(wakeup.wait(), _STREAM_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+
+    return StreamingResponse(event_source(), media_type="text/event-stream")
+
+
 @router.get("/{match_id}/status", response_model=MatchStatusResponse)
 def get_match_status(
     match_id: int,
     db: Session = Depends(get_db_dependency),
 ):
-    match = crud_match.get(db, id=match_id)
-    if not match:
-        raise HTTPException(status_code=404, detail="Match not found")
-
-    characters = (
-        db.query(Character).filter(Character.match_id == match_id).all()
+    row = (
+        db.query(
+            Match,
+            func.count(Character.id),
+            func.count(func.distinct(Character.player_id)),
+        )
+        .outerjoin(Character, Character.match_id == Match.id)
+        .filter(Match.id == match_id)
+        .group_by(Match.id)
+        .one_or_none()
     )
-    unique_players = len({c.player_id for c in characters})
+    if row is None:
+        raise HTTPException(status_code=404, detail="Match not found")
+    match, total_characters, unique_players = row
 
     return MatchStatusResponse(
         match_id=match.id,
         status=match.status,
         entry_fee=match.entry_fee,
-        total_characters=len(characters),
+        total_characters=total_characters,
         unique_players=unique_players,
         max_characters=match.max_characters,
         min_players=match.min_players,
@@ -183,15 +265,15 @@ def get_match_status(
 @router.post("/{match_id}/settle", response_model=List[PendingPayoutSchema])
 async def settle_match(
     match_id: int,
-    current_player: Player = Depends(get_current_player),
+    current_player: PlayerSchema = Depends(get_current_player),
     db: Session = Depends(get_db_dependency),
 ):
-    match = crud_match.get(db, id=match_id)
+    match = await run_in_threadpool(crud_match.get, db, id=match_id)
     if not match:
         raise HTTPException(status_code=404, detail="Match not found")
     if match.status != "completed":
         raise HTTPException(status_code=400, detail="Match is not completed")
-    service = SettlementService()
+    service = get_settlement_service()
     return await service.settle_match(db, match_id)
 
 
@@ -200,100 +282,115 @@ def get_match_results(
     match_id: int,
     db: Session = Depends(get_db_dependency),
 ):
-    match = crud_match.get(db, id=match_id)
-    if not match:
+    cached = match_results_cache.get(match_id)
+    if cached is not None:
+        return cached
+
+    # The winner's owner comes back with the match row, and the kill
+    # aggregate lists every player, so no Character rows are loaded
+    row = (
+        db.query(Match, Character.player_id)
+        .outerjoin(
+            Character,
+            and_(
+                Character.id == Match.winner_character_id,
+                Character.match_id == Match.id,
+            ),
+        )
+        .filter(Match.id == match_id)
+        .one_or_none()
+    )
+    if row is None:
         raise HTTPException(status_code=404, detail="Match not found")
+    match, winner_player_id = row
     if match.status not in ("completed", "failed"):
         raise HTTPException(status_code=400, detail="Match has not ended")
 
-    characters = (
-        db.query(Character).filter(Character.match_id == match_id).all()
-    )
-    char_to_player = {c.id: c.player_id for c in characters}
-    player_ids = {c.player_id for c in characters}
-
-    kill_events = (
-        db.query(MatchEventModel)
-        .filter(
-            MatchEventModel.match_id == match_id,
-            MatchEventModel.event_type == "direct_kill",
+    # Kills and payouts per player in one round-trip: the kill aggregate
+    # lists every player, each joined to their payouts (if any)
+    kills = crud_match_event.kills_by_player_subquery(match_id)
+    rows = (
+        db.query(kills.c.player_id, kills.c.kills, PendingPayout)
+        .outerjoin(
+            PendingPayout,
+            and_(
+                PendingPayout.match_id == match_id,
+                PendingPayout.player_id == kills.c.player_id,
+            ),
         )
+        .order_by(kills.c.player_id, PendingPayout.id)
         .all()
     )
-    kills_per_player: dict[int, int] = {pid: 0 for pid in player_ids}
-    for event in kill_events:
-        if not event.affected_character_ids:
-            continue
-        killer_char_id = int(event.affected_character_ids.split(",")[0].strip())
-        killer_player_id = char_to_player.get(killer_char_id)
-        if killer_player_id is not None:
-            kills_per_player[killer_player_id] = kills_per_player.get(killer_player_id, 0) + 1
-
-    payouts = crud_pending_payout.get_by_match_id(db, match_id)
-    payouts_by_player: dict[int, list] = {pid: [] for pid in player_ids}
-    for p in payouts:
-        payouts_by_player.setdefault(p.player_id, []).append(p)
-
-    winner_player_id = None
-    if match.winner_character_id is not None:
-        winner_player_id = char_to_player.get(match.winner_character_id)
-
-    players = [
-        PlayerResultEntry(
-            player_id=pid,
-            kills=kills_per_player.get(pid, 0),
-            payouts=payouts_by_player.get(pid, []),
-        )
-        for pid in player_ids
-    ]
-
-    return MatchResultsResponse(
+    players: List[PlayerResultEntry] = []
+    for player_id, kill_count, payout in rows:
+        if not players or players[-1].player_id != player_id:
+            players.append(PlayerResultEntry(player_id=player_id, kills=kill_count, payouts=[]))
+        if payout is not None:
+            players[-1].payouts.append(as_schema(PendingPayoutSchema, payout))
+
+    results = MatchResultsResponse(
         match_id=match.id,
         status=match.status,
         winner_player_id=winner_player_id,
         winner_character_id=match.winner_character_id,
         players=players,
     )
+    # Completed results only change when payouts are stored or settled,
+    # and both paths evict this entry
+    if match.status == "completed":
+        match_results_cache.set(match_id, results)
+    return results
 
 
 # --- Existing generic CRUD endpoints below ---
 
 
 @router.get("/", response_model=List[MatchSchema])
-def read_matches(
-    db: Session = Depends(get_db_dependency),
+async def read_matches(
+    response: Response,
+    db: AsyncSession = Depends(get_async_db_dependency),
     skip: int = 0,
     limit: int = 100,
+    after_id: Optional[int] = None,
 ):
-    return crud_match.get_multi(db, skip=skip, limit=limit)
+    items = await crud_match.aget_multi(db, skip=skip, limit=limit, after_id=after_id)
+    if after_id is not None:
+        set_next_cursor(response, items, limit)
+    return items
 
 
 @router.post("/", response_model=MatchSchema)
-def create_match(
+async def create_match(
     match_in: MatchCreate,
-    db: Session = Depends(get_db_dependency),
+    db: AsyncSession = Depends(get_async_db_dependency),
 ):
-    return crud_match.create(db, obj_in=match_in)
+    return await crud_match.acreate(db, obj_in=match_in)
 
 
 @router.get("/{match_id}", response_model=MatchSchema)
-def read_match(
+async def read_match(
     match_id: int,
-    db: Session = Depends(get_db_dependency),
+    db: AsyncSession = Depends(get_async_db_dependency),
 ):
-    match = crud_match.get(db, id=match_id)
-    if not match:
+    cached = entity_cache.get(("match", match_id))
+    if cached is not None:
+        return cached
+    match = await crud_match.aget(db, match_id)
+    if match is None:
         raise HTTPException(status_code=404, detail="Match not found")
-    return match
+    result = as_schema(MatchSchema, match)
+    entity_cache.set(("match", match_id), result)
+    return result
 
 
 @router.put("/{match_id}", response_model=MatchSchema)
-def update_match(
+async def update_match(
     match_id: int,
     match_in: MatchUpdate,
-    db: Session = Depends(get_db_dependency),
+    db: AsyncSession = Depends(get_async_db_dependency),
 ):
-    match = crud_match.get(db, id=match_id)
+    match = await crud_match.aupdate_by_id(db, id=match_id, obj_in=match_in)
     if not match:
         raise HTTPException(status_code=404, detail="Match not found")
-    return crud_match.update(db, db_obj=match, obj_in=match_in)
+    entity_cache.pop(("match", match_id))
+    return match
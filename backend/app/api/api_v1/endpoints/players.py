@@ -1,13 +1,19 @@
+from datetime import datetime
+from operator import itemgetter
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from pydantic import BaseModel
-from sqlalchemy import func
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from ...deps import set_next_cursor
+from ....core.cache import entity_cache, unsettled_payouts_cache
+from ....core.http_cache import http_cache
+from ....crud.base import as_schema
 from ....crud.pending_payout import crud_pending_payout
 from ....crud.player import crud_player
-from ....db.session import get_db_dependency
+from ....db.session import get_async_db_dependency
 from ....models.models import Character, Match, Player
 from ....schemas.pending_payout import PendingPayout as PendingPayoutSchema
 from ....schemas.player import Player as PlayerSchema, PlayerCreate, PlayerUpdate
@@ -32,15 +38,24 @@ class MatchHistoryEntry(BaseModel):
     status: str
     entry_fee: float
     character_count: int
-    created_at: str
+    created_at: datetime
 
 
 @router.get("/profile", response_model=PlayerProfile)
-def get_player_profile(
-    current_player: Player = Depends(get_current_player),
-    db: Session = Depends(get_db_dependency),
+@http_cache(max_age=5)
+async def get_player_profile(
+    current_player: PlayerSchema = Depends(get_current_player),
+    db: AsyncSession = Depends(get_async_db_dependency),
 ):
-    payouts = crud_pending_payout.get_unsettled_by_player(db, player_id=current_player.id)
+    # Player stats come from current_player's short-lived snapshot; the payout
+    # list is cached separately
+    payouts = unsettled_payouts_cache.get(current_player.id)
+    if payouts is None:
+        payouts = [
+            as_schema(PendingPayoutSchema, p)
+            for p in await crud_pending_payout.aget_unsettled_by_player(db, player_id=current_player.id)
+        ]
+        unsettled_payouts_cache.set(current_player.id, payouts)
     return PlayerProfile(
         id=current_player.id,
         wallet_address=current_player.wallet_address,
@@ -54,44 +69,72 @@ def get_player_profile(
 
 
 @router.get("/{address}/match-history", response_model=List[MatchHistoryEntry])
-def get_match_history(
+@http_cache(max_age=5)
+async def get_match_history(
     address: str,
+    response: Response,
     skip: int = 0,
     limit: int = 50,
-    db: Session = Depends(get_db_dependency),
+    after_match_id: Optional[int] = None,
+    db: AsyncSession = Depends(get_async_db_dependency),
 ):
-    player = crud_player.get_by_wallet_address(db, wallet_address=address)
-    if not player:
+    """Newest matches first. Pass the X-Next-Cursor header back as
+    ``after_match_id`` to seek to the next page instead of using ``skip``."""
+    # The player lookup also probes for any match entry, so players who never
+    # joined a match cost one indexed query and skip the aggregate entirely
+    found = (await db.execute(
+        select(
+            Player.id,
+            select(Character.id)
+            .where(Character.player_id == Player.id, Character.match_id.is_not(None))
+            .exists(),
+        ).where(Player.wallet_address == address)
+    )).first()
+    if found is None:
         raise HTTPException(status_code=404, detail="Player not found")
+    player_id, has_matches = found
+    if not has_matches:
+        return []
 
-    rows = (
-        db.query(
-            Character.match_id,
-            func.count(Character.id).label("char_count"),
-        )
-        .filter(Character.player_id == player.id, Character.match_id.isnot(None))
+    # Count and page over the player's own Character rows first, so the
+    # aggregate runs on (player_id, match_id) alone and only the page's
+    # matches are joined in. The count is per player, which is why it can't
+    # be a denormalized column on Match.
+    counts = (
+        select(Character.match_id, func.count(Character.id).label("char_count"))
+        .where(Character.player_id == player_id, Character.match_id.is_not(None))
         .group_by(Character.match_id)
-        .offset(skip)
+        .order_by(Character.match_id.desc())
         .limit(limit)
-        .all()
     )
+    if after_match_id is not None:
+        counts = counts.where(Character.match_id < after_match_id)
+    else:
+        counts = counts.offset(skip)
+    counts = counts.subquery()
+    rows = (await db.execute(
+        select(
+            Match.id,
+            Match.status,
+            Match.entry_fee,
+            Match.created_at,
+            counts.c.char_count,
+        )
+        .join(counts, counts.c.match_id == Match.id)
+        .order_by(Match.id.desc())
+    )).all()
 
-    if not rows:
-        return []
-
-    match_ids = [r[0] for r in rows]
-    char_counts = {r[0]: r[1] for r in rows}
-    matches = db.query(Match).filter(Match.id.in_(match_ids)).all()
+    set_next_cursor(response, rows, limit, cursor=itemgetter(0))
 
     return [
         MatchHistoryEntry(
-            match_id=m.id,
-            status=m.status,
-            entry_fee=m.entry_fee,
-            character_count=char_counts.get(m.id, 0),
-            created_at=m.created_at.isoformat(),
+            match_id=match_id,
+            status=status,
+            entry_fee=entry_fee,
+            character_count=char_count,
+            created_at=created_at,
         )
-        for m in matches
+        for match_id, status, entry_fee, created_at, char_count in rows
     ]
 
 
@@ -99,57 +142,80 @@ def get_match_history(
 
 
 @router.get("/", response_model=List[PlayerSchema])
-def read_players(
-    db: Session = Depends(get_db_dependency),
+@http_cache(max_age=5)
+async def read_players(
+    response: Response,
+    db: AsyncSession = Depends(get_async_db_dependency),
     skip: int = 0,
     limit: int = 100,
+    after_id: Optional[int] = None,
 ):
-    return crud_player.get_multi(db, skip=skip, limit=limit)
+    items = await crud_player.aget_multi_as(
+        db, PlayerSchema, skip=skip, limit=limit, after_id=after_id,
+    )
+    if after_id is not None:
+        set_next_cursor(response, items, limit)
+    return items
 
 
 @router.post("/", response_model=PlayerSchema)
-def create_player(
+async def create_player(
     player_in: PlayerCreate,
-    db: Session = Depends(get_db_dependency),
+    db: AsyncSession = Depends(get_async_db_dependency),
 ):
-    existing = crud_player.get_by_wallet_address(db, wallet_address=player_in.wallet_address)
-    if existing:
+    player = await crud_player.acreate_if_not_exists(db, obj_in=player_in)
+    if player is None:
         raise HTTPException(status_code=400, detail="Wallet address already registered")
-    return crud_player.create(db, obj_in=player_in)
+    return player
 
 
 @router.get("/{player_id}", response_model=PlayerSchema)
-def read_player(
+@http_cache(max_age=5)
+async def read_player(
     player_id: int,
-    db: Session = Depends(get_db_dependency),
+    db: AsyncSession = Depends(get_async_db_dependency),
 ):
-    player = crud_player.get(db, id=player_id)
-    if not player:
+    cached = entity_cache.get(("player", player_id))
+    if cached is not None:
+        return cached
+    player = await crud_player.aget(db, player_id)
+    if player is None:
         raise HTTPException(status_code=404, detail="Player not found")
-    return player
+    result = as_schema(PlayerSchema, player)
+    entity_cache.set(("player", player_id), result)
+    return result
 
 
 @router.put("/{player_id}", response_model=PlayerSchema)
-def update_player(
+async def update_player(
     player_id: int,
     player_in: PlayerUpdate,
-    current_player: Player = Depends(get_current_player),
-    db: Session = Depends(get_db_dependency),
+    current_player: PlayerSchema = Depends(get_current_player),
+    db: AsyncSession = Depends(get_async_db_dependency),
 ):
     if current_player.id != player_id:
         raise HTTPException(status_code=403, detail="Cannot update another player")
-    player = crud_player.get(db, id=player_id)
+    # current_player is this row, so its old username is already known
+    entity_cache.pop(("player_username", current_player.username))
+    player = await crud_player.aupdate_by_id(db, id=player_id, obj_in=player_in)
     if not player:
         raise HTTPException(status_code=404, detail="Player not found")
-    return crud_player.update(db, db_obj=player, obj_in=player_in)
+    entity_cache.pop(("player", player_id))
+    entity_cache.pop(("player_username", player.username))
+    return player
 
 
 @router.get("/by-username/{username}", response_model=PlayerSchema)
-def read_player_by_username(
+async def read_player_by_username(
     username: str,
-    db: Session = Depends(get_db_dependency),
+    db: AsyncSession = Depends(get_async_db_dependency),
 ):
-    player = crud_player.get_by_username(db, username=username)
+    cached = entity_cache.get(("player_username", username))
+    if cached is not None:
+        return cached
+    player = await crud_player.aget_by_username(db, username=username)
     if not player:
         raise HTTPException(status_code=404, detail="Player not found")
-    return player
+    result = as_schema(PlayerSchema, player)
+    entity_cache.set(("player_username", username), result)
+    return result
@@ -1,9 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
 
-from ....db.session import get_db_dependency
-from ....models.models import Player
+from ...deps import set_next_cursor
+from ....core.http_cache import http_cache
+from ....db.session import get_async_db_dependency
+from ....schemas.player import Player as PlayerSchema
 from ....schemas.transaction import Transaction, TransactionCreate, TransactionUpdate
 from ....crud.transaction import crud_transaction
 from ....services.auth.dependencies import get_current_player
@@ -12,64 +14,81 @@ router = APIRouter()
 
 
 @router.get("/", response_model=List[Transaction])
-def read_transactions(
-    db: Session = Depends(get_db_dependency),
+async def read_transactions(
+    db: AsyncSession = Depends(get_async_db_dependency),
     skip: int = 0,
     limit: int = 100,
 ):
-    return crud_transaction.get_multi(db, skip=skip, limit=limit)
+    return await crud_transaction.aget_multi_as(db, Transaction, skip=skip, limit=limit)
 
 
 @router.post("/", response_model=Transaction)
-def create_transaction(
+async def create_transaction(
     transaction_in: TransactionCreate,
-    db: Session = Depends(get_db_dependency),
+    db: AsyncSession = Depends(get_async_db_dependency),
 ):
-    return crud_transaction.create(db, obj_in=transaction_in)
+    return await crud_transaction.acreate(db, obj_in=transaction_in)
 
 
 @router.get("/{transaction_id}", response_model=Transaction)
-def read_transaction(
+@http_cache(max_age=5)
+async def read_transaction(
     transaction_id: int,
-    db: Session = Depends(get_db_dependency),
+    db: AsyncSession = Depends(get_async_db_dependency),
 ):
-    transaction = crud_transaction.get(db, id=transaction_id)
+    transaction = await crud_transaction.aget(db, transaction_id)
     if not transaction:
         raise HTTPException(status_code=404, detail="Transaction not found")
     return transaction
 
 
 @router.put("/{transaction_id}", response_model=Transaction)
-def update_transaction(
+async def update_transaction(
     transaction_id: int,
     transaction_in: TransactionUpdate,
-    db: Session = Depends(get_db_dependency),
+    db: AsyncSession = Depends(get_async_db_dependency),
 ):
-    transaction = crud_transaction.get(db, id=transaction_id)
+    transaction = await crud_transaction.aupdate_by_id(db, id=transaction_id, obj_in=transaction_in)
     if not transaction:
         raise HTTPException(status_code=404, detail="Transaction not found")
-    return crud_transaction.update(db, db_obj=transaction, obj_in=transaction_in)
+    return transaction
 
 
 @router.get("/player/me", response_model=List[Transaction])
-def read_my_transactions(
-    current_player: Player = Depends(get_current_player),
-    db: Session = Depends(get_db_dependency),
+async def read_my_transactions(
+    response: Response,
+    current_player: PlayerSchema = Depends(get_current_player),
+    db: AsyncSession = Depends(get_async_db_dependency),
     skip: int = 0,
     limit: int = 100,
+    after_id: Optional[int] = None,
 ):
-    return crud_transaction.get_by_player_id(
-        db, player_id=current_player.id, skip=skip, limit=limit,
-    )
+    return await _player_transactions_page(db, response, current_player.id, skip, limit, after_id)
 
 
 @router.get("/player/{player_id}", response_model=List[Transaction])
-def read_player_transactions(
+async def read_player_transactions(
     player_id: int,
-    db: Session = Depends(get_db_dependency),
+    response: Response,
+    db: AsyncSession = Depends(get_async_db_dependency),
     skip: int = 0,
     limit: int = 100,
+    after_id: Optional[int] = None,
 ):
-    return crud_transaction.get_by_player_id(
-        db, player_id=player_id, skip=skip, limit=limit,
+    return await _player_transactions_page(db, response, player_id, skip, limit, after_id)
+
+
+async def _player_transactions_page(
+    db: AsyncSession,
+    response: Response,
+    player_id: int,
+    skip: int,
+    limit: int,
+    after_id: Optional[int],
+) -> List[Transaction]:
+    items = await crud_transaction.aget_by_player_id_as(
+        db, Transaction, player_id=player_id, skip=skip, limit=limit, after_id=after_id,
     )
+    if after_id is not None:
+        set_next_cursor(response, items, limit)
+    return items
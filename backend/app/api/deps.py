@@ -0,0 +1,24 @@
+from operator import attrgetter
+from typing import Any, Callable, Sequence
+
+from fastapi import Response
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def set_next_cursor(
+    response: Response,
+    items: Sequence[Any],
+    limit: int,
+    *,
+    cursor: Callable[[Any], Any] = attrgetter("id"),
+) -> None:
+    """Hand back the last row's cursor when the page came back full.
+
+    Clients pass it back as the endpoint's keyset parameter to fetch the next
+    page; a short page means there is nothing after it. The generic list
+    endpoints only page by keyset when ``after_id`` is given (0 for the
+    first page), so they call this for those requests alone.
+    """
+    if items and len(items) == limit:
+        response.headers[NEXT_CURSOR_HEADER] = str(cursor(items[-1]))
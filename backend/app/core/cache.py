@@ -0,0 +1,91 @@
+"""
+In-process caches for hot read endpoints.
+
+Entries live in the API process's memory, so the app is expected to run as a
+single worker (see README). Writers that change cached data invalidate the
+affected keys explicitly; the TTL bounds staleness for anything they miss.
+"""
+
+import threading
+import time
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+_registry: List["TTLCache"] = []
+
+
+class TTLCache:
+    """Thread-safe mapping whose entries expire ``ttl`` seconds after being set."""
+
+    def __init__(self, ttl: float, maxsize: int = 1024) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+        _registry.append(self)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= now:
+                del self._data[key]
+                return None
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        now = time.monotonic()
+        with self._lock:
+            if key not in self._data and len(self._data) >= self.maxsize:
+                self._evict(now)
+            self._data[key] = (now + self.ttl, value)
+
+    def pop(self, key: Hashable) -> Optional[Any]:
+        """Remove ``key`` and return its value, or None if absent or expired."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.pop(key, None)
+        if entry is None or entry[0] <= now:
+            return None
+        return entry[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def _evict(self, now: float) -> None:
+        # Drop expired entries first; if still full, drop the oldest insert
+        for key in [k for k, (exp, _) in self._data.items() if exp <= now]:
+            del self._data[key]
+        if len(self._data) >= self.maxsize:
+            del self._data[next(iter(self._data))]
+
+
+def clear_all() -> None:
+    """Empty every cache created in this process (used by tests)."""
+    for cache in _registry:
+        cache.clear()
+
+
+# GET /matches/open pages, keyed by query parameters. Cleared whenever a lobby
+# is created or joined.
+open_matches_cache = TTLCache(ttl=3)
+
+# GET /matches/{id}/results for ended matches, keyed by match id. Dropped
+# when the match's payouts are calculated or settled.
+match_results_cache = TTLCache(ttl=24 * 60 * 60)
+
+# Single player/match/character reads, keyed by (resource, lookup value).
+# The PUT endpoints evict their own keys; other writers (lobby, match runner,
+# settlement) rely on the short TTL.
+entity_cache = TTLCache(ttl=5)
+
+# Unsettled payouts shown on GET /players/profile, keyed by player id.
+# crud_pending_payout evicts a player's entry on create and on settlement.
+unsettled_payouts_cache = TTLCache(ttl=30)
+
+# Decoded JWT payloads, keyed by a hash of the token (never the raw token).
+# Only valid tokens are stored, and each hit re-checks the token's own expiry.
+verified_tokens_cache = TTLCache(ttl=10, maxsize=10_000)
@@ -1,6 +1,6 @@
 from pydantic_settings import BaseSettings
-from pydantic import PostgresDsn, ConfigDict
-from typing import Optional, Any
+from pydantic import PostgresDsn, ConfigDict, model_validator
+from typing import Optional
 import os
 
 class Settings(BaseSettings):
@@ -14,6 +14,21 @@ class Settings(BaseSettings):
     POSTGRES_DB: str = os.getenv("POSTGRES_DB", "coin_clash")
     POSTGRES_PORT: str = os.getenv("POSTGRES_PORT", "5432")
     DATABASE_URL: Optional[PostgresDsn] = None
+
+    # Connection pool, shared by the sync and async engines. Size it to the
+    # expected concurrent requests; pre-ping replaces connections the server
+    # dropped, recycle retires them before server-side idle timeouts.
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "25"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "25"))
+    DB_POOL_TIMEOUT: int = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+    DB_POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+    # Compiled-SQL cache entries per engine (SQLAlchemy's default is 500)
+    DB_QUERY_CACHE_SIZE: int = int(os.getenv("DB_QUERY_CACHE_SIZE", "1200"))
+    # Server-side cap on any single statement, in ms (0 disables)
+    DB_STATEMENT_TIMEOUT_MS: int = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "5000"))
+    # Prepared statements kept per asyncpg connection (SQLAlchemy's default is 100)
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = int(os.getenv("DB_PREPARED_STATEMENT_CACHE_SIZE", "512"))
     
     # CORS settings
     BACKEND_CORS_ORIGINS: list[str] = ["*"]
@@ -22,13 +37,18 @@ class Settings(BaseSettings):
     SECRET_KEY: str = os.getenv("SECRET_KEY", "your-secret-key-for-jwt")
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+
+    # Make list queries raise on any relationship lazy load instead of
+    # issuing a query per row. Turn on in dev/test to catch N+1 regressions.
+    STRICT_LOADING: bool = os.getenv("STRICT_LOADING", "false").lower() == "true"
     
     model_config = ConfigDict(case_sensitive=True)
     
-    def __init__(self, **data: Any):
-        super().__init__(**data)
+    @model_validator(mode="after")
+    def _assemble_database_url(self) -> "Settings":
         # Construct DATABASE_URL if not provided
         if not self.DATABASE_URL:
             self.DATABASE_URL = f"postgresql://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_SERVER}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
+        return self
 
 settings = Settings()
@@ -0,0 +1,96 @@
+"""
+ETag / Cache-Control support for read endpoints.
+
+Endpoints opt in with ``@http_cache(max_age=...)`` (below the route
+decorator). For those, ETagMiddleware buffers the 200 response body, tags it
+with a content hash and answers a matching ``If-None-Match`` with a bodiless
+304, so clients polling unchanged resources skip the download and parse.
+"""
+
+import hashlib
+from typing import Callable, List, Optional, TypeVar
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+F = TypeVar("F", bound=Callable)
+
+_MAX_AGE_ATTR = "_http_cache_max_age"
+
+
+def http_cache(max_age: int) -> Callable[[F], F]:
+    """Mark an endpoint as cacheable by clients for ``max_age`` seconds."""
+    def decorator(endpoint: F) -> F:
+        setattr(endpoint, _MAX_AGE_ATTR, max_age)
+        return endpoint
+    return decorator
+
+
+def _max_age(scope: Scope) -> Optional[int]:
+    return getattr(scope.get("endpoint"), _MAX_AGE_ATTR, None)
+
+
+def _etag(body: bytes) -> str:
+    return '"' + hashlib.blake2s(body, digest_size=8).hexdigest() + '"'
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    # Weak comparison, as RFC 9110 requires for If-None-Match
+    candidates = [t.strip() for t in if_none_match.split(",")]
+    return "*" in candidates or any(
+        t.removeprefix("W/") == etag for t in candidates
+    )
+
+
+class ETagMiddleware:
+    """Pure ASGI so non-cacheable (including streaming) responses pass through untouched."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        start: Optional[Message] = None
+        passthrough = False
+        chunks: List[bytes] = []
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start, passthrough
+            if passthrough:
+                await send(message)
+                return
+            if message["type"] == "http.response.start":
+                # Routing has filled in scope["endpoint"] by the time the response starts
+                if _max_age(scope) is None or message["status"] != 200:
+                    passthrough = True
+                    await send(message)
+                else:
+                    start = message
+                return
+
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                await self._send_buffered(scope, send, start, b"".join(chunks))
+
+        await self.app(scope, receive, send_wrapper)
+
+    @staticmethod
+    async def _send_buffered(scope: Scope, send: Send, start: Message, body: bytes) -> None:
+        etag = _etag(body)
+        cache_headers = [
+            (b"etag", etag.encode("latin-1")),
+            (b"cache-control", f"private, max-age={_max_age(scope)}".encode("latin-1")),
+        ]
+        if_none_match = next(
+            (v.decode("latin-1") for k, v in scope["headers"] if k == b"if-none-match"),
+            None,
+        )
+        if if_none_match is not None and _etag_matches(if_none_match, etag):
+            await send({"type": "http.response.start", "status": 304, "headers": cache_headers})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        await send({**start, "headers": list(start.get("headers", [])) + cache_headers})
+        await send({"type": "http.response.body", "body": body})
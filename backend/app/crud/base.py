@@ -1,48 +1,198 @@
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
-from fastapi.encoders import jsonable_encoder
+from typing import Any, Dict, Generic, List, Optional, Sequence, Type, TypeVar, Union
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
+from sqlalchemy import ColumnElement, Select, insert, inspect, lambda_stmt, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, raiseload
+from sqlalchemy.orm.interfaces import LoaderOption
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
+from ..core.config import settings
 from ..db.base_class import Base
 
 ModelType = TypeVar("ModelType", bound=Base)
 CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
 UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
+SchemaType = TypeVar("SchemaType", bound=BaseModel)
+
+
+def list_load_options(*options: LoaderOption) -> Sequence[LoaderOption]:
+    """Loader options for a list query, plus raiseload("*") under STRICT_LOADING."""
+    if settings.STRICT_LOADING:
+        return (*options, raiseload("*"))
+    return options
+
+
+def as_schema(schema: Type[SchemaType], obj: Any) -> SchemaType:
+    """Build a read schema from a loaded ORM row without re-validating it.
+
+    Only for schemas without validators: the column values already have the
+    schema's types, so ``model_construct`` just copies them across.
+    """
+    return schema.model_construct(**{name: getattr(obj, name) for name in schema.model_fields})
+
 
 class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     def __init__(self, model: Type[ModelType]):
         self.model = model
+        self._columns = frozenset(attr.key for attr in inspect(model).column_attrs)
 
     def get(self, db: Session, id: Any) -> Optional[ModelType]:
-        return db.query(self.model).filter(self.model.id == id).first()
+        return db.scalars(self._by_id_stmt(id)).first()
+
+    def _by_id_stmt(self, id: Any) -> StatementLambdaElement:
+        # Built once per model and reused with only the id rebound, so later
+        # calls skip building the statement and its SQLAlchemy cache key.
+        # Sync get only: aget uses Session.get, which checks the identity map
+        # first and has its own cached load path
+        model = self.model
+        return lambda_stmt(lambda: select(model).where(model.id == id))
+
+    def get_multi(
+        self,
+        db: Session,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        after_id: Optional[int] = None,
+        options: Sequence[LoaderOption] = (),
+    ) -> List[ModelType]:
+        return list(db.scalars(self._multi_stmt(skip, limit, after_id, options)))
+
+    def _multi_stmt(
+        self, skip: int, limit: int, after_id: Optional[int], options: Sequence[LoaderOption],
+    ) -> Select:
+        # Callers pass selectinload/joinedload for any relationship the
+        # response schema reads, so serializing a page doesn't lazy-load per row
+        stmt = select(self.model)
+        options = list_load_options(*options)
+        if options:
+            stmt = stmt.options(*options)
+        return self._page(stmt, skip, limit, after_id)
 
-    def get_multi(self, db: Session, *, skip: int = 0, limit: int = 100) -> List[ModelType]:
-        return db.query(self.model).offset(skip).limit(limit).all()
+    def _page(self, stmt: Select, skip: int, limit: Optional[int], after_id: Optional[int]) -> Select:
+        # Always ordered by id: without ORDER BY, OFFSET pages are not stable
+        stmt = stmt.order_by(self.model.id)
+        if after_id is not None:
+            # Keyset page: seeks on the primary key instead of scanning and
+            # discarding `skip` rows
+            return stmt.where(self.model.id > after_id).limit(limit)
+        return stmt.offset(skip).limit(limit)
 
     def create(self, db: Session, *, obj_in: CreateSchemaType) -> ModelType:
-        obj_in_data = jsonable_encoder(obj_in)
-        db_obj = self.model(**obj_in_data)
+        # model_dump keeps native types (Decimal, datetime) for the column types
+        db_obj = self.model(**obj_in.model_dump())
         db.add(db_obj)
+        # Server defaults come back via INSERT ... RETURNING and sessions
+        # don't expire on commit, so no refresh SELECT is needed
         db.commit()
-        db.refresh(db_obj)
         return db_obj
 
+    def bulk_create(self, db: Session, *, objs_in: Sequence[CreateSchemaType]) -> List[ModelType]:
+        """Insert all rows in one batched INSERT ... RETURNING and commit once.
+
+        Returned objects are in ``objs_in`` order; without
+        sort_by_parameter_order the batched RETURNING rows may come back in
+        any order.
+        """
+        if not objs_in:
+            return []
+        rows = [obj_in.model_dump() for obj_in in objs_in]
+        db_objs = list(db.scalars(
+            insert(self.model).returning(self.model, sort_by_parameter_order=True), rows,
+        ))
+        db.commit()
+        return db_objs
+
     def update(self, db: Session, *, db_obj: ModelType, obj_in: Union[UpdateSchemaType, Dict[str, Any]]) -> ModelType:
-        obj_data = jsonable_encoder(db_obj)
+        for field, value in self._update_data(obj_in).items():
+            setattr(db_obj, field, value)
+        db.commit()
+        return db_obj
+
+    def _update_stmt(self, id: Any, update_data: Dict[str, Any]):
+        return (
+            update(self.model)
+            .where(self.model.id == id)
+            .values(**update_data)
+            .returning(self.model)
+        )
+
+    def update_by_id(
+        self, db: Session, *, id: Any, obj_in: Union[UpdateSchemaType, Dict[str, Any]]
+    ) -> Optional[ModelType]:
+        """UPDATE ... WHERE id = :id RETURNING *, without loading the row first.
+
+        Returns None when no row has that id.
+        """
+        update_data = self._update_data(obj_in)
+        if not update_data:
+            return self.get(db, id)
+        db_obj = db.scalars(self._update_stmt(id, update_data)).one_or_none()
+        db.commit()
+        return db_obj
+
+    def _update_data(self, obj_in: Union[UpdateSchemaType, Dict[str, Any]]) -> Dict[str, Any]:
         if isinstance(obj_in, dict):
             update_data = obj_in
         else:
             update_data = obj_in.model_dump(exclude_unset=True)
-        for field in obj_data:
-            if field in update_data:
-                setattr(db_obj, field, update_data[field])
-        db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
-        return db_obj
+        return {k: v for k, v in update_data.items() if k in self._columns}
 
     def remove(self, db: Session, *, id: int) -> ModelType:
-        obj = db.query(self.model).get(id)
+        obj = db.get(self.model, id)
         db.delete(obj)
         db.commit()
         return obj
+
+    # Async counterparts for endpoints running on an AsyncSession
+
+    async def aget(self, db: AsyncSession, id: Any) -> Optional[ModelType]:
+        return await db.get(self.model, id)
+
+    async def aget_multi(
+        self,
+        db: AsyncSession,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        after_id: Optional[int] = None,
+        options: Sequence[LoaderOption] = (),
+    ) -> List[ModelType]:
+        return list(await db.scalars(self._multi_stmt(skip, limit, after_id, options)))
+
+    async def aget_multi_as(
+        self,
+        db: AsyncSession,
+        schema: Type[SchemaType],
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        after_id: Optional[int] = None,
+        where: Sequence[ColumnElement[bool]] = (),
+    ) -> List[SchemaType]:
+        """Page of rows built straight into ``schema`` for read-only lists.
+
+        Selects only the schema's columns and skips ORM hydration (identity
+        map, instrumentation). Column values already have the schema's types,
+        so ``model_construct`` skips validation as well.
+        """
+        table = self.model.__table__
+        stmt = select(*(table.c[name] for name in schema.model_fields)).where(*where)
+        rows = await db.execute(self._page(stmt, skip, limit, after_id))
+        return [schema.model_construct(**row._mapping) for row in rows]
+
+    async def acreate(self, db: AsyncSession, *, obj_in: CreateSchemaType) -> ModelType:
+        db_obj = self.model(**obj_in.model_dump())
+        db.add(db_obj)
+        await db.commit()
+        return db_obj
+
+    async def aupdate_by_id(
+        self, db: AsyncSession, *, id: Any, obj_in: Union[UpdateSchemaType, Dict[str, Any]]
+    ) -> Optional[ModelType]:
+        update_data = self._update_data(obj_in)
+        if not update_data:
+            return await self.aget(db, id)
+        db_obj = (await db.scalars(self._update_stmt(id, update_data))).one_or_none()
+        await db.commit()
+        return db_obj
@@ -1,5 +1,6 @@
 from typing import List, Optional
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, selectinload
 
 from .base import CRUDBase
 from ..models.models import Character
@@ -8,35 +9,72 @@ from ..schemas.character import CharacterCreate, CharacterUpdate
 class CRUDCharacter(CRUDBase[Character, CharacterCreate, CharacterUpdate]):
     """CRUD operations for Character model"""
 
-    def get_by_player_id(self, db: Session, player_id: int) -> List[Character]:
-        return db.query(Character).filter(Character.player_id == player_id).all()
+    def get_by_player_id(
+        self,
+        db: Session,
+        player_id: int,
+        *,
+        skip: int = 0,
+        limit: Optional[int],
+        load_owner: bool = False,
+    ) -> List[Character]:
+        return (
+            self._query(db, load_owner)
+            .filter(Character.player_id == player_id)
+            .order_by(Character.id)
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
 
-    def get_by_match_id(self, db: Session, match_id: int) -> List[Character]:
-        return db.query(Character).filter(Character.match_id == match_id).all()
+    def get_by_match_id(
+        self,
+        db: Session,
+        match_id: int,
+        *,
+        skip: int = 0,
+        limit: Optional[int],
+        load_owner: bool = False,
+    ) -> List[Character]:
+        return (
+            self._query(db, load_owner)
+            .filter(Character.match_id == match_id)
+            .order_by(Character.id)
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
+
+    def _query(self, db: Session, load_owner: bool):
+        q = db.query(Character)
+        if load_owner:
+            # display_name reads player_owner; one IN query for all owners
+            # instead of a lazy load per character
+            q = q.options(selectinload(Character.player_owner))
+        return q
+
+    def count_by_match(self, db: Session, match_id: int, *, player_id: Optional[int] = None) -> int:
+        stmt = select(func.count(Character.id)).where(Character.match_id == match_id)
+        if player_id is not None:
+            stmt = stmt.where(Character.player_id == player_id)
+        return db.scalar(stmt) or 0
+
+    def count_players_by_match(self, db: Session, match_id: int) -> int:
+        return db.scalar(
+            select(func.count(func.distinct(Character.player_id)))
+            .where(Character.match_id == match_id)
+        ) or 0
 
     def create_character(self, db: Session, *, name: str, player_id: int) -> Character:
         character = Character(name=name, player_id=player_id)
         db.add(character)
         db.commit()
-        db.refresh(character)
         return character
 
     def assign_to_match(self, db: Session, *, character_id: int, match_id: int) -> Optional[Character]:
-        character = self.get(db, character_id)
-        if character:
-            character.match_id = match_id
-            db.add(character)
-            db.commit()
-            db.refresh(character)
-        return character
+        return self.update_by_id(db, id=character_id, obj_in={"match_id": match_id})
 
     def set_alive_status(self, db: Session, *, character_id: int, is_alive: bool) -> Optional[Character]:
-        character = self.get(db, character_id)
-        if character:
-            character.is_alive = is_alive
-            db.add(character)
-            db.commit()
-            db.refresh(character)
-        return character
+        return self.update_by_id(db, id=character_id, obj_in={"is_alive": is_alive})
 
 crud_character = CRUDCharacter(Character)
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 from sqlalchemy.orm import Session
 
 from .base import CRUDBase
@@ -8,9 +8,18 @@ from ..schemas.match import MatchCreate, MatchUpdate
 class CRUDMatch(CRUDBase[Match, MatchCreate, MatchUpdate]):
     """CRUD operations for Match model"""
     
-    def get_by_status(self, db: Session, status: str) -> List[Match]:
+    def get_by_status(
+        self, db: Session, status: str, *, skip: int = 0, limit: Optional[int]
+    ) -> List[Match]:
         """Get matches by status"""
-        return db.query(Match).filter(Match.status == status).all()
+        return (
+            db.query(Match)
+            .filter(Match.status == status)
+            .order_by(Match.id)
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
     
     def create_match(self, db: Session, *, entry_fee: float, kill_award_rate: float, start_method: str, start_threshold: int) -> Match:
         """Create a new match"""
@@ -23,27 +32,16 @@ class CRUDMatch(CRUDBase[Match, MatchCreate, MatchUpdate]):
         )
         db.add(match)
         db.commit()
-        db.refresh(match)
         return match
     
-    def update_status(self, db: Session, *, match_id: int, status: str) -> Match:
+    def update_status(self, db: Session, *, match_id: int, status: str) -> Optional[Match]:
         """Update a match's status"""
-        match = self.get(db, match_id)
-        if match:
-            match.status = status
-            db.add(match)
-            db.commit()
-            db.refresh(match)
-        return match
+        return self.update_by_id(db, id=match_id, obj_in={"status": status})
     
-    def set_winner(self, db: Session, *, match_id: int, winner_character_id: int) -> Match:
+    def set_winner(self, db: Session, *, match_id: int, winner_character_id: int) -> Optional[Match]:
         """Set a match's winner"""
-        match = self.get(db, match_id)
-        if match:
-            match.winner_character_id = winner_character_id
-            db.add(match)
-            db.commit()
-            db.refresh(match)
-        return match
+        return self.update_by_id(
+            db, id=match_id, obj_in={"winner_character_id": winner_character_id}
+        )
 
 crud_match = CRUDMatch(Match)
@@ -1,7 +1,8 @@
-from typing import List
+from typing import Dict, List
+from sqlalchemy import Subquery, and_, func, select
 from sqlalchemy.orm import Session
 
-from ..models.models import MatchEvent
+from ..models.models import Character, MatchEvent, MatchEventCharacter
 
 
 class CRUDMatchEvent:
@@ -20,5 +21,50 @@ class CRUDMatchEvent:
             q = q.filter(MatchEvent.id > after_event_id)
         return q.order_by(MatchEvent.id).offset(skip).limit(limit).all()
 
+    def kills_by_player_subquery(self, match_id: int) -> Subquery:
+        """(player_id, kills) for every player with a character in the match.
+
+        Players without kills get 0. The killer is the character at
+        position 0 of a direct_kill event.
+        """
+        return (
+            select(Character.player_id, func.count(MatchEvent.id).label("kills"))
+            .outerjoin(
+                MatchEventCharacter,
+                and_(
+                    MatchEventCharacter.character_id == Character.id,
+                    MatchEventCharacter.position == 0,
+                ),
+            )
+            .outerjoin(
+                MatchEvent,
+                and_(
+                    MatchEvent.id == MatchEventCharacter.event_id,
+                    MatchEvent.match_id == match_id,
+                    MatchEvent.event_type == "direct_kill",
+                ),
+            )
+            .where(Character.match_id == match_id)
+            .group_by(Character.player_id)
+            .subquery()
+        )
+
+    def get_killer_ids(self, db: Session, match_id: int) -> List[int]:
+        """Killer character id of every direct_kill event in a match."""
+        return list(db.scalars(
+            select(MatchEventCharacter.character_id)
+            .join(MatchEvent, MatchEvent.id == MatchEventCharacter.event_id)
+            .where(
+                MatchEvent.match_id == match_id,
+                MatchEvent.event_type == "direct_kill",
+                MatchEventCharacter.position == 0,
+            )
+        ))
+
+    def count_kills_by_player(self, db: Session, match_id: int) -> Dict[int, int]:
+        """Direct kills per player in a match, keyed by player_id (see above)."""
+        kills = self.kills_by_player_subquery(match_id)
+        return dict(db.execute(select(kills.c.player_id, kills.c.kills)).all())
+
 
 crud_match_event = CRUDMatchEvent()
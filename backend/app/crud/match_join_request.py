@@ -1,4 +1,5 @@
 from typing import List, Optional
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from .base import CRUDBase
@@ -8,10 +9,15 @@ from ..schemas.match_join_request import MatchJoinRequestCreate, MatchJoinReques
 
 class CRUDMatchJoinRequest(CRUDBase[MatchJoinRequest, MatchJoinRequestCreate, MatchJoinRequestUpdate]):
 
-    def get_by_match_id(self, db: Session, match_id: int) -> List[MatchJoinRequest]:
+    def get_by_match_id(
+        self, db: Session, match_id: int, *, skip: int = 0, limit: Optional[int]
+    ) -> List[MatchJoinRequest]:
         return (
             db.query(MatchJoinRequest)
             .filter(MatchJoinRequest.match_id == match_id)
+            .order_by(MatchJoinRequest.id)
+            .offset(skip)
+            .limit(limit)
             .all()
         )
 
@@ -56,27 +62,24 @@ class CRUDMatchJoinRequest(CRUDBase[MatchJoinRequest, MatchJoinRequestCreate, Ma
         db.add(join_request)
         db.flush()  # get id before creating junction rows
 
-        for oc_id in owned_character_ids:
-            db.add(MatchJoinRequestCharacter(
-                join_request_id=join_request.id,
-                owned_character_id=oc_id,
-            ))
-
-        db.flush()
+        # One executemany INSERT instead of a unit-of-work INSERT per row
+        if owned_character_ids:
+            db.execute(
+                insert(MatchJoinRequestCharacter),
+                [
+                    {"join_request_id": join_request.id, "owned_character_id": oc_id}
+                    for oc_id in owned_character_ids
+                ],
+            )
         return join_request
 
     def update_payment_status(
         self, db: Session, *, request_id: int, status: str, confirmed_at=None
     ) -> Optional[MatchJoinRequest]:
-        obj = self.get(db, request_id)
-        if obj:
-            obj.payment_status = status
-            if confirmed_at:
-                obj.confirmed_at = confirmed_at
-            db.add(obj)
-            db.commit()
-            db.refresh(obj)
-        return obj
+        values = {"payment_status": status}
+        if confirmed_at:
+            values["confirmed_at"] = confirmed_at
+        return self.update_by_id(db, id=request_id, obj_in=values)
 
 
 crud_match_join_request = CRUDMatchJoinRequest(MatchJoinRequest)
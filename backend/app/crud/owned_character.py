@@ -1,4 +1,5 @@
 from typing import List, Optional
+from sqlalchemy import insert, select
 from sqlalchemy.orm import Session
 
 from .base import CRUDBase
@@ -8,6 +9,20 @@ from ..schemas.owned_character import OwnedCharacterCreate, OwnedCharacterUpdate
 
 class CRUDOwnedCharacter(CRUDBase[OwnedCharacter, OwnedCharacterCreate, OwnedCharacterUpdate]):
 
+    def create_many(
+        self, db: Session, *, player_id: int, character_names: List[str]
+    ) -> List[OwnedCharacter]:
+        """Insert all characters in one INSERT ... RETURNING instead of one per row."""
+        ids = list(db.scalars(
+            insert(OwnedCharacter).returning(OwnedCharacter.id),
+            [{"player_id": player_id, "character_name": name} for name in character_names],
+        ))
+        db.commit()
+        # One SELECT for the committed rows rather than one refresh per object
+        return list(db.scalars(
+            select(OwnedCharacter).where(OwnedCharacter.id.in_(ids)).order_by(OwnedCharacter.id)
+        ))
+
     def get_by_player_id(
         self, db: Session, player_id: int, *, alive_only: bool = False
     ) -> List[OwnedCharacter]:
@@ -29,24 +44,13 @@ class CRUDOwnedCharacter(CRUDBase[OwnedCharacter, OwnedCharacterCreate, OwnedCha
         )
 
     def set_alive(self, db: Session, *, character_id: int, is_alive: bool) -> Optional[OwnedCharacter]:
-        obj = self.get(db, character_id)
-        if obj:
-            obj.is_alive = is_alive
-            if is_alive:
-                obj.revival_count += 1
-            db.add(obj)
-            db.commit()
-            db.refresh(obj)
-        return obj
+        values = {"is_alive": is_alive}
+        if is_alive:
+            values["revival_count"] = OwnedCharacter.revival_count + 1
+        return self.update_by_id(db, id=character_id, obj_in=values)
 
     def set_last_match(self, db: Session, *, character_id: int, match_id: int) -> Optional[OwnedCharacter]:
-        obj = self.get(db, character_id)
-        if obj:
-            obj.last_match_id = match_id
-            db.add(obj)
-            db.commit()
-            db.refresh(obj)
-        return obj
+        return self.update_by_id(db, id=character_id, obj_in={"last_match_id": match_id})
 
 
 crud_owned_character = CRUDOwnedCharacter(OwnedCharacter)
@@ -1,25 +1,49 @@
 from typing import List, Optional
 from datetime import datetime, timezone
-from sqlalchemy.orm import Session
+from sqlalchemy import lambda_stmt, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, raiseload
 
 from .base import CRUDBase
+from ..core.cache import unsettled_payouts_cache
 from ..models.models import PendingPayout
 from ..schemas.pending_payout import PendingPayoutCreate, PendingPayoutUpdate
 
 
 class CRUDPendingPayout(CRUDBase[PendingPayout, PendingPayoutCreate, PendingPayoutUpdate]):
 
-    def get_by_match_id(self, db: Session, match_id: int) -> List[PendingPayout]:
+    def create(self, db: Session, *, obj_in: PendingPayoutCreate) -> PendingPayout:
+        payout = super().create(db, obj_in=obj_in)
+        unsettled_payouts_cache.pop(payout.player_id)
+        return payout
+
+    def bulk_create(self, db: Session, *, objs_in: List[PendingPayoutCreate]) -> List[PendingPayout]:
+        payouts = super().bulk_create(db, objs_in=objs_in)
+        for player_id in {p.player_id for p in payouts}:
+            unsettled_payouts_cache.pop(player_id)
+        return payouts
+
+    def get_by_match_id(
+        self, db: Session, match_id: int, *, skip: int = 0, limit: Optional[int]
+    ) -> List[PendingPayout]:
         return (
             db.query(PendingPayout)
             .filter(PendingPayout.match_id == match_id)
+            .order_by(PendingPayout.id)
+            .offset(skip)
+            .limit(limit)
             .all()
         )
 
-    def get_by_player_id(self, db: Session, player_id: int) -> List[PendingPayout]:
+    def get_by_player_id(
+        self, db: Session, player_id: int, *, skip: int = 0, limit: Optional[int]
+    ) -> List[PendingPayout]:
         return (
             db.query(PendingPayout)
             .filter(PendingPayout.player_id == player_id)
+            .order_by(PendingPayout.id)
+            .offset(skip)
+            .limit(limit)
             .all()
         )
 
@@ -32,26 +56,35 @@ class CRUDPendingPayout(CRUDBase[PendingPayout, PendingPayoutCreate, PendingPayo
             .all()
         )
 
-    def get_unsettled_by_player(self, db: Session, player_id: int) -> List[PendingPayout]:
-        return (
-            db.query(PendingPayout)
-            .filter(
+    def _unsettled_by_player_stmt(self, player_id: int):
+        # PendingPayout schemas only read columns. raiseload makes a schema
+        # that starts touching match/player fail loudly instead of N+1 lazy
+        # loading (which an AsyncSession can't do at all)
+        return lambda_stmt(
+            lambda: select(PendingPayout)
+            .where(
                 PendingPayout.player_id == player_id,
                 PendingPayout.settled_at.is_(None),
             )
-            .all()
+            .options(raiseload("*"))
         )
 
+    def get_unsettled_by_player(self, db: Session, player_id: int) -> List[PendingPayout]:
+        return list(db.scalars(self._unsettled_by_player_stmt(player_id)))
+
+    async def aget_unsettled_by_player(self, db: AsyncSession, player_id: int) -> List[PendingPayout]:
+        return list(await db.scalars(self._unsettled_by_player_stmt(player_id)))
+
     def mark_settled(
         self, db: Session, *, payout_id: int, tx_hash: str
     ) -> Optional[PendingPayout]:
-        obj = self.get(db, payout_id)
-        if obj:
-            obj.settled_at = datetime.now(timezone.utc)
-            obj.settlement_tx_hash = tx_hash
-            db.add(obj)
-            db.commit()
-            db.refresh(obj)
+        obj = db.scalars(self._update_stmt(payout_id, {
+            "settled_at": datetime.now(timezone.utc),
+            "settlement_tx_hash": tx_hash,
+        })).one_or_none()
+        db.commit()
+        if obj is not None:
+            unsettled_payouts_cache.pop(obj.player_id)
         return obj
 
 
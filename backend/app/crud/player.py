@@ -1,52 +1,108 @@
-from typing import Optional
+from typing import Optional, Union
+from sqlalchemy import lambda_stmt, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
 from .base import CRUDBase
+from ..core.cache import entity_cache
 from ..models.models import Player
 from ..schemas.player import PlayerCreate, PlayerUpdate
 
+def _by_username_stmt(username: str) -> StatementLambdaElement:
+    return lambda_stmt(lambda: select(Player).where(Player.username == username).limit(1))
+
+
+def _by_wallet_address_stmt(wallet_address: str) -> StatementLambdaElement:
+    return lambda_stmt(lambda: select(Player).where(Player.wallet_address == wallet_address))
+
+
 class CRUDPlayer(CRUDBase[Player, PlayerCreate, PlayerUpdate]):
     """CRUD operations for Player model"""
 
+    # Hot lookups use lambda_stmt: the statement and its cache key are built
+    # once per call site, and later calls only swap in the bound value
+
     def get_by_username(self, db: Session, username: str) -> Optional[Player]:
-        return db.query(Player).filter(Player.username == username).first()
+        return db.scalars(_by_username_stmt(username)).first()
+
+    async def aget_by_username(self, db: AsyncSession, username: str) -> Optional[Player]:
+        return await db.scalar(_by_username_stmt(username))
 
     def get_by_wallet_address(self, db: Session, wallet_address: str) -> Optional[Player]:
-        return db.query(Player).filter(Player.wallet_address == wallet_address).first()
+        return db.scalars(_by_wallet_address_stmt(wallet_address)).first()
+
+    async def aget_by_wallet_address(self, db: AsyncSession, wallet_address: str) -> Optional[Player]:
+        return await db.scalar(_by_wallet_address_stmt(wallet_address))
 
     def create(self, db: Session, *, obj_in: PlayerCreate) -> Player:
-        username = obj_in.username or f"Player_{obj_in.wallet_address[:6]}"
-        db_obj = Player(wallet_address=obj_in.wallet_address, username=username)
+        db_obj = Player(**obj_in.model_dump())
         db.add(db_obj)
         db.commit()
-        db.refresh(db_obj)
         return db_obj
 
-    def update_player_balance(self, db: Session, player_id: int, amount: float) -> Optional[Player]:
-        player = self.get(db, player_id)
-        if player:
-            player.balance += amount
-            db.add(player)
-            db.commit()
-            db.refresh(player)
+    def create_if_not_exists(self, db: Session, *, obj_in: PlayerCreate) -> Optional[Player]:
+        """Insert a player unless the wallet is already registered.
+
+        Returns None on conflict. A single INSERT ... ON CONFLICT DO NOTHING
+        RETURNING, so there is no window between checking and inserting.
+        """
+        player = db.scalars(self._insert_if_absent_stmt(db, obj_in)).first()
+        db.commit()
         return player
 
-    def add_win(self, db: Session, player_id: int) -> Optional[Player]:
-        player = self.get(db, player_id)
-        if player:
-            player.wins += 1
-            db.add(player)
-            db.commit()
-            db.refresh(player)
+    async def acreate_if_not_exists(self, db: AsyncSession, *, obj_in: PlayerCreate) -> Optional[Player]:
+        player = (await db.scalars(self._insert_if_absent_stmt(db, obj_in))).first()
+        await db.commit()
         return player
 
+    async def aget_or_create(self, db: AsyncSession, *, obj_in: PlayerCreate) -> Player:
+        """Return the player for obj_in's wallet, inserting it if needed.
+
+        One INSERT ... ON CONFLICT DO UPDATE ... RETURNING: the no-op update
+        makes the existing row come back too, so there is a single round-trip
+        and no race between two first logins for the same wallet.
+        """
+        insert = self._insert_stmt(db, obj_in)
+        player = (await db.scalars(
+            insert.on_conflict_do_update(
+                index_elements=["wallet_address"],
+                set_={"wallet_address": insert.excluded.wallet_address},
+            ).returning(Player)
+        )).one()
+        await db.commit()
+        return player
+
+    def _insert_if_absent_stmt(self, db: Union[Session, AsyncSession], obj_in: PlayerCreate):
+        return (
+            self._insert_stmt(db, obj_in)
+            .on_conflict_do_nothing(index_elements=["wallet_address"])
+            .returning(Player)
+        )
+
+    def _insert_stmt(self, db: Union[Session, AsyncSession], obj_in: PlayerCreate):
+        insert = pg_insert if db.get_bind().dialect.name == "postgresql" else sqlite_insert
+        return insert(Player).values(**obj_in.model_dump())
+
+    def update_player_balance(self, db: Session, player_id: int, amount: float) -> Optional[Player]:
+        return self._increment(db, player_id, balance=Player.balance + amount)
+
+    def add_win(self, db: Session, player_id: int) -> Optional[Player]:
+        return self._increment(db, player_id, wins=Player.wins + 1)
+
     def add_kill(self, db: Session, player_id: int) -> Optional[Player]:
-        player = self.get(db, player_id)
-        if player:
-            player.kills += 1
-            db.add(player)
-            db.commit()
-            db.refresh(player)
+        return self._increment(db, player_id, kills=Player.kills + 1)
+
+    def _increment(self, db: Session, player_id: int, **values) -> Optional[Player]:
+        # SQL-side arithmetic in one UPDATE ... RETURNING: no read-modify-write
+        # race and no separate SELECT/refresh round-trips
+        stmt = update(Player).where(Player.id == player_id).values(**values).returning(Player)
+        player = db.scalars(stmt).one_or_none()
+        db.commit()
+        # The profile and /players/{id} serve this row's cached snapshot
+        entity_cache.pop(("player", player_id))
         return player
 
 crud_player = CRUDPlayer(Player)
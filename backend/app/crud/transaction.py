@@ -1,33 +1,65 @@
-from typing import List, Optional
+from typing import List, Optional, Type
+from sqlalchemy import lambda_stmt, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from .base import CRUDBase
+from .base import CRUDBase, SchemaType
 from ..models.models import Transaction
 from ..schemas.transaction import TransactionCreate, TransactionUpdate
 
 class CRUDTransaction(CRUDBase[Transaction, TransactionCreate, TransactionUpdate]):
     """CRUD operations for Transaction model"""
     
-    def get_by_player_id(self, db: Session, player_id: int, skip: int = 0, limit: int = 100) -> List[Transaction]:
-        """Get transactions by player ID"""
-        return db.query(Transaction).filter(Transaction.player_id == player_id).offset(skip).limit(limit).all()
+    def get_by_player_id(
+        self,
+        db: Session,
+        player_id: int,
+        *,
+        skip: int = 0,
+        limit: Optional[int],
+        after_id: Optional[int] = None,
+    ) -> List[Transaction]:
+        """Get transactions by player ID, keyset-paged when after_id is given"""
+        stmt = select(Transaction).where(Transaction.player_id == player_id)
+        return list(db.scalars(self._page(stmt, skip, limit, after_id)))
     
-    def get_by_status(self, db: Session, status: str) -> List[Transaction]:
-        """Get transactions by status"""
-        return db.query(Transaction).filter(Transaction.status == status).all()
+    async def aget_by_player_id_as(
+        self,
+        db: AsyncSession,
+        schema: Type[SchemaType],
+        player_id: int,
+        *,
+        skip: int = 0,
+        limit: int,
+        after_id: Optional[int] = None,
+    ) -> List[SchemaType]:
+        """Get transactions by player ID as ``schema`` rows, without ORM objects"""
+        return await self.aget_multi_as(
+            db, schema, skip=skip, limit=limit, after_id=after_id,
+            where=(Transaction.player_id == player_id,),
+        )
+    
+    def get_by_status(
+        self,
+        db: Session,
+        status: str,
+        *,
+        skip: int = 0,
+        limit: Optional[int],
+        after_id: Optional[int] = None,
+    ) -> List[Transaction]:
+        """Get transactions by status, keyset-paged when after_id is given"""
+        stmt = select(Transaction).where(Transaction.status == status)
+        return list(db.scalars(self._page(stmt, skip, limit, after_id)))
     
     def get_by_provider_tx_id(self, db: Session, provider_tx_id: str) -> Optional[Transaction]:
         """Get transaction by provider transaction ID"""
-        return db.query(Transaction).filter(Transaction.provider_tx_id == provider_tx_id).first()
+        return db.scalars(lambda_stmt(
+            lambda: select(Transaction).where(Transaction.provider_tx_id == provider_tx_id).limit(1)
+        )).first()
     
-    def update_status(self, db: Session, *, transaction_id: int, status: str) -> Transaction:
+    def update_status(self, db: Session, *, transaction_id: int, status: str) -> Optional[Transaction]:
         """Update a transaction's status"""
-        transaction = self.get(db, transaction_id)
-        if transaction:
-            transaction.status = status
-            db.add(transaction)
-            db.commit()
-            db.refresh(transaction)
-        return transaction
+        return self.update_by_id(db, id=transaction_id, obj_in={"status": status})
 
 crud_transaction = CRUDTransaction(Transaction)
@@ -4,7 +4,14 @@ from sqlalchemy.sql import func
 
 Base = declarative_base()
 
-class BaseModel:
-    """Base model class with common fields for all models"""
+class CreatedAtModel:
+    """Creation timestamp only, for append-mostly tables.
+
+    Without updated_at's onupdate, UPDATEs to these rows don't also write a
+    timestamp nobody reads.
+    """
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+class BaseModel(CreatedAtModel):
+    """Base model class with common fields for all models"""
     updated_at = Column(DateTime(timezone=True), onupdate=func.now(), nullable=True)
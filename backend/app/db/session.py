@@ -1,28 +1,64 @@
+from typing import AsyncIterator, Optional
+
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
 from contextlib import contextmanager
 
 from ..core.config import settings
 
-engine = create_engine(settings.DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+_ENGINE_OPTIONS = dict(
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+)
+
+# statement_timeout is sent as a startup parameter, so it costs no extra
+# round-trip per connection; psycopg2 and asyncpg spell it differently
+_timeout_ms = settings.DB_STATEMENT_TIMEOUT_MS
+_SYNC_CONNECT_ARGS = {"options": f"-c statement_timeout={_timeout_ms}"} if _timeout_ms else {}
+_ASYNC_SERVER_SETTINGS = {"statement_timeout": str(_timeout_ms)} if _timeout_ms else {}
+
+engine = create_engine(
+    str(settings.DATABASE_URL), connect_args=_SYNC_CONNECT_ARGS, **_ENGINE_OPTIONS,
+)
+# Committed objects keep their loaded state; re-reading every attribute after
+# each commit would cost a SELECT per object for data we just wrote
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine, expire_on_commit=False)
 
 @contextmanager
 def get_db():
     """
-    Context-managed DB session: commits on success, rolls back on error,
-    and always closes the session.
+    Context-managed DB session: rolls back on error and always closes the
+    session. Nothing is committed implicitly, so read-only work ends without
+    a COMMIT; wrap writes in transactional().
     """
     db = SessionLocal()
     try:
         yield db
-        db.commit()
     except:
         db.rollback()
         raise
     finally:
         db.close()
 
+@contextmanager
+def transactional(db: Session):
+    """
+    Unit of work on an existing session: commits once when the block
+    succeeds, rolls back if it raises.
+    """
+    try:
+        yield db
+        db.commit()
+    except:
+        db.rollback()
+        raise
+
 def get_db_dependency():
     """Dependency for FastAPI endpoints"""
     db = SessionLocal()
@@ -30,3 +66,40 @@ def get_db_dependency():
         yield db
     finally:
         db.close()
+
+def get_session_factory() -> sessionmaker:
+    """Dependency for long-lived handlers (e.g. SSE streams) that open a
+    short-lived session per unit of work instead of holding one open"""
+    return SessionLocal
+
+
+# Async engine on asyncpg for handlers that await the database directly
+# instead of running sync Session work in the threadpool. Created on first
+# use so sync-only processes (scripts, tests) don't need the driver.
+_async_engine: Optional[AsyncEngine] = None
+_async_session_factory: Optional[async_sessionmaker[AsyncSession]] = None
+
+
+def get_async_engine() -> AsyncEngine:
+    global _async_engine, _async_session_factory
+    if _async_engine is None:
+        url = make_url(str(settings.DATABASE_URL)).set(drivername="postgresql+asyncpg")
+        # Async engines default to AsyncAdaptedQueuePool, which is safe to
+        # share across tasks on the event loop
+        _async_engine = create_async_engine(
+            url,
+            connect_args={
+                "prepared_statement_cache_size": settings.DB_PREPARED_STATEMENT_CACHE_SIZE,
+                "server_settings": _ASYNC_SERVER_SETTINGS,
+            },
+            **_ENGINE_OPTIONS,
+        )
+        _async_session_factory = async_sessionmaker(_async_engine, expire_on_commit=False)
+    return _async_engine
+
+
+async def get_async_db_dependency() -> AsyncIterator[AsyncSession]:
+    """Dependency for async FastAPI endpoints"""
+    get_async_engine()
+    async with _async_session_factory() as db:
+        yield db
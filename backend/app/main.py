@@ -4,7 +4,9 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from .core.config import settings
+from .core.http_cache import ETagMiddleware
 from .api.api_v1.api import api_router
+from .api.deps import NEXT_CURSOR_HEADER
 from core.scheduler.scheduler import TaskScheduler
 
 
@@ -21,6 +23,9 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+# Added before CORS so CORS stays outermost and also decorates 304s
+app.add_middleware(ETagMiddleware)
+
 # Set up CORS
 app.add_middleware(
     CORSMiddleware,
@@ -28,6 +33,9 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Browsers only let scripts read listed response headers; clients page
+    # with this one
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
 app.include_router(api_router, prefix=settings.API_V1_STR)
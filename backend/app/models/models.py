@@ -2,10 +2,10 @@ from sqlalchemy import (
     Column, Integer, String, Float, ForeignKey, DateTime, Text, Boolean,
     Numeric, CheckConstraint, Index, text
 )
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, validates
 from sqlalchemy.sql import func
 
-from ..db.base_class import Base, BaseModel
+from ..db.base_class import Base, BaseModel, CreatedAtModel
 
 class Player(Base, BaseModel):
     __tablename__ = "players"
@@ -19,10 +19,12 @@ class Player(Base, BaseModel):
     total_earnings = Column(Float, default=0.0)
     wallet_chain_id = Column(String, nullable=True)
 
-    characters = relationship("Character", back_populates="player_owner")
-    inventory = relationship("PlayerItem", back_populates="player")
-    transactions = relationship("Transaction", back_populates="player")
-    owned_characters = relationship("OwnedCharacter", back_populates="player")
+    # Nothing on the request path walks these; lazy="raise" makes a handler
+    # that starts to opt into selectinload instead of a SELECT per access
+    characters = relationship("Character", back_populates="player_owner", lazy="raise")
+    inventory = relationship("PlayerItem", back_populates="player", lazy="raise")
+    transactions = relationship("Transaction", back_populates="player", lazy="raise")
+    owned_characters = relationship("OwnedCharacter", back_populates="player", lazy="raise")
 
 class Character(Base, BaseModel):
     __tablename__ = "characters"
@@ -36,9 +38,17 @@ class Character(Base, BaseModel):
     entry_order = Column(Integer, nullable=False, default=0)
     elimination_round = Column(Integer, nullable=True)
 
-    player_owner = relationship("Player", back_populates="characters")
+    __table_args__ = (
+        Index("ix_characters_match", "match_id"),
+        Index("ix_characters_player_match", "player_id", "match_id"),
+    )
+
+    # lazy="raise": roster queries must eager-load these (see
+    # crud_character.get_by_match_id(load_owner=True)) instead of issuing a
+    # SELECT per row
+    player_owner = relationship("Player", back_populates="characters", lazy="raise")
     match = relationship("Match", foreign_keys=[match_id], back_populates="participants")
-    owned_character = relationship("OwnedCharacter", back_populates="match_characters")
+    owned_character = relationship("OwnedCharacter", back_populates="match_characters", lazy="raise")
 
     @property
     def display_name(self):
@@ -69,12 +79,16 @@ class Match(Base, BaseModel):
     max_characters_per_player = Column(Integer, default=3)
     countdown_started_at = Column(DateTime(timezone=True), nullable=True)
 
-    participants = relationship("Character", foreign_keys="Character.match_id", back_populates="match")
+    __table_args__ = (
+        Index("ix_matches_status", "status"),
+    )
+
+    participants = relationship("Character", foreign_keys="Character.match_id", back_populates="match", lazy="raise")
     events = relationship("MatchEvent", back_populates="match")
     join_requests = relationship("MatchJoinRequest", back_populates="match")
     pending_payouts = relationship("PendingPayout", back_populates="match")
 
-class MatchEvent(Base, BaseModel):
+class MatchEvent(Base, CreatedAtModel):
     __tablename__ = "match_events"
 
     id = Column(Integer, primary_key=True)
@@ -85,7 +99,47 @@ class MatchEvent(Base, BaseModel):
     scenario_text = Column(Text, nullable=False)
     affected_character_ids = Column(String)
 
+    __table_args__ = (
+        # Event feed: WHERE match_id = ? [AND id > cursor] ORDER BY id
+        Index("ix_match_events_match", "match_id", "id"),
+    )
+
     match = relationship("Match", back_populates="events")
+    characters = relationship(
+        "MatchEventCharacter",
+        back_populates="event",
+        cascade="all, delete-orphan",
+        order_by="MatchEventCharacter.position",
+    )
+
+    @validates("affected_character_ids")
+    def _sync_characters(self, key, value):
+        # Keep the normalized rows in step with the CSV column, whichever
+        # writer sets it
+        ids = [int(i) for i in value.split(",") if i.strip()] if value else []
+        self.characters = [
+            MatchEventCharacter(position=pos, character_id=char_id)
+            for pos, char_id in enumerate(ids)
+        ]
+        return value
+
+
+class MatchEventCharacter(Base):
+    """Characters in a match event, in affected_character_ids order.
+
+    For direct_kill events position 0 is the killer. No timestamps needed.
+    """
+    __tablename__ = "match_event_characters"
+
+    event_id = Column(Integer, ForeignKey("match_events.id"), primary_key=True)
+    position = Column(Integer, primary_key=True)
+    character_id = Column(Integer, ForeignKey("characters.id"), nullable=False)
+
+    __table_args__ = (
+        Index("ix_match_event_characters_character", "character_id", "position"),
+    )
+
+    event = relationship("MatchEvent", back_populates="characters")
 
 class Item(Base, BaseModel):
     __tablename__ = "items"
@@ -125,8 +179,26 @@ class Transaction(Base, BaseModel):
     status = Column(String, nullable=False)  # pending, completed, failed
     provider = Column(String, nullable=False)  # traditional, polygon, solana, etc.
     provider_tx_id = Column(String, nullable=True)  # For blockchain transaction hash
+
+    __table_args__ = (
+        # (player_id, id) serves both the filter and the keyset ORDER BY id
+        Index("ix_transactions_player", "player_id", "id"),
+        # Only the in-flight statuses are worth indexing: "completed" is most
+        # of the table, and the keyset ORDER BY id walks the primary key there
+        Index(
+            "ix_transactions_pending",
+            "id",
+            postgresql_where=text("status = 'pending'"),
+        ),
+        Index(
+            "ix_transactions_failed",
+            "id",
+            postgresql_where=text("status = 'failed'"),
+        ),
+        Index("ix_transactions_provider_tx", "provider_tx_id"),
+    )
     
-    player = relationship("Player", back_populates="transactions")
+    player = relationship("Player", back_populates="transactions", lazy="raise")
 
 
 class OwnedCharacter(Base, BaseModel):
@@ -173,7 +245,7 @@ class MatchJoinRequest(Base, BaseModel):
 
     match = relationship("Match", back_populates="join_requests")
     player = relationship("Player")
-    characters = relationship("MatchJoinRequestCharacter", back_populates="join_request")
+    characters = relationship("MatchJoinRequestCharacter", back_populates="join_request", lazy="raise")
 
 
 class MatchJoinRequestCharacter(Base):
@@ -187,7 +259,7 @@ class MatchJoinRequestCharacter(Base):
     owned_character = relationship("OwnedCharacter")
 
 
-class PendingPayout(Base, BaseModel):
+class PendingPayout(Base, CreatedAtModel):
     __tablename__ = "pending_payouts"
 
     id = Column(Integer, primary_key=True)
@@ -213,6 +285,11 @@ class PendingPayout(Base, BaseModel):
             "settled_at",
             postgresql_where=text("settled_at IS NULL"),
         ),
+        Index(
+            "ix_pending_payouts_player_unsettled",
+            "player_id",
+            postgresql_where=text("settled_at IS NULL"),
+        ),
     )
 
     match = relationship("Match", back_populates="pending_payouts")
@@ -1,16 +1,25 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, field_validator
 
 
-class ChallengeRequest(BaseModel):
+class WalletAddressBase(BaseModel):
     wallet_address: str
 
+    @field_validator("wallet_address")
+    @classmethod
+    def normalize_wallet_address(cls, v: str) -> str:
+        # Normalized once here so handlers can use the address as-is
+        return v.lower()
+
+
+class ChallengeRequest(WalletAddressBase):
+    pass
+
 
 class ChallengeResponse(BaseModel):
     wallet_address: str
     nonce: str
 
 
-class VerifyRequest(BaseModel):
-    wallet_address: str
+class VerifyRequest(WalletAddressBase):
     signature: str
     nonce: str
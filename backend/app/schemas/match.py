@@ -15,6 +15,9 @@ class MatchCreate(MatchBase):
     max_characters: int = 20
     max_characters_per_player: int = 3
 
+    # Unknown fields are rejected rather than silently dropped
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
 class MatchUpdate(BaseModel):
     entry_fee: Optional[float] = None
     kill_award_rate: Optional[float] = None
@@ -27,7 +27,7 @@ class PendingPayoutInDBBase(PendingPayoutBase):
     settled_at: Optional[datetime] = None
     settlement_tx_hash: Optional[str] = None
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class PendingPayout(PendingPayoutInDBBase):
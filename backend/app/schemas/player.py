@@ -1,4 +1,4 @@
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, model_validator
 from typing import Optional
 from datetime import datetime
 
@@ -7,7 +7,14 @@ class PlayerBase(BaseModel):
     username: Optional[str] = None
 
 class PlayerCreate(PlayerBase):
-    pass
+
+    @model_validator(mode="after")
+    def _default_username(self) -> "PlayerCreate":
+        # Display name falls back to the wallet prefix, resolved once here
+        # rather than in every create path
+        if not self.username:
+            self.username = f"Player_{self.wallet_address[:6]}"
+        return self
 
 class PlayerUpdate(BaseModel):
     username: Optional[str] = None
@@ -27,7 +34,7 @@ class PlayerInDBBase(PlayerBase):
     created_at: datetime
     wallet_chain_id: Optional[str] = None
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 class Player(PlayerInDBBase):
     pass
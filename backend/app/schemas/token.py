@@ -1,5 +1,4 @@
 from pydantic import BaseModel
-from typing import Optional
 
 class TokenBase(BaseModel):
     access_token: str
@@ -7,6 +6,3 @@ class TokenBase(BaseModel):
 
 class Token(TokenBase):
     pass
-
-class TokenPayload(BaseModel):
-    sub: Optional[int] = None
@@ -28,7 +28,7 @@ class TransactionInDBBase(TransactionBase):
     created_at: datetime
     updated_at: Optional[datetime] = None
     
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 class Transaction(TransactionInDBBase):
     pass
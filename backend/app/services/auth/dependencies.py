@@ -1,10 +1,13 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
+from starlette.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
+from ...core.cache import entity_cache
+from ...crud.base import as_schema
 from ...crud.player import crud_player
 from ...db.session import get_db_dependency
-from ...models.models import Player
+from ...schemas.player import Player
 from .jwt_provider import JWTAuthProvider
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/verify")
@@ -22,10 +25,19 @@ async def get_current_player(
             detail="Invalid or expired token",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    player = crud_player.get(db, id=payload["player_id"])
+    # A snapshot shared with GET /players/{id}: bursts of authenticated
+    # requests skip the SELECT, and update_player evicts it
+    player_id = payload["player_id"]
+    cached = entity_cache.get(("player", player_id))
+    if cached is not None:
+        return cached
+    # Sync Session I/O runs in the threadpool so it doesn't block the event loop
+    player = await run_in_threadpool(crud_player.get, db, id=player_id)
     if player is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Player not found",
         )
-    return player
+    result = as_schema(Player, player)
+    entity_cache.set(("player", player_id), result)
+    return result
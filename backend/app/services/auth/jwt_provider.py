@@ -1,10 +1,12 @@
+import hashlib
 import secrets
-from datetime import datetime, timedelta, timezone
+import time
 from typing import Dict, Optional, Any
 
-from jose import jwt
+import jwt
 
 from .base import AuthProvider
+from ...core.cache import TTLCache, verified_tokens_cache
 from ...core.config import settings
 from ..blockchain.factory import BlockchainServiceFactory
 
@@ -12,18 +14,26 @@ from ..blockchain.factory import BlockchainServiceFactory
 class JWTAuthProvider(AuthProvider):
 
     def __init__(self) -> None:
-        self._pending_nonces: Dict[str, str] = {}
+        # Abandoned challenges expire instead of accumulating; pop() is
+        # atomic, so a nonce can only be redeemed once
+        self._pending_nonces: TTLCache = TTLCache(ttl=300, maxsize=100_000)
+        # Key and algorithm list are fixed for the process; bind them once
+        # rather than re-reading settings on every encode/decode
+        self._key = settings.SECRET_KEY.encode()
+        self._algorithm = settings.ALGORITHM
+        self._algorithms = [settings.ALGORITHM]
+        self._token_ttl_seconds = settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
 
     async def create_challenge(self, wallet_address: str) -> str:
         nonce = secrets.token_hex(32)
-        self._pending_nonces[wallet_address.lower()] = nonce
+        self._pending_nonces.set(wallet_address.lower(), nonce)
         return nonce
 
     async def verify_challenge(
         self, wallet_address: str, signature: str, nonce: str,
     ) -> bool:
         addr = wallet_address.lower()
-        stored_nonce = self._pending_nonces.pop(addr, None)
+        stored_nonce = self._pending_nonces.pop(addr)
         if stored_nonce is None or stored_nonce != nonce:
             return False
 
@@ -33,27 +43,37 @@ class JWTAuthProvider(AuthProvider):
     async def generate_token(
         self, wallet_address: str, player_id: int,
     ) -> str:
-        expire = datetime.now(timezone.utc) + timedelta(
-            minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES,
-        )
+        # exp as a unix timestamp, which is what PyJWT would encode a
+        # datetime to anyway
+        expire = int(time.time()) + self._token_ttl_seconds
         to_encode = {
             "sub": wallet_address,
             "player_id": player_id,
             "exp": expire,
         }
-        return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+        return jwt.encode(to_encode, self._key, algorithm=self._algorithm)
 
     async def verify_token(self, token: str) -> Optional[Dict[str, Any]]:
+        # Every authenticated request verifies the same token again; skip the
+        # HMAC and JSON decode while a recent result is cached
+        key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+        cached = verified_tokens_cache.get(key)
+        if cached is not None:
+            exp, result = cached
+            if exp > time.time():
+                return result
+            verified_tokens_cache.pop(key)
+            return None
+
         try:
-            payload = jwt.decode(
-                token,
-                settings.SECRET_KEY,
-                algorithms=[settings.ALGORITHM],
-            )
+            payload = jwt.decode(token, self._key, algorithms=self._algorithms)
             wallet_address = payload.get("sub")
             player_id = payload.get("player_id")
             if wallet_address is None or player_id is None:
                 return None
-            return {"wallet_address": wallet_address, "player_id": player_id}
+            result = {"wallet_address": wallet_address, "player_id": player_id}
+            if "exp" in payload:
+                verified_tokens_cache.set(key, (payload["exp"], result))
+            return result
         except Exception:
             return None
@@ -1,14 +1,13 @@
-from typing import List
+from typing import List, Optional
 
 from sqlalchemy.orm import Session
 
 from backend.app.crud.owned_character import crud_owned_character
 from backend.app.crud.player import crud_player
 from backend.app.models.models import Character, OwnedCharacter
-from backend.app.schemas.owned_character import OwnedCharacterCreate
 from backend.app.services.blockchain.factory import BlockchainServiceFactory
 from core.config.config_loader import load_config
-from core.common.utils import get_next_character_name
+from core.common.utils import get_next_character_names
 
 
 class CharacterInventoryService:
@@ -39,15 +38,10 @@ class CharacterInventoryService:
             currency="USDC",
         )
 
-        created: List[OwnedCharacter] = []
-        for _ in range(quantity):
-            name = get_next_character_name()
-            obj = crud_owned_character.create(
-                db, obj_in=OwnedCharacterCreate(player_id=player_id, character_name=name)
-            )
-            created.append(obj)
-
-        return created
+        names = get_next_character_names(quantity)
+        return crud_owned_character.create_many(
+            db, player_id=player_id, character_names=names,
+        )
 
     def get_player_inventory(
         self,
@@ -95,3 +89,14 @@ class CharacterInventoryService:
         if result is None:
             raise ValueError("Failed to revive character")
         return result
+
+
+_inventory_service: Optional[CharacterInventoryService] = None
+
+
+def get_character_inventory_service() -> CharacterInventoryService:
+    """Shared CharacterInventoryService, rebuilt only when config.yaml changes."""
+    global _inventory_service
+    if _inventory_service is None or _inventory_service._config is not load_config():
+        _inventory_service = CharacterInventoryService()
+    return _inventory_service
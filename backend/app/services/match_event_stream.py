@@ -0,0 +1,76 @@
+"""
+In-process fan-out of "new match events committed" signals.
+
+SSE subscribers wait on a per-match asyncio.Event instead of polling
+GET /matches/{id}/events. Any session that commits MatchEvent rows wakes the
+match's subscribers, which then read the new rows from the database, so they
+only ever see committed data. Like the caches, this assumes a single API
+worker process.
+"""
+
+import asyncio
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, Set, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from ..models.models import MatchEvent
+
+_SESSION_KEY = "coin_clash_new_event_match_ids"
+
+
+class MatchEventNotifier:
+    """Wakes asyncio subscribers of a match from any thread."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._subscribers: Dict[int, Set[Tuple[asyncio.AbstractEventLoop, asyncio.Event]]] = {}
+
+    @contextmanager
+    def subscribe(self, match_id: int) -> Iterator[asyncio.Event]:
+        entry = (asyncio.get_running_loop(), asyncio.Event())
+        with self._lock:
+            self._subscribers.setdefault(match_id, set()).add(entry)
+        try:
+            yield entry[1]
+        finally:
+            with self._lock:
+                subs = self._subscribers.get(match_id)
+                if subs is not None:
+                    subs.discard(entry)
+                    if not subs:
+                        del self._subscribers[match_id]
+
+    def notify(self, match_id: int) -> None:
+        with self._lock:
+            subs = list(self._subscribers.get(match_id, ()))
+        for loop, wakeup in subs:
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(wakeup.set)
+
+
+match_event_notifier = MatchEventNotifier()
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_new_events(session, flush_context) -> None:
+    # Compare by table name: tests load the models under two module paths
+    match_ids = {
+        obj.match_id for obj in session.new
+        if getattr(obj, "__tablename__", None) == MatchEvent.__tablename__
+    }
+    if match_ids:
+        session.info.setdefault(_SESSION_KEY, set()).update(match_ids)
+
+
+@event.listens_for(Session, "after_commit")
+def _notify_committed_events(session) -> None:
+    for match_id in session.info.pop(_SESSION_KEY, ()):
+        match_event_notifier.notify(match_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_rolled_back_events(session) -> None:
+    session.info.pop(_SESSION_KEY, None)
@@ -1,19 +1,22 @@
 import datetime
 import logging
 from decimal import Decimal
-from typing import List
+from typing import List, Optional
 
-from sqlalchemy import func
+from sqlalchemy import func, insert
 from sqlalchemy.orm import Session
 
+from backend.app.core.cache import match_results_cache, open_matches_cache
+from backend.app.crud.character import crud_character
 from backend.app.crud.match import crud_match
+from backend.app.crud.match_event import crud_match_event
 from backend.app.crud.match_join_request import crud_match_join_request
 from backend.app.crud.owned_character import crud_owned_character
 from backend.app.crud.pending_payout import crud_pending_payout
+from backend.app.db.session import transactional
 from backend.app.models.models import (
     Character,
     Match,
-    MatchEvent,
     MatchJoinRequest,
     PendingPayout,
 )
@@ -24,18 +27,29 @@ from backend.app.services.payout_calculator import (
     CharacterInfo,
     KillEvent,
     calculate_payouts,
+    protocol_fee_rate,
+    protocol_fee_rates,
 )
 from core.config.config_loader import load_config
 from core.scheduler.scheduler import TaskScheduler
 
 logger = logging.getLogger(__name__)
 
+_CENT = Decimal("0.01")
+
+
+def _to_cents(amount: float) -> Decimal:
+    # Quantize the float's exact value directly (half-even, as round() does)
+    # instead of round() -> str() -> Decimal()
+    return Decimal(amount).quantize(_CENT)
+
 
 class MatchLobbyService:
 
     def __init__(self) -> None:
         self._config = load_config()
         self._payment = BlockchainServiceFactory.get_payment_provider()
+        self._protocol_fee_rates = protocol_fee_rates(self._config.protocol_fee_tiers)
 
     async def create_match_lobby(
         self,
@@ -88,6 +102,7 @@ class MatchLobbyService:
             max_characters_per_player=max_characters_per_player,
         )
         match = crud_match.create(db, obj_in=match_in)
+        open_matches_cache.clear()
         return match
 
     async def join_match(
@@ -98,7 +113,9 @@ class MatchLobbyService:
         owned_character_ids: List[int],
         payment_ref: str,
     ) -> MatchJoinRequest:
-        try:
+        # One transaction for the checks, the join request and its
+        # characters: any failure (including the deposit) rolls all of it back
+        with transactional(db):
             match = crud_match.get(db, match_id)
             if match is None:
                 raise ValueError(f"Match {match_id} not found")
@@ -128,33 +145,21 @@ class MatchLobbyService:
                 raise ValueError("One or more characters are already in a filling or active match")
 
             # Per-player character limit
-            existing_count = (
-                db.query(func.count(Character.id))
-                .filter(
-                    Character.match_id == match_id,
-                    Character.player_id == player_id,
-                )
-                .scalar()
-            ) or 0
+            existing_count = crud_character.count_by_match(
+                db, match_id, player_id=player_id,
+            )
             if existing_count + len(owned_character_ids) > match.max_characters_per_player:
                 raise ValueError("Exceeds per-player character limit for this match")
 
             # Total character limit
-            total_count = (
-                db.query(func.count(Character.id))
-                .filter(Character.match_id == match_id)
-                .scalar()
-            ) or 0
+            total_count = crud_character.count_by_match(db, match_id)
             if total_count + len(owned_character_ids) > match.max_characters:
                 raise ValueError("Match is full")
 
             entry_fee_total = len(owned_character_ids) * match.entry_fee
 
             # Tiered protocol fee: rate depends on number of characters entered
-            fee_tiers = self._config.protocol_fee_tiers
-            char_count = len(owned_character_ids)
-            tier_key = min(char_count, max(fee_tiers.keys()))
-            protocol_rate = fee_tiers[tier_key] / 100.0
+            protocol_rate = protocol_fee_rate(self._protocol_fee_rates, len(owned_character_ids))
             protocol_fee = entry_fee_total * protocol_rate
 
             await self._payment.process_deposit(
@@ -183,23 +188,23 @@ class MatchLobbyService:
                 .scalar()
             ) or 0
 
-            for i, oc in enumerate(owned_chars):
-                char = Character(
-                    name=oc.character_name,
-                    player_id=player_id,
-                    match_id=match_id,
-                    owned_character_id=oc.id,
-                    entry_order=max_order + i + 1,
-                )
-                db.add(char)
-            db.flush()
-
-            db.commit()
-
-        except Exception:
-            db.rollback()
-            raise
+            # Nothing below reads these rows back, so insert plain parameter
+            # dicts rather than building ORM objects for the identity map
+            db.execute(
+                insert(Character),
+                [
+                    {
+                        "name": oc.character_name,
+                        "player_id": player_id,
+                        "match_id": match_id,
+                        "owned_character_id": oc.id,
+                        "entry_order": max_order + i + 1,
+                    }
+                    for i, oc in enumerate(owned_chars)
+                ],
+            )
 
+        open_matches_cache.clear()
         self.check_start_conditions(db, match_id)
         return join_request
 
@@ -208,13 +213,7 @@ class MatchLobbyService:
         if match is None or match.status != "filling":
             return False
 
-        characters = (
-            db.query(Character)
-            .filter(Character.match_id == match_id)
-            .all()
-        )
-        unique_players = len({c.player_id for c in characters})
-        total_characters = len(characters)
+        total_characters = crud_character.count_by_match(db, match_id)
 
         if total_characters >= match.max_characters:
             match.status = "active"
@@ -222,7 +221,10 @@ class MatchLobbyService:
             self._run_match_background(match_id, db)
             return True
 
-        if unique_players >= match.min_players and match.countdown_started_at is None:
+        if (
+            match.countdown_started_at is None
+            and crud_character.count_players_by_match(db, match_id) >= match.min_players
+        ):
             match.countdown_started_at = datetime.datetime.now(datetime.timezone.utc)
             match.start_timer_end = (
                 match.countdown_started_at
@@ -262,25 +264,14 @@ class MatchLobbyService:
         confirmed_joins = crud_match_join_request.get_confirmed_by_match(db, match_id)
         protocol_fee = sum(float(jr.protocol_fee) for jr in confirmed_joins)
 
-        kill_events_db = (
-            db.query(MatchEvent)
-            .filter(
-                MatchEvent.match_id == match_id,
-                MatchEvent.event_type == "direct_kill",
-            )
-            .all()
-        )
-
         characters = [
             CharacterInfo(character_id=c.id, player_id=c.player_id)
             for c in match_characters
         ]
-        kill_events = []
-        for event in kill_events_db:
-            if not event.affected_character_ids:
-                continue
-            ids = event.affected_character_ids.split(",")
-            kill_events.append(KillEvent(killer_character_id=int(ids[0].strip())))
+        kill_events = [
+            KillEvent(killer_character_id=killer_id)
+            for killer_id in crud_match_event.get_killer_ids(db, match_id)
+        ]
 
         result = calculate_payouts(
             characters=characters,
@@ -291,34 +282,32 @@ class MatchLobbyService:
             winner_character_id=match.winner_character_id,
         )
 
-        payouts: List[PendingPayout] = []
-
-        for player_id, amount in result.kill_awards.items():
-            if amount <= 0:
-                continue
-            payout = crud_pending_payout.create(
-                db,
-                obj_in=PendingPayoutCreate(
-                    match_id=match_id,
-                    player_id=player_id,
-                    payout_type="kill_award",
-                    amount=Decimal(str(round(amount, 2))),
-                ),
+        payouts_in = [
+            PendingPayoutCreate(
+                match_id=match_id,
+                player_id=player_id,
+                payout_type="kill_award",
+                amount=_to_cents(amount),
             )
-            payouts.append(payout)
-
+            for player_id, amount in result.kill_awards.items()
+            if amount > 0
+        ]
         if result.winner_player_id is not None and result.winner_payout > 0:
-            payout = crud_pending_payout.create(
-                db,
-                obj_in=PendingPayoutCreate(
+            payouts_in.append(
+                PendingPayoutCreate(
                     match_id=match_id,
                     player_id=result.winner_player_id,
                     payout_type="winner",
-                    amount=Decimal(str(round(result.winner_payout, 2))),
-                ),
+                    amount=_to_cents(result.winner_payout),
+                )
             )
-            payouts.append(payout)
 
+        # One batched INSERT for the whole match instead of one per payout.
+        # Its commit only covers the payouts: the runner has already committed
+        # the events and end state before payouts are calculated
+        payouts = crud_pending_payout.bulk_create(db, objs_in=payouts_in)
+
+        match_results_cache.pop(match_id)
         return payouts
 
 
@@ -338,3 +327,14 @@ class _MatchStarter:
         self._db.commit()
         run_match_background(match_id, self._db)
         return True
+
+
+_lobby_service: Optional[MatchLobbyService] = None
+
+
+def get_match_lobby_service() -> MatchLobbyService:
+    """Shared MatchLobbyService, rebuilt only when config.yaml changes."""
+    global _lobby_service
+    if _lobby_service is None or _lobby_service._config is not load_config():
+        _lobby_service = MatchLobbyService()
+    return _lobby_service
@@ -7,14 +7,16 @@ import logging
 from sqlalchemy.orm import Session
 
 from core.config.config_loader import load_config
-from core.match.scenario_loader import load_scenarios
+from core.match.scenario_loader import get_scenarios
 from core.match.engine import MatchEngine
 from core.player.repository import SqlPlayerRepo
 from core.player.character_repository import SqlCharacterRepo
 from core.player.item_repository import SqlItemRepo
 from core.match.repository import SqlMatchRepo
 from core.match.event_repository import SqlEventRepo
-from backend.app.models.models import Character
+from backend.app.core.cache import entity_cache
+from backend.app.crud.character import crud_character
+from backend.app.services.match_event_stream import match_event_notifier
 
 logger = logging.getLogger(__name__)
 
@@ -25,7 +27,7 @@ def run_match_background(match_id: int, db: Session) -> None:
     Intended as the target for BackgroundTasks and the scheduler.
     """
     config = load_config()
-    scenarios = load_scenarios(config.scenario_dir)
+    scenarios = get_scenarios(config.scenario_dir)
 
     player_repo = SqlPlayerRepo(db)
     character_repo = SqlCharacterRepo(db)
@@ -33,7 +35,10 @@ def run_match_background(match_id: int, db: Session) -> None:
     match_repo = SqlMatchRepo(db)
     event_repo = SqlEventRepo(db)
 
-    participants = db.query(Character).filter(Character.match_id == match_id).all()
+    # The engine renders display_name, which reads each character's owner
+    participants = crud_character.get_by_match_id(
+        db, match_id, limit=None, load_owner=True,
+    )
 
     engine = MatchEngine(
         match_id=match_id,
@@ -44,18 +49,30 @@ def run_match_background(match_id: int, db: Session) -> None:
         match_repo=match_repo,
         event_repo=event_repo,
         item_repo=item_repo,
+        # One commit per round: the round's events reach streams together
+        # (the notifier fires on commit) and no transaction stays open
+        # across the delay between rounds
+        on_round_end=db.commit,
     )
 
     engine.run_match(participants)
+    # Publishes the end state (status, winner, kills) and wakes streams so
+    # they can close
+    db.commit()
+    match_event_notifier.notify(match_id)
+    # The engine bumped wins, kills and balances through SqlPlayerRepo, so
+    # the participants' cached snapshots are stale
+    for player_id in {c.player_id for c in participants}:
+        entity_cache.pop(("player", player_id))
 
-    from backend.app.services.match_lobby import MatchLobbyService
-    MatchLobbyService().calculate_and_store_payouts(db, match_id)
+    from backend.app.services.match_lobby import get_match_lobby_service
+    get_match_lobby_service().calculate_and_store_payouts(db, match_id)
 
     import asyncio
-    from backend.app.services.settlement import SettlementService
+    from backend.app.services.settlement import get_settlement_service
     try:
         asyncio.get_event_loop().run_until_complete(
-            SettlementService().settle_match(db, match_id)
+            get_settlement_service().settle_match(db, match_id)
         )
     except Exception:
         logger.exception("Auto-settlement failed for match %d; payouts remain unsettled", match_id)
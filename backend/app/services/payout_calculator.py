@@ -32,6 +32,21 @@ class KillEvent:
     killer_character_id: int
 
 
+def protocol_fee_rates(fee_tiers: Dict[int, float]) -> List[float]:
+    """Fractional protocol fee rates indexed by number of characters entered.
+
+    Built once from the percentage tiers in config. Counts above the highest
+    tier use the last entry (see protocol_fee_rate); gaps below it fall back
+    to the highest tier's rate.
+    """
+    max_tier = max(fee_tiers)
+    return [fee_tiers.get(n, fee_tiers[max_tier]) / 100.0 for n in range(max_tier + 1)]
+
+
+def protocol_fee_rate(rates: List[float], char_count: int) -> float:
+    return rates[min(char_count, len(rates) - 1)]
+
+
 def calculate_payouts(
     characters: List[CharacterInfo],
     kill_events: List[KillEvent],
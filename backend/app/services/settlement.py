@@ -1,8 +1,9 @@
 import logging
-from typing import List
+from typing import List, Optional
 
 from sqlalchemy.orm import Session
 
+from backend.app.core.cache import match_results_cache
 from backend.app.crud.pending_payout import crud_pending_payout
 from backend.app.crud.player import crud_player
 from backend.app.models.models import PendingPayout
@@ -18,7 +19,8 @@ class SettlementService:
 
     async def settle_match(self, db: Session, match_id: int) -> List[PendingPayout]:
         unsettled = [
-            p for p in crud_pending_payout.get_by_match_id(db, match_id)
+            # Bounded by the match's player count, so settle them all in one pass
+            p for p in crud_pending_payout.get_by_match_id(db, match_id, limit=None)
             if p.settled_at is None
         ]
         settled: List[PendingPayout] = []
@@ -26,6 +28,8 @@ class SettlementService:
             result = await self._settle_payout(db, payout)
             if result is not None:
                 settled.append(result)
+        if settled:
+            match_results_cache.pop(match_id)
         return settled
 
     async def _settle_payout(
@@ -48,3 +52,13 @@ class SettlementService:
 
         tx_hash = result.get("transaction_id", "")
         return crud_pending_payout.mark_settled(db, payout_id=payout.id, tx_hash=tx_hash)
+
+
+_settlement_service: Optional[SettlementService] = None
+
+
+def get_settlement_service() -> SettlementService:
+    global _settlement_service
+    if _settlement_service is None:
+        _settlement_service = SettlementService()
+    return _settlement_service
@@ -1,22 +1,32 @@
+import os
+import tempfile
+
 import pytest
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import NullPool
 
+from app.core import cache
 from app.db.base_class import Base
-from app.db.session import get_db_dependency
+from app.db.session import get_async_db_dependency, get_db_dependency, get_session_factory
 from app.main import app
 from app.models.models import Player
 from app.services.auth.dependencies import get_current_player
 
-TEST_SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
+# A file database, so the sync and async (aiosqlite) engines see the same data
+_DB_PATH = os.path.join(tempfile.mkdtemp(prefix="coin_clash_api_"), "test.db")
+TEST_SQLALCHEMY_DATABASE_URL = f"sqlite:///{_DB_PATH}"
 
 engine = create_engine(
     TEST_SQLALCHEMY_DATABASE_URL,
     connect_args={"check_same_thread": False},
-    poolclass=StaticPool,
 )
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine, expire_on_commit=False)
+
+# No pooling: TestClient may run each request on a fresh event loop
+async_engine = create_async_engine(f"sqlite+aiosqlite:///{_DB_PATH}", poolclass=NullPool)
+TestingAsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False)
 
 Base.metadata.create_all(bind=engine)
 
@@ -31,6 +41,11 @@ def override_get_db():
         db.close()
 
 
+async def override_get_async_db():
+    async with TestingAsyncSessionLocal() as db:
+        yield db
+
+
 def override_get_current_player():
     if _current_player_override is None:
         from fastapi import HTTPException, status
@@ -42,6 +57,8 @@ def override_get_current_player():
 
 
 app.dependency_overrides[get_db_dependency] = override_get_db
+app.dependency_overrides[get_async_db_dependency] = override_get_async_db
+app.dependency_overrides[get_session_factory] = lambda: TestingSessionLocal
 app.dependency_overrides[get_current_player] = override_get_current_player
 
 
@@ -52,6 +69,7 @@ def reset_db():
     _current_player_override = None
     Base.metadata.drop_all(bind=engine)
     Base.metadata.create_all(bind=engine)
+    cache.clear_all()
     yield
 
 
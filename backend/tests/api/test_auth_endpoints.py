@@ -0,0 +1,47 @@
+"""Tests for wallet-signature login."""
+
+import random
+from unittest.mock import AsyncMock, patch
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+client = TestClient(app)
+
+
+def _wallet():
+    return f"0x{''.join(random.choices('0123456789abcdef', k=40))}"
+
+
+@patch("app.api.api_v1.endpoints.auth._auth_provider")
+class TestVerify:
+
+    def _verify(self, mock_provider, wallet):
+        mock_provider.verify_challenge = AsyncMock(return_value=True)
+        mock_provider.generate_token = AsyncMock(return_value="token")
+        resp = client.post(
+            "/api/v1/auth/verify",
+            json={"wallet_address": wallet, "signature": "sig", "nonce": "n"},
+        )
+        assert resp.status_code == 200
+        return mock_provider.generate_token.await_args.kwargs["player_id"]
+
+    def test_first_login_creates_player_and_later_logins_reuse_it(self, mock_provider):
+        wallet = _wallet()
+
+        first = self._verify(mock_provider, wallet)
+        second = self._verify(mock_provider, wallet)
+
+        assert first == second
+        player = client.get(f"/api/v1/players/{first}").json()
+        assert player["wallet_address"] == wallet
+        assert player["username"] == f"Player_{wallet[:6]}"
+
+    def test_invalid_signature_returns_401(self, mock_provider):
+        mock_provider.verify_challenge = AsyncMock(return_value=False)
+        resp = client.post(
+            "/api/v1/auth/verify",
+            json={"wallet_address": _wallet(), "signature": "bad", "nonce": "n"},
+        )
+        assert resp.status_code == 401
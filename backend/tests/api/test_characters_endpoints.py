@@ -34,13 +34,13 @@ def _mock_owned_character(player_id, char_id=1, name="Warrior"):
 
 class TestPurchaseEndpoint:
 
-    @patch("app.api.api_v1.endpoints.characters.CharacterInventoryService")
-    def test_purchase_returns_owned_characters(self, mock_svc_cls, test_player):
+    @patch("app.api.api_v1.endpoints.characters.get_character_inventory_service")
+    def test_purchase_returns_owned_characters(self, mock_get_svc, test_player):
         mock_svc = MagicMock()
         mock_svc.purchase_characters = AsyncMock(
             return_value=[_mock_owned_character(test_player.id, char_id=10)]
         )
-        mock_svc_cls.return_value = mock_svc
+        mock_get_svc.return_value = mock_svc
 
         resp = client.post(
             "/api/v1/characters/purchase",
@@ -52,13 +52,13 @@ class TestPurchaseEndpoint:
         assert len(data) == 1
         assert data[0]["character_name"] == "Warrior"
 
-    @patch("app.api.api_v1.endpoints.characters.CharacterInventoryService")
-    def test_purchase_invalid_quantity_returns_400(self, mock_svc_cls, test_player):
+    @patch("app.api.api_v1.endpoints.characters.get_character_inventory_service")
+    def test_purchase_invalid_quantity_returns_400(self, mock_get_svc, test_player):
         mock_svc = MagicMock()
         mock_svc.purchase_characters = AsyncMock(
             side_effect=ValueError("quantity must be between 1 and 10")
         )
-        mock_svc_cls.return_value = mock_svc
+        mock_get_svc.return_value = mock_svc
 
         resp = client.post(
             "/api/v1/characters/purchase",
@@ -69,14 +69,14 @@ class TestPurchaseEndpoint:
 
 class TestInventoryEndpoint:
 
-    @patch("app.api.api_v1.endpoints.characters.CharacterInventoryService")
-    def test_inventory_returns_list(self, mock_svc_cls, test_player):
+    @patch("app.api.api_v1.endpoints.characters.get_character_inventory_service")
+    def test_inventory_returns_list(self, mock_get_svc, test_player):
         mock_svc = MagicMock()
         mock_svc.get_player_inventory.return_value = [
             _mock_owned_character(test_player.id, char_id=1),
             _mock_owned_character(test_player.id, char_id=2, name="Mage"),
         ]
-        mock_svc_cls.return_value = mock_svc
+        mock_get_svc.return_value = mock_svc
 
         resp = client.get("/api/v1/characters/inventory")
         assert resp.status_code == 200
@@ -101,13 +101,13 @@ class TestRevivalFeeEndpoint:
 
 class TestReviveEndpoint:
 
-    @patch("app.api.api_v1.endpoints.characters.CharacterInventoryService")
-    def test_revive_returns_owned_character(self, mock_svc_cls, test_player):
+    @patch("app.api.api_v1.endpoints.characters.get_character_inventory_service")
+    def test_revive_returns_owned_character(self, mock_get_svc, test_player):
         mock_svc = MagicMock()
         oc = _mock_owned_character(test_player.id, char_id=5)
         oc.revival_count = 1
         mock_svc.revive_character = AsyncMock(return_value=oc)
-        mock_svc_cls.return_value = mock_svc
+        mock_get_svc.return_value = mock_svc
 
         resp = client.post(
             "/api/v1/characters/5/revive",
@@ -116,13 +116,13 @@ class TestReviveEndpoint:
         assert resp.status_code == 200
         assert resp.json()["id"] == 5
 
-    @patch("app.api.api_v1.endpoints.characters.CharacterInventoryService")
-    def test_revive_wrong_player_returns_400(self, mock_svc_cls, test_player):
+    @patch("app.api.api_v1.endpoints.characters.get_character_inventory_service")
+    def test_revive_wrong_player_returns_400(self, mock_get_svc, test_player):
         mock_svc = MagicMock()
         mock_svc.revive_character = AsyncMock(
             side_effect=ValueError("Character not owned by this player")
         )
-        mock_svc_cls.return_value = mock_svc
+        mock_get_svc.return_value = mock_svc
 
         resp = client.post(
             "/api/v1/characters/5/revive",
@@ -1,11 +1,13 @@
-"""Tests for the new match endpoints: create, open, join, events, status."""
+"""Tests for the new match endpoints: create, open, join, events, status, results."""
 
+import asyncio
 from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock, patch
+import pytest
 from fastapi.testclient import TestClient
 
 from app.main import app
-from app.models.models import Character, Match, MatchEvent, Player
+from app.models.models import Character, Match, MatchEvent, PendingPayout, Player
 
 client = TestClient(app)
 
@@ -74,8 +76,8 @@ def _make_event(db, match_id, round_number=1):
 
 class TestCreateLobby:
 
-    @patch("app.api.api_v1.endpoints.matches.MatchLobbyService")
-    def test_create_lobby_returns_match(self, mock_svc_cls, test_player):
+    @patch("app.api.api_v1.endpoints.matches.get_match_lobby_service")
+    def test_create_lobby_returns_match(self, mock_get_svc, test_player):
         mock_svc = MagicMock()
         mock_match = MagicMock()
         mock_match.id = 1
@@ -99,7 +101,7 @@ class TestCreateLobby:
         mock_match.updated_at = None
 
         mock_svc.create_match_lobby = AsyncMock(return_value=mock_match)
-        mock_svc_cls.return_value = mock_svc
+        mock_get_svc.return_value = mock_svc
 
         resp = client.post(
             "/api/v1/matches/create",
@@ -115,13 +117,13 @@ class TestCreateLobby:
         assert data["status"] == "filling"
         assert data["entry_fee"] == 2.0
 
-    @patch("app.api.api_v1.endpoints.matches.MatchLobbyService")
-    def test_create_lobby_invalid_params_returns_400(self, mock_svc_cls, test_player):
+    @patch("app.api.api_v1.endpoints.matches.get_match_lobby_service")
+    def test_create_lobby_invalid_params_returns_400(self, mock_get_svc, test_player):
         mock_svc = MagicMock()
         mock_svc.create_match_lobby = AsyncMock(
             side_effect=ValueError("min_players must be between 3 and 50")
         )
-        mock_svc_cls.return_value = mock_svc
+        mock_get_svc.return_value = mock_svc
 
         resp = client.post(
             "/api/v1/matches/create",
@@ -161,6 +163,18 @@ class TestGetOpenMatches:
         match_ids = [m["id"] for m in data]
         assert match.id not in match_ids
 
+    def test_has_slots_keeps_empty_and_partial_matches(self):
+        db = _db()
+        empty = _make_match(db, status="filling", max_characters=2)
+        partial = _make_match(db, status="filling", max_characters=2)
+        p = _make_player(db)
+        _make_character(db, p.id, partial.id)
+
+        resp = client.get("/api/v1/matches/open?has_slots=true")
+        assert resp.status_code == 200
+        match_ids = sorted(m["id"] for m in resp.json())
+        assert match_ids == sorted([empty.id, partial.id])
+
     def test_fee_range_filter(self):
         db = _db()
         _make_match(db, status="filling", entry_fee=1.0)
@@ -176,8 +190,8 @@ class TestGetOpenMatches:
 
 class TestJoinMatch:
 
-    @patch("app.api.api_v1.endpoints.matches.MatchLobbyService")
-    def test_join_returns_join_request(self, mock_svc_cls, test_player):
+    @patch("app.api.api_v1.endpoints.matches.get_match_lobby_service")
+    def test_join_returns_join_request(self, mock_get_svc, test_player):
         mock_svc = MagicMock()
         mock_jr = MagicMock()
         mock_jr.id = 1
@@ -190,7 +204,7 @@ class TestJoinMatch:
         mock_jr.confirmed_at = "2025-01-01T00:00:01"
 
         mock_svc.join_match = AsyncMock(return_value=mock_jr)
-        mock_svc_cls.return_value = mock_svc
+        mock_get_svc.return_value = mock_svc
 
         resp = client.post(
             "/api/v1/matches/10/join",
@@ -199,13 +213,13 @@ class TestJoinMatch:
         assert resp.status_code == 200
         assert resp.json()["payment_status"] == "confirmed"
 
-    @patch("app.api.api_v1.endpoints.matches.MatchLobbyService")
-    def test_join_invalid_returns_400(self, mock_svc_cls, test_player):
+    @patch("app.api.api_v1.endpoints.matches.get_match_lobby_service")
+    def test_join_invalid_returns_400(self, mock_get_svc, test_player):
         mock_svc = MagicMock()
         mock_svc.join_match = AsyncMock(
             side_effect=ValueError("Match is not accepting joins")
         )
-        mock_svc_cls.return_value = mock_svc
+        mock_get_svc.return_value = mock_svc
 
         resp = client.post(
             "/api/v1/matches/10/join",
@@ -246,6 +260,60 @@ class TestGetEvents:
         assert resp.status_code == 404
 
 
+class TestStreamEvents:
+
+    def test_streams_events_and_closes_for_ended_match(self):
+        db = _db()
+        match = _make_match(db, status="completed")
+        e1 = _make_event(db, match.id, round_number=1)
+        e2 = _make_event(db, match.id, round_number=2)
+
+        resp = client.get(f"/api/v1/matches/{match.id}/events/stream")
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("text/event-stream")
+        ids = [line.split(": ", 1)[1] for line in resp.text.splitlines() if line.startswith("id: ")]
+        assert ids == [str(e1.id), str(e2.id)]
+
+    def test_resumes_after_event_id(self):
+        db = _db()
+        match = _make_match(db, status="completed")
+        e1 = _make_event(db, match.id, round_number=1)
+        e2 = _make_event(db, match.id, round_number=2)
+
+        resp = client.get(f"/api/v1/matches/{match.id}/events/stream?after_event_id={e1.id}")
+        assert f"id: {e1.id}\n" not in resp.text
+        assert f"id: {e2.id}\n" in resp.text
+
+    def test_match_not_found_returns_404(self):
+        resp = client.get("/api/v1/matches/999999/events/stream")
+        assert resp.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_delivers_events_committed_while_match_is_active(self):
+        # TestClient buffers whole responses, so drive the SSE body directly
+        from app.api.api_v1.endpoints.matches import stream_match_events
+        from app.db.session import get_session_factory
+
+        db = _db()
+        match = _make_match(db, status="active")
+        e1 = _make_event(db, match.id, round_number=1)
+
+        session_factory = app.dependency_overrides[get_session_factory]()
+        resp = await stream_match_events(match.id, session_factory=session_factory)
+        body = resp.body_iterator
+        assert f"id: {e1.id}\n" in await asyncio.wait_for(anext(body), 2)
+
+        # Committed from another session while the match is still running
+        e2 = _make_event(db, match.id, round_number=2)
+        assert f"id: {e2.id}\n" in await asyncio.wait_for(anext(body), 2)
+
+        match.status = "completed"
+        e3 = _make_event(db, match.id, round_number=3)
+        assert f"id: {e3.id}\n" in await asyncio.wait_for(anext(body), 2)
+        with pytest.raises(StopAsyncIteration):
+            await asyncio.wait_for(anext(body), 2)
+
+
 class TestGetStatus:
 
     def test_returns_match_summary(self):
@@ -265,6 +333,67 @@ class TestGetStatus:
         assert data["total_characters"] == 3
         assert data["unique_players"] == 2
 
+    def test_match_without_characters_reports_zero(self):
+        db = _db()
+        match = _make_match(db, status="filling")
+
+        resp = client.get(f"/api/v1/matches/{match.id}/status")
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["total_characters"] == 0
+        assert data["unique_players"] == 0
+
     def test_match_not_found_returns_404(self):
         resp = client.get("/api/v1/matches/999999/status")
         assert resp.status_code == 404
+
+
+class TestGetResults:
+
+    def test_returns_kills_and_winner_per_player(self):
+        db = _db()
+        match = _make_match(db, status="completed")
+        p1 = _make_player(db)
+        p2 = _make_player(db)
+        c1 = _make_character(db, p1.id, match.id, name="C1")
+        c2 = _make_character(db, p2.id, match.id, name="C2")
+        kill = _make_event(db, match.id)
+        kill.affected_character_ids = f"{c1.id},{c2.id}"
+        match.winner_character_id = c1.id
+        db.commit()
+
+        resp = client.get(f"/api/v1/matches/{match.id}/results")
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["winner_player_id"] == p1.id
+        kills = {p["player_id"]: p["kills"] for p in data["players"]}
+        assert kills == {p1.id: 1, p2.id: 0}
+
+    def test_groups_payouts_by_player(self):
+        db = _db()
+        match = _make_match(db, status="completed")
+        p1 = _make_player(db)
+        p2 = _make_player(db)
+        _make_character(db, p1.id, match.id, name="C1")
+        _make_character(db, p2.id, match.id, name="C2")
+        db.add_all([
+            PendingPayout(match_id=match.id, player_id=p1.id, payout_type="winner", amount=5),
+            PendingPayout(match_id=match.id, player_id=p1.id, payout_type="kill_award", amount=1),
+        ])
+        db.commit()
+
+        resp = client.get(f"/api/v1/matches/{match.id}/results")
+        assert resp.status_code == 200
+        payouts = {p["player_id"]: [x["payout_type"] for x in p["payouts"]] for p in resp.json()["players"]}
+        assert payouts == {p1.id: ["winner", "kill_award"], p2.id: []}
+
+    def test_unfinished_match_returns_400(self):
+        db = _db()
+        match = _make_match(db, status="filling")
+
+        resp = client.get(f"/api/v1/matches/{match.id}/results")
+        assert resp.status_code == 400
+
+    def test_match_not_found_returns_404(self):
+        resp = client.get("/api/v1/matches/999999/results")
+        assert resp.status_code == 404
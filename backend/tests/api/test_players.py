@@ -1,6 +1,7 @@
 import pytest
 from fastapi.testclient import TestClient
 
+from app.core.config import settings
 from app.main import app
 
 client = TestClient(app)
@@ -46,3 +47,62 @@ def test_read_player():
     data = response.json()
     assert data["username"] == username
     assert data["id"] == player_id
+
+
+def test_update_player_evicts_cached_reads(test_player):
+    assert client.get(f"/api/v1/players/{test_player.id}").json()["username"] == "testplayer"
+    assert client.get("/api/v1/players/by-username/testplayer").status_code == 200
+
+    resp = client.put(f"/api/v1/players/{test_player.id}", json={"username": "renamed"})
+    assert resp.status_code == 200
+
+    assert client.get(f"/api/v1/players/{test_player.id}").json()["username"] == "renamed"
+    assert client.get("/api/v1/players/by-username/testplayer").status_code == 404
+
+
+def test_read_players_keyset_pages():
+    ids = [
+        client.post("/api/v1/players/", json={"wallet_address": f"0x{pytest.random_string(40)}"}).json()["id"]
+        for _ in range(3)
+    ]
+
+    first = client.get("/api/v1/players/?after_id=0&limit=2")
+    assert [p["id"] for p in first.json()] == ids[:2]
+    cursor = first.headers["X-Next-Cursor"]
+
+    second = client.get(f"/api/v1/players/?after_id={cursor}&limit=2")
+    assert [p["id"] for p in second.json()] == ids[2:]
+    assert "X-Next-Cursor" not in second.headers
+
+
+def test_cross_origin_clients_can_read_next_cursor():
+    # Without Access-Control-Expose-Headers the browser hides X-Next-Cursor
+    # from cross-origin scripts, which then can't page
+    origin = settings.BACKEND_CORS_ORIGINS[0]
+    if origin == "*":
+        origin = "https://example.com"
+    resp = client.get("/api/v1/players/?after_id=0&limit=2", headers={"Origin": origin})
+
+    assert resp.status_code == 200
+    exposed = resp.headers["Access-Control-Expose-Headers"]
+    assert "x-next-cursor" in exposed.lower()
+
+
+def test_read_player_revalidates_with_etag(test_player):
+    # The middleware reads @http_cache off the routed endpoint; a wrapper that
+    # hides the attribute would silently drop the ETag on the real route
+    first = client.get(f"/api/v1/players/{test_player.id}")
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+    assert first.headers["Cache-Control"] == "private, max-age=5"
+
+    again = client.get(f"/api/v1/players/{test_player.id}", headers={"If-None-Match": etag})
+    assert again.status_code == 304
+    assert again.content == b""
+    assert again.headers["ETag"] == etag
+
+
+def test_uncached_route_sends_no_etag(test_player):
+    resp = client.get(f"/api/v1/players/by-username/{test_player.username}")
+    assert resp.status_code == 200
+    assert "ETag" not in resp.headers
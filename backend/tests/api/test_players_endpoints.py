@@ -80,6 +80,21 @@ class TestProfileEndpoint:
         assert data["pending_payouts"][0]["payout_type"] == "winner"
         assert float(data["pending_payouts"][0]["amount"]) == 5.0
 
+    def test_settling_payout_refreshes_cached_profile(self, test_player):
+        from app.crud.pending_payout import crud_pending_payout
+
+        db = _db()
+        match = _make_match(db)
+        payout = PendingPayout(
+            match_id=match.id, player_id=test_player.id, payout_type="winner", amount=Decimal("5.00"),
+        )
+        db.add(payout)
+        db.commit()
+
+        assert len(client.get("/api/v1/players/profile").json()["pending_payouts"]) == 1
+        crud_pending_payout.mark_settled(db, payout_id=payout.id, tx_hash="0xsettled")
+        assert client.get("/api/v1/players/profile").json()["pending_payouts"] == []
+
     def test_profile_unauthenticated_returns_401(self):
         resp = client.get("/api/v1/players/profile")
         assert resp.status_code == 401
@@ -132,3 +147,24 @@ class TestMatchHistoryEndpoint:
         assert resp.status_code == 200
         data = resp.json()
         assert len(data) == 2
+
+    def test_keyset_pages_newest_first(self):
+        db = _db()
+        player = _make_player(db)
+        match_ids = []
+        for i in range(3):
+            match = _make_match(db)
+            db.add(Character(
+                name=f"C{i}", player_id=player.id, match_id=match.id, entry_order=1,
+            ))
+            match_ids.append(match.id)
+        db.commit()
+
+        url = f"/api/v1/players/{player.wallet_address}/match-history"
+        first = client.get(f"{url}?limit=2")
+        assert [e["match_id"] for e in first.json()] == match_ids[::-1][:2]
+
+        cursor = first.headers["X-Next-Cursor"]
+        second = client.get(f"{url}?limit=2&after_match_id={cursor}")
+        assert [e["match_id"] for e in second.json()] == [match_ids[0]]
+        assert "X-Next-Cursor" not in second.headers
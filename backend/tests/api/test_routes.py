@@ -0,0 +1,63 @@
+"""Guards for FastAPI's Pydantic-core JSON fast path.
+
+Routes with a response_model and the default response class are serialized
+straight to JSON bytes by pydantic-core. A custom response_class (such as
+ORJSONResponse) or a missing response_model drops back to jsonable_encoder
+plus json.dumps.
+"""
+
+from fastapi.datastructures import DefaultPlaceholder
+from fastapi.routing import APIRoute
+
+from app.main import app
+
+
+# Routes that return a Response themselves, bypassing response_model on purpose
+_STREAMING_ENDPOINTS = {"stream_match_events"}
+
+
+def _api_routes(routes=None, prefix=""):
+    """(full path, route) pairs.
+
+    Included routers may be kept nested rather than flattened into
+    app.routes, with route paths relative to the include prefixes.
+    """
+    found = []
+    for route in app.routes if routes is None else routes:
+        if isinstance(route, APIRoute):
+            found.append((prefix + route.path, route))
+        elif hasattr(route, "original_router"):
+            found.extend(_api_routes(
+                route.original_router.routes, prefix + route.include_context.prefix,
+            ))
+    return found
+
+
+def _json_routes():
+    routes = [r for _, r in _api_routes() if r.name not in _STREAMING_ENDPOINTS]
+    assert routes
+    return routes
+
+
+def test_every_route_declares_response_model():
+    missing = [r.path for r in _json_routes() if r.response_model is None]
+    assert missing == []
+
+
+def test_no_route_overrides_response_class():
+    overridden = [
+        r.path for r in _json_routes()
+        if not isinstance(r.response_class, DefaultPlaceholder)
+    ]
+    assert overridden == []
+
+
+def test_no_route_registered_twice():
+    # A second registration of a path/method is dead code that shadows or
+    # is shadowed by the first, and duplicates the OpenAPI operation
+    seen = [
+        (path, method)
+        for path, route in _api_routes()
+        for method in route.methods
+    ]
+    assert len(seen) == len(set(seen))
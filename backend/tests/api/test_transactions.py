@@ -42,3 +42,29 @@ def test_create_transaction():
 def test_read_transaction_not_found():
     response = client.get("/api/v1/transactions/999999")
     assert response.status_code == 404
+
+
+def test_update_and_read_transaction():
+    player = _create_player()
+    created = client.post(
+        "/api/v1/transactions/",
+        json={
+            "player_id": player["id"],
+            "amount": 5.0,
+            "currency": "USDC",
+            "tx_type": "deposit",
+            "status": "pending",
+            "provider": "mock"
+        }
+    ).json()
+
+    resp = client.put(f"/api/v1/transactions/{created['id']}", json={"status": "completed"})
+    assert resp.status_code == 200
+    assert resp.json()["status"] == "completed"
+
+    resp = client.get(f"/api/v1/transactions/{created['id']}")
+    assert resp.json()["status"] == "completed"
+    assert resp.json()["amount"] == 5.0
+
+    resp = client.get(f"/api/v1/transactions/player/{player['id']}")
+    assert [t["id"] for t in resp.json()] == [created["id"]]
@@ -0,0 +1,51 @@
+"""Tests for the in-process TTL cache."""
+
+from app.core import cache as cache_module
+from app.core.cache import TTLCache
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    c = TTLCache(ttl=5)
+    c.set("k", "v")
+
+    now[0] = 104.9
+    assert c.get("k") == "v"
+    now[0] = 105.0
+    assert c.get("k") is None
+
+
+def test_full_cache_evicts_oldest_entry():
+    c = TTLCache(ttl=60, maxsize=2)
+    c.set("a", 1)
+    c.set("b", 2)
+    c.set("c", 3)
+
+    assert c.get("a") is None
+    assert c.get("b") == 2
+    assert c.get("c") == 3
+
+
+def test_pop_and_clear_all_remove_entries():
+    c = TTLCache(ttl=60)
+    c.set("a", 1)
+    c.set("b", 2)
+
+    c.pop("a")
+    assert c.get("a") is None
+    cache_module.clear_all()
+    assert c.get("b") is None
+
+
+def test_pop_returns_live_value_only(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    c = TTLCache(ttl=5)
+    c.set("a", 1)
+    c.set("b", 2)
+
+    assert c.pop("a") == 1
+    assert c.pop("a") is None
+    now[0] = 105.0
+    assert c.pop("b") is None
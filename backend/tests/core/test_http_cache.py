@@ -0,0 +1,51 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.http_cache import ETagMiddleware, http_cache
+
+app = FastAPI()
+app.add_middleware(ETagMiddleware)
+
+
+@app.get("/cached")
+@http_cache(max_age=7)
+def cached():
+    return {"value": 1}
+
+
+@app.get("/plain")
+def plain():
+    return {"value": 1}
+
+
+client = TestClient(app)
+
+
+def test_cacheable_endpoint_gets_etag_and_cache_control():
+    resp = client.get("/cached")
+    assert resp.status_code == 200
+    assert resp.json() == {"value": 1}
+    assert resp.headers["cache-control"] == "private, max-age=7"
+    assert resp.headers["etag"].startswith('"')
+
+
+def test_matching_if_none_match_returns_304():
+    etag = client.get("/cached").headers["etag"]
+
+    resp = client.get("/cached", headers={"If-None-Match": f'"stale", W/{etag}'})
+
+    assert resp.status_code == 304
+    assert resp.content == b""
+    assert resp.headers["etag"] == etag
+
+
+def test_stale_etag_returns_full_body():
+    resp = client.get("/cached", headers={"If-None-Match": '"stale"'})
+    assert resp.status_code == 200
+    assert resp.json() == {"value": 1}
+
+
+def test_unmarked_endpoint_passes_through():
+    resp = client.get("/plain")
+    assert resp.status_code == 200
+    assert "etag" not in resp.headers
@@ -1,8 +1,10 @@
-from sqlalchemy.orm import Session
+import pytest
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import Session, joinedload
 
 from app.crud.character import crud_character
 from app.schemas.character import CharacterCreate
-from app.models.models import Character
+from app.models.models import Character, Player
 
 
 def test_create_character(db_session: Session, test_player):
@@ -24,7 +26,7 @@ def test_get_character(db_session: Session, test_character: Character):
 
 
 def test_get_by_player_id(db_session: Session, test_character: Character):
-    characters = crud_character.get_by_player_id(db_session, player_id=test_character.player_id)
+    characters = crud_character.get_by_player_id(db_session, player_id=test_character.player_id, limit=None)
     assert len(characters) > 0
     assert test_character.id in [c.id for c in characters]
 
@@ -36,6 +38,12 @@ def test_assign_to_match(db_session: Session, test_character: Character, test_ma
     assert updated_character.match_id == test_match.id
 
 
+def test_assign_to_match_missing_character(db_session: Session, test_match):
+    assert crud_character.assign_to_match(
+        db_session, character_id=999999, match_id=test_match.id
+    ) is None
+
+
 def test_set_alive_status(db_session: Session, test_character: Character):
     updated_character = crud_character.set_alive_status(
         db_session, character_id=test_character.id, is_alive=False
@@ -46,3 +54,68 @@ def test_set_alive_status(db_session: Session, test_character: Character):
         db_session, character_id=test_character.id, is_alive=True
     )
     assert updated_character.is_alive is True
+
+
+def test_get_multi_applies_loader_options(db_session: Session, test_character: Character):
+    characters = crud_character.get_multi(
+        db_session, options=[joinedload(Character.player_owner)]
+    )
+    loaded = next(c for c in characters if c.id == test_character.id)
+    assert "player_owner" in loaded.__dict__
+
+
+def test_get_multi_raises_on_lazy_load_when_strict(db_session: Session, test_character: Character, monkeypatch):
+    from app.core.config import settings
+
+    monkeypatch.setattr(settings, "STRICT_LOADING", True)
+    db_session.expunge_all()
+    characters = crud_character.get_multi(db_session)
+    with pytest.raises(InvalidRequestError):
+        characters[0].player_owner
+
+
+def test_count_by_match(db_session: Session, test_player, test_match):
+    other = Player(wallet_address="0xcounter", username="counter")
+    db_session.add(other)
+    db_session.flush()
+    db_session.add_all([
+        Character(name="A", player_id=test_player.id, match_id=test_match.id),
+        Character(name="B", player_id=test_player.id, match_id=test_match.id),
+        Character(name="C", player_id=other.id, match_id=test_match.id),
+        Character(name="D", player_id=other.id),
+    ])
+    db_session.commit()
+
+    assert crud_character.count_by_match(db_session, test_match.id) == 3
+    assert crud_character.count_by_match(db_session, test_match.id, player_id=other.id) == 1
+    assert crud_character.count_players_by_match(db_session, test_match.id) == 2
+
+
+def test_get_by_player_id_pages(db_session: Session, test_player):
+    created = [
+        crud_character.create_character(db_session, name=f"Pager {i}", player_id=test_player.id)
+        for i in range(3)
+    ]
+    first = crud_character.get_by_player_id(db_session, test_player.id, limit=2)
+    rest = crud_character.get_by_player_id(db_session, test_player.id, skip=2, limit=2)
+    assert [c.id for c in first + rest] == [c.id for c in created]
+
+
+def test_get_by_match_id_load_owner(db_session: Session, test_character: Character, test_match):
+    crud_character.assign_to_match(db_session, character_id=test_character.id, match_id=test_match.id)
+    db_session.expire_all()
+
+    characters = crud_character.get_by_match_id(db_session, test_match.id, limit=None, load_owner=True)
+
+    assert "player_owner" in characters[0].__dict__
+    assert characters[0].player_owner.id == test_character.player_id
+
+
+def test_player_owner_lazy_load_raises(db_session: Session, test_character: Character, test_match):
+    crud_character.assign_to_match(db_session, character_id=test_character.id, match_id=test_match.id)
+    db_session.expire_all()
+
+    characters = crud_character.get_by_match_id(db_session, test_match.id, limit=None)
+
+    with pytest.raises(InvalidRequestError):
+        characters[0].display_name
@@ -1,7 +1,7 @@
 from sqlalchemy.orm import Session
 
 from app.crud.match import crud_match
-from app.schemas.match import MatchCreate
+from app.schemas.match import MatchCreate, MatchUpdate
 from app.models.models import Match
 
 def test_create_match(db_session: Session):
@@ -34,7 +34,7 @@ def test_get_match(db_session: Session, test_match: Match):
     assert match.kill_award_rate == test_match.kill_award_rate
 
 def test_get_by_status(db_session: Session, test_match: Match):
-    matches = crud_match.get_by_status(db_session, status=test_match.status)
+    matches = crud_match.get_by_status(db_session, status=test_match.status, limit=None)
     assert len(matches) > 0
     assert test_match.id in [m.id for m in matches]
 
@@ -52,3 +52,17 @@ def test_set_winner(db_session: Session, test_match: Match, test_character):
     )
     
     assert updated_match.winner_character_id == test_character.id
+
+
+def test_update_by_id(db_session: Session, test_match: Match):
+    updated = crud_match.update_by_id(
+        db_session, id=test_match.id, obj_in=MatchUpdate(status="filling", entry_fee=2.0)
+    )
+    assert updated.id == test_match.id
+    assert updated.status == "filling"
+    assert updated.entry_fee == 2.0
+    assert updated.kill_award_rate == test_match.kill_award_rate
+
+
+def test_update_by_id_missing_row_returns_none(db_session: Session):
+    assert crud_match.update_by_id(db_session, id=999999, obj_in={"status": "filling"}) is None
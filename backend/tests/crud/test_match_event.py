@@ -1,5 +1,5 @@
 from app.crud.match_event import crud_match_event
-from app.models.models import Match, MatchEvent
+from app.models.models import Character, Match, MatchEvent, MatchEventCharacter, Player
 
 
 def _make_match(db_session, **overrides):
@@ -71,3 +71,50 @@ def test_get_by_match_id_returns_ordered_by_id(db_session):
     result = crud_match_event.get_by_match_id(db_session, match.id)
     ids = [e.id for e in result]
     assert ids == sorted(ids)
+
+
+def test_count_kills_by_player_covers_every_player_in_match(db_session):
+    match = _make_match(db_session)
+    p1 = Player(wallet_address="0xkiller", username="killer")
+    p2 = Player(wallet_address="0xvictim", username="victim")
+    db_session.add_all([p1, p2])
+    db_session.flush()
+    c1 = Character(name="A", player_id=p1.id, match_id=match.id)
+    c2 = Character(name="B", player_id=p1.id, match_id=match.id)
+    c3 = Character(name="L", player_id=p2.id, match_id=match.id)
+    p3 = Player(wallet_address="0xpacifist", username="pacifist")
+    db_session.add(p3)
+    db_session.flush()
+    c4 = Character(name="P", player_id=p3.id, match_id=match.id)
+    db_session.add_all([c1, c2, c3, c4])
+    db_session.commit()
+
+    for killer, victim in [(c1, c3), (c2, c3), (c3, c1)]:
+        e = _make_event(db_session, match.id)
+        e.affected_character_ids = f"{killer.id},{victim.id}"
+    story = _make_event(db_session, match.id)
+    story.event_type = "story"
+    story.affected_character_ids = str(c1.id)
+    db_session.commit()
+
+    assert crud_match_event.count_kills_by_player(db_session, match.id) == {
+        p1.id: 2, p2.id: 1, p3.id: 0,
+    }
+
+
+def test_affected_character_ids_are_normalized_in_order(db_session):
+    match = _make_match(db_session)
+    event = _make_event(db_session, match.id)
+    event.affected_character_ids = "7,3"
+    db_session.commit()
+    event.affected_character_ids = "5,9,2"
+    db_session.commit()
+
+    rows = (
+        db_session.query(MatchEventCharacter.position, MatchEventCharacter.character_id)
+        .filter(MatchEventCharacter.event_id == event.id)
+        .order_by(MatchEventCharacter.position)
+        .all()
+    )
+    assert rows == [(0, 5), (1, 9), (2, 2)]
+    assert crud_match_event.get_killer_ids(db_session, match.id) == [5]
@@ -0,0 +1,41 @@
+from decimal import Decimal
+
+import pytest
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import Session
+
+from app.crud.pending_payout import crud_pending_payout
+from app.schemas.pending_payout import PendingPayout as PendingPayoutSchema, PendingPayoutCreate
+
+
+def test_get_unsettled_by_player_serializes_without_lazy_loads(db_session: Session, test_player, test_match):
+    payout = crud_pending_payout.create(db_session, obj_in=PendingPayoutCreate(
+        match_id=test_match.id,
+        player_id=test_player.id,
+        payout_type="winner",
+        amount=Decimal("3.50"),
+    ))
+    payout_id, player_id = payout.id, test_player.id
+    db_session.expunge_all()
+
+    payouts = crud_pending_payout.get_unsettled_by_player(db_session, player_id)
+
+    assert [PendingPayoutSchema.model_validate(p).id for p in payouts] == [payout_id]
+    with pytest.raises(InvalidRequestError):
+        payouts[0].match
+
+
+def test_bulk_create_returns_rows_with_ids(db_session: Session, test_player, test_match):
+    payouts = crud_pending_payout.bulk_create(db_session, objs_in=[
+        PendingPayoutCreate(
+            match_id=test_match.id,
+            player_id=test_player.id,
+            payout_type=payout_type,
+            amount=Decimal("1.25"),
+        )
+        for payout_type in ("kill_award", "winner")
+    ])
+
+    assert all(p.id is not None for p in payouts)
+    assert [p.payout_type for p in payouts] == ["kill_award", "winner"]
+    assert crud_pending_payout.bulk_create(db_session, objs_in=[]) == []
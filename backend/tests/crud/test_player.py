@@ -1,7 +1,9 @@
 from sqlalchemy.orm import Session
 
+from app.core.cache import entity_cache
+from app.crud.base import as_schema
 from app.crud.player import crud_player
-from app.schemas.player import PlayerCreate, PlayerUpdate
+from app.schemas.player import Player as PlayerSchema, PlayerCreate, PlayerUpdate
 from app.models.models import Player
 
 
@@ -28,6 +30,16 @@ def test_create_player_auto_username(db_session: Session):
     assert player.username == f"Player_{wallet[:6]}"
 
 
+def test_create_if_not_exists_returns_none_on_duplicate_wallet(db_session: Session):
+    player_in = PlayerCreate(wallet_address="0xonce0000", username="once")
+    player = crud_player.create_if_not_exists(db_session, obj_in=player_in)
+
+    assert player is not None
+    assert player.username == "once"
+    assert player.balance == 0.0
+    assert crud_player.create_if_not_exists(db_session, obj_in=player_in) is None
+
+
 def test_get_player(db_session: Session, test_player: Player):
     player = crud_player.get(db_session, id=test_player.id)
     assert player
@@ -75,3 +87,35 @@ def test_add_kill(db_session: Session, test_player: Player):
     initial_kills = test_player.kills
     updated_player = crud_player.add_kill(db_session, player_id=test_player.id)
     assert updated_player.kills == initial_kills + 1
+
+
+def test_counters_on_missing_player_return_none(db_session: Session):
+    assert crud_player.update_player_balance(db_session, player_id=999999, amount=5.0) is None
+    assert crud_player.add_win(db_session, player_id=999999) is None
+
+
+def test_cached_lookups_bind_each_call_value(db_session: Session):
+    # The lambda statements are built once; each call must still bind its own value
+    a = crud_player.create(db_session, obj_in=PlayerCreate(wallet_address="0xlambda_a", username="lambda_a"))
+    b = crud_player.create(db_session, obj_in=PlayerCreate(wallet_address="0xlambda_b", username="lambda_b"))
+
+    assert crud_player.get_by_wallet_address(db_session, "0xlambda_a").id == a.id
+    assert crud_player.get_by_wallet_address(db_session, "0xlambda_b").id == b.id
+    assert crud_player.get_by_username(db_session, "lambda_b").id == b.id
+    assert crud_player.get_by_username(db_session, "missing") is None
+
+
+def test_as_schema_matches_model_validate(db_session: Session, test_player: Player):
+    fast = as_schema(PlayerSchema, test_player)
+
+    assert fast == PlayerSchema.model_validate(test_player)
+    assert fast.model_dump_json() == PlayerSchema.model_validate(test_player).model_dump_json()
+
+
+def test_counters_evict_cached_player(db_session: Session, test_player: Player):
+    key = ("player", test_player.id)
+    entity_cache.set(key, as_schema(PlayerSchema, test_player))
+
+    crud_player.add_kill(db_session, player_id=test_player.id)
+
+    assert entity_cache.get(key) is None
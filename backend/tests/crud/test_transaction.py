@@ -38,15 +38,45 @@ def test_get_transaction(db_session: Session, test_transaction: Transaction):
     assert transaction.amount == test_transaction.amount
 
 def test_get_by_player_id(db_session: Session, test_transaction: Transaction):
-    transactions = crud_transaction.get_by_player_id(db_session, player_id=test_transaction.player_id)
+    transactions = crud_transaction.get_by_player_id(db_session, player_id=test_transaction.player_id, limit=None)
     assert len(transactions) > 0
     assert test_transaction.id in [t.id for t in transactions]
 
+def test_get_by_player_id_keyset(db_session: Session, test_transaction: Transaction):
+    for _ in range(3):
+        crud_transaction.create(db_session, obj_in=TransactionCreate(
+            player_id=test_transaction.player_id, amount=1.0, currency="USDC",
+            tx_type="deposit", status="pending", provider="mock",
+        ))
+
+    first = crud_transaction.get_by_player_id(
+        db_session, player_id=test_transaction.player_id, limit=2, after_id=0
+    )
+    rest = crud_transaction.get_by_player_id(
+        db_session, player_id=test_transaction.player_id, limit=2, after_id=first[-1].id
+    )
+    ids = [t.id for t in first + rest]
+    assert ids == sorted(ids)
+    assert len(ids) == 4
+
 def test_get_by_status(db_session: Session, test_transaction: Transaction):
-    transactions = crud_transaction.get_by_status(db_session, status=test_transaction.status)
+    transactions = crud_transaction.get_by_status(db_session, status=test_transaction.status, limit=None)
     assert len(transactions) > 0
     assert test_transaction.id in [t.id for t in transactions]
 
+def test_get_by_status_pages(db_session: Session, test_transaction: Transaction):
+    crud_transaction.create(db_session, obj_in=TransactionCreate(
+        player_id=test_transaction.player_id, amount=1.0, currency="USDC",
+        tx_type="deposit", status=test_transaction.status, provider="mock",
+    ))
+
+    first = crud_transaction.get_by_status(db_session, test_transaction.status, limit=1, after_id=0)
+    rest = crud_transaction.get_by_status(
+        db_session, test_transaction.status, limit=1, after_id=first[0].id
+    )
+    assert len(first) == len(rest) == 1
+    assert first[0].id < rest[0].id
+
 def test_update_status(db_session: Session, test_transaction: Transaction):
     new_status = "failed"
     updated_transaction = crud_transaction.update_status(
@@ -54,3 +84,9 @@ def test_update_status(db_session: Session, test_transaction: Transaction):
     )
     
     assert updated_transaction.status == new_status
+
+def test_get_by_provider_tx_id(db_session: Session, test_transaction: Transaction):
+    crud_transaction.update_by_id(db_session, id=test_transaction.id, obj_in={"provider_tx_id": "0xabc"})
+
+    assert crud_transaction.get_by_provider_tx_id(db_session, "0xabc").id == test_transaction.id
+    assert crud_transaction.get_by_provider_tx_id(db_session, "0xdef") is None
@@ -0,0 +1,23 @@
+import pytest
+from sqlalchemy.orm import Session
+
+from app.db.session import transactional
+from app.models.models import Player
+
+
+def test_transactional_commits_on_success(db_session: Session):
+    with transactional(db_session):
+        db_session.add(Player(wallet_address="0xcommit", username="committed"))
+
+    db_session.expunge_all()
+    assert db_session.query(Player).filter_by(wallet_address="0xcommit").one()
+
+
+def test_transactional_rolls_back_on_error(db_session: Session):
+    with pytest.raises(RuntimeError):
+        with transactional(db_session):
+            db_session.add(Player(wallet_address="0xrollback", username="rolled_back"))
+            db_session.flush()
+            raise RuntimeError("boom")
+
+    assert db_session.query(Player).filter_by(wallet_address="0xrollback").first() is None
@@ -0,0 +1,32 @@
+from unittest.mock import patch
+
+import pytest
+from pydantic import ValidationError
+
+from app.core.cache import entity_cache
+from app.services.auth import dependencies
+from app.services.auth.dependencies import get_current_player
+
+
+@pytest.fixture(autouse=True)
+def _clear_entity_cache():
+    entity_cache.clear()
+    yield
+    entity_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_get_current_player_reuses_snapshot(db_session, test_player):
+    payload = {"wallet_address": test_player.wallet_address, "player_id": test_player.id}
+
+    with patch.object(dependencies._auth_provider, "verify_token", return_value=payload), \
+            patch.object(dependencies.crud_player, "get", wraps=dependencies.crud_player.get) as get:
+        first = await get_current_player(token="t", db=db_session)
+        second = await get_current_player(token="t", db=db_session)
+
+    assert first.id == second.id == test_player.id
+    assert first.username == test_player.username
+    assert get.call_count == 1
+    # The snapshot is shared across requests, so it must not be mutable
+    with pytest.raises(ValidationError):
+        first.balance = 0
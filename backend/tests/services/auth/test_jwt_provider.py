@@ -0,0 +1,74 @@
+import pytest
+
+from app.core.cache import verified_tokens_cache
+from app.services.auth import jwt_provider
+from app.services.auth.jwt_provider import JWTAuthProvider
+
+
+@pytest.fixture(autouse=True)
+def _clear_token_cache(monkeypatch):
+    monkeypatch.setattr(jwt_provider.settings, "SECRET_KEY", "k" * 32)
+    verified_tokens_cache.clear()
+    yield
+    verified_tokens_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_verify_token_round_trip():
+    provider = JWTAuthProvider()
+    token = await provider.generate_token("0xabc", 7)
+
+    assert await provider.verify_token(token) == {"wallet_address": "0xabc", "player_id": 7}
+
+
+@pytest.mark.asyncio
+async def test_verify_token_decodes_once_while_cached(monkeypatch):
+    provider = JWTAuthProvider()
+    token = await provider.generate_token("0xabc", 7)
+    calls = []
+    decode = jwt_provider.jwt.decode
+
+    def counting_decode(*args, **kwargs):
+        calls.append(1)
+        return decode(*args, **kwargs)
+
+    monkeypatch.setattr(jwt_provider.jwt, "decode", counting_decode)
+
+    await provider.verify_token(token)
+    payload = await provider.verify_token(token)
+
+    assert payload["player_id"] == 7
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_verify_token_rejects_expired_cached_entry(monkeypatch):
+    provider = JWTAuthProvider()
+    token = await provider.generate_token("0xabc", 7)
+    await provider.verify_token(token)
+
+    monkeypatch.setattr(jwt_provider.time, "time", lambda: float("inf"))
+
+    assert await provider.verify_token(token) is None
+
+
+@pytest.mark.asyncio
+async def test_verify_token_invalid():
+    assert await JWTAuthProvider().verify_token("not-a-token") is None
+
+
+@pytest.mark.asyncio
+async def test_challenge_nonce_is_single_use(monkeypatch):
+    provider = JWTAuthProvider()
+    nonce = await provider.create_challenge("0xABC")
+
+    class _Wallet:
+        async def verify_signature(self, addr, message, signature):
+            return True
+
+    monkeypatch.setattr(
+        jwt_provider.BlockchainServiceFactory, "get_wallet_provider", lambda: _Wallet(),
+    )
+
+    assert await provider.verify_challenge("0xabc", "sig", nonce) is True
+    assert await provider.verify_challenge("0xabc", "sig", nonce) is False
@@ -100,6 +100,15 @@ class TestPurchaseCharacters:
         assert all(oc.player_id == player.id for oc in result)
         assert all(oc.is_alive is True for oc in result)
 
+    @pytest.mark.asyncio
+    async def test_created_characters_are_persisted(self, service, db_session, player):
+        result = await service.purchase_characters(db_session, player.id, 3, "0xabc123")
+        ids = [oc.id for oc in result]
+        assert len(set(ids)) == 3
+        stored = db_session.query(OwnedCharacter).filter(OwnedCharacter.player_id == player.id).all()
+        assert sorted(oc.id for oc in stored) == sorted(ids)
+        assert all(oc.created_at is not None for oc in result)
+
     @pytest.mark.asyncio
     async def test_quantity_below_min_raises(self, service, db_session, player):
         with pytest.raises(ValueError, match="quantity"):
@@ -0,0 +1,34 @@
+import asyncio
+import threading
+
+import pytest
+
+from app.models.models import Match, MatchEvent
+from app.services.match_event_stream import MatchEventNotifier, match_event_notifier
+
+
+@pytest.mark.asyncio
+async def test_notify_from_another_thread_wakes_subscriber():
+    notifier = MatchEventNotifier()
+    with notifier.subscribe(1) as wakeup:
+        threading.Thread(target=notifier.notify, args=(1,)).start()
+        await asyncio.wait_for(wakeup.wait(), 1)
+    assert notifier._subscribers == {}
+
+
+@pytest.mark.asyncio
+async def test_commit_of_new_event_notifies_its_match(db_session):
+    match = Match(entry_fee=1.0, kill_award_rate=0.1, start_method="cap", start_threshold=10)
+    db_session.add(match)
+    db_session.commit()
+
+    with match_event_notifier.subscribe(match.id) as wakeup:
+        db_session.add(MatchEvent(
+            match_id=match.id, round_number=1, event_type="story", scenario_text="x",
+        ))
+        db_session.flush()
+        await asyncio.sleep(0)
+        assert not wakeup.is_set()
+
+        db_session.commit()
+        await asyncio.wait_for(wakeup.wait(), 1)
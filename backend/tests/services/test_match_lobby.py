@@ -6,9 +6,10 @@ from sqlalchemy.pool import StaticPool
 
 from app.db.base_class import Base
 from app.models.models import (
-    Character, Match, MatchEvent, MatchJoinRequest, OwnedCharacter, Player,
+    Character, Match, MatchEvent, MatchJoinRequest, MatchJoinRequestCharacter,
+    OwnedCharacter, Player,
 )
-from app.services.match_lobby import MatchLobbyService
+from app.services.match_lobby import MatchLobbyService, get_match_lobby_service
 
 
 @pytest.fixture
@@ -314,6 +315,11 @@ class TestJoinMatch:
         assert chars[0].entry_order == 1
         assert chars[0].player_id == player.id
 
+        links = db_session.query(MatchJoinRequestCharacter).filter(
+            MatchJoinRequestCharacter.join_request_id == jr.id
+        ).all()
+        assert [link.owned_character_id for link in links] == [oc.id]
+
     @pytest.mark.asyncio
     async def test_rejects_non_filling_match(self, service, db_session, player):
         match = _make_filling_match(db_session, status="pending")
@@ -732,3 +738,16 @@ class TestCalculateAndStorePayouts:
 
         assert all(p.payout_type == "kill_award" for p in payouts)
         assert not any(p.payout_type == "winner" for p in payouts)
+
+
+def test_get_match_lobby_service_reuses_instance_until_config_changes(mock_payment):
+    other_config = MagicMock(protocol_fee_tiers={1: 8})
+    with patch(
+        "app.services.match_lobby.BlockchainServiceFactory.get_payment_provider",
+        return_value=mock_payment,
+    ), patch("app.services.match_lobby.load_config", return_value=MOCK_CONFIG) as load:
+        first = get_match_lobby_service()
+        assert get_match_lobby_service() is first
+
+        load.return_value = other_config
+        assert get_match_lobby_service() is not first
@@ -0,0 +1,23 @@
+"""Tests for the protocol fee rate table in payout_calculator."""
+
+from app.services.payout_calculator import protocol_fee_rate, protocol_fee_rates
+
+
+TIERS = {1: 10.0, 2: 8.0, 3: 6.0}
+
+
+def test_rates_indexed_by_char_count():
+    rates = protocol_fee_rates(TIERS)
+    assert protocol_fee_rate(rates, 1) == 0.10
+    assert protocol_fee_rate(rates, 2) == 0.08
+    assert protocol_fee_rate(rates, 3) == 0.06
+
+
+def test_counts_above_highest_tier_use_highest_tier():
+    rates = protocol_fee_rates(TIERS)
+    assert protocol_fee_rate(rates, 7) == 0.06
+
+
+def test_missing_tier_falls_back_to_highest_tier():
+    rates = protocol_fee_rates({1: 10.0, 3: 6.0})
+    assert protocol_fee_rate(rates, 2) == 0.06
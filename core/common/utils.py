@@ -1,36 +1,17 @@
 import random
-from typing import Optional, TypeVar, List
+from typing import List, Optional
 
-T = TypeVar('T')
+class SeedableRandom(random.Random):
+    """Seedable source of randomness for match simulation.
 
-class SeedableRandom:
-    """A wrapper around random.Random for seedable randomness."""
-    def __init__(self, seed: Optional[int] = None):
-        self._random = random.Random()
-        if seed is not None:
-            self.seed(seed)
-
-    def seed(self, seed: int):
-        self._random.seed(seed)
-
-    def choice(self, seq: List[T]) -> T:
-        return self._random.choice(seq)
-
-    def sample(self, population: List[T], k: int) -> List[T]:
-        return self._random.sample(population, k)
-
-    def choices(self, population: List[T], weights: Optional[List[float]] = None, k: int = 1) -> List[T]:
-        return self._random.choices(population, weights=weights, k=k)
-
-    def uniform(self, a: float, b: float) -> float:
-        return self._random.uniform(a, b)
-
-    def randint(self, a: int, b: int) -> int:
-        return self._random.randint(a, b)
+    Subclasses random.Random rather than wrapping it, so choice/sample/
+    choices/random/uniform/randint dispatch straight to the C-backed
+    Mersenne Twister without an extra Python frame per draw. Seeding with
+    None draws entropy from the OS, as random.Random does.
+    """
 
-    def random(self) -> float:
-        """Return the next random floating point number in the range [0.0, 1.0)."""
-        return self._random.random()
+    def __init__(self, seed: Optional[int] = None):
+        super().__init__(seed)
 
 CHARACTER_NAMES = [
     "Ace", "Bandit", "Calamity", "Deadeye", "Echo", "Flint", "Ghost", "Hazard",
@@ -60,3 +41,22 @@ def get_next_character_name() -> str:
 
 
 
+
+def get_next_character_names(n: int) -> List[str]:
+    """
+    Get the next n character names in one call, advancing the sequence by n.
+    Equivalent to calling get_next_character_name() n times.
+    
+    Args:
+        n: Number of names to take
+    
+    Returns:
+        List[str]: The character names, in sequence order
+    """
+    global _name_index
+    size = len(CHARACTER_NAMES)
+    start = _name_index % size
+    # Repeat the list enough times to cover any wrap-around, then slice once
+    names = (CHARACTER_NAMES * ((start + n) // size + 1))[start:start + n]
+    _name_index += n
+    return names
@@ -4,5 +4,5 @@ This package contains configuration loading utilities and logging configuration
 for the project.
 """
 
-from .config_loader import load_config
+from .config_loader import clear_config_cache, load_config
 from .logging_config import JSONFormatter
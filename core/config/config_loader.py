@@ -1,4 +1,5 @@
 import os
+from typing import Dict, Tuple
 
 import yaml
 
@@ -9,16 +10,38 @@ DEFAULT_CONFIG_PATH = os.getenv(
     os.path.join(os.path.dirname(__file__), "..", "..", "config.yaml"),
 )
 
+# Parsed configs keyed by path, tagged with the file's mtime at parse time
+_config_cache: Dict[str, Tuple[int, GameConfig]] = {}
+
 
 def load_config(config_path: str = DEFAULT_CONFIG_PATH) -> GameConfig:
-    """Loads game configuration from a YAML file and returns a typed GameConfig."""
+    """Loads game configuration from a YAML file and returns a typed GameConfig.
+
+    The parsed config is cached per path and only re-read when the file's
+    mtime changes, so repeated calls cost a single stat().
+    """
     try:
+        mtime = os.stat(config_path).st_mtime_ns
+        cached = _config_cache.get(config_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
         with open(config_path, "r") as f:
             raw = yaml.safe_load(f)
         if not isinstance(raw, dict):
             raise ValueError("Config file is not a valid YAML dictionary.")
-        return GameConfig(**raw)
+        config = GameConfig(**raw)
+        _config_cache[config_path] = (mtime, config)
+        return config
     except FileNotFoundError:
         raise FileNotFoundError(f"Configuration file not found at: {config_path}")
     except yaml.YAMLError as e:
         raise ValueError(f"Error parsing configuration file: {e}")
+
+
+def clear_config_cache() -> None:
+    """Drops every cached config so the next load_config() re-reads its file.
+
+    For reloads the mtime check can't see, e.g. a config swapped in with its
+    original timestamp preserved.
+    """
+    _config_cache.clear()
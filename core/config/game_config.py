@@ -1,20 +1,27 @@
 from typing import Dict
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class ExtraEvents(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     non_lethal_story_chance: float
     extra_lethal_base_chance: float
     comeback_base_chance: float
 
 
 class LethalModifiers(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     cap_8_plus: float
     cap_12_plus: float
 
 
 class GameConfig(BaseModel):
+    # load_config() hands the same cached instance to every caller
+    model_config = ConfigDict(frozen=True)
+
     scenario_dir: str
 
     min_fee: float
@@ -44,5 +51,3 @@ class GameConfig(BaseModel):
     round_delay_enabled: bool = False
     round_delay_min: float = 5.0
     round_delay_max: float = 10.0
-
-
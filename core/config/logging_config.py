@@ -1,6 +1,22 @@
 import logging
 import json
 
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:  # orjson is optional; stdlib json is the fallback
+    def _dumps(obj) -> str:
+        return json.dumps(obj)
+
+# LogRecord attributes that are not user-supplied extras
+_RESERVED_ATTRS = frozenset((
+    "msg", "args", "levelname", "levelno", "pathname", "filename", "module",
+    "exc_info", "exc_text", "stack_info", "lineno", "funcName", "created",
+    "msecs", "relativeCreated", "thread", "threadName", "processName", "process",
+))
+
 class JSONFormatter(logging.Formatter):
     def format(self, record):
         base = {
@@ -10,6 +26,6 @@ class JSONFormatter(logging.Formatter):
         }
         # record.extra already merged by logging library
         for k, v in record.__dict__.items():
-            if k not in ("msg","args","levelname","levelno","pathname","filename","module","exc_info","exc_text","stack_info","lineno","funcName","created","msecs","relativeCreated","thread","threadName","processName","process"):
+            if k not in _RESERVED_ATTRS:
                 base[k] = v
-        return json.dumps(base)
+        return _dumps(base)
@@ -9,4 +9,4 @@ from .repository import MatchRepo, SqlMatchRepo
 from .event_repository import EventRepo, SqlEventRepo
 from .service import MatchService
 from .engine import MatchEngine
-from .scenario_loader import load_scenarios, EVENT_TYPE_TO_CATEGORY
+from .scenario_loader import load_scenarios, get_scenarios, EVENT_TYPE_TO_CATEGORY
@@ -1,7 +1,8 @@
 import re
 import time
 import logging
-from typing import List, Dict, Any, Optional
+from collections import Counter
+from typing import Callable, List, Dict, Any, Optional, Sequence
 
 from backend.app.models.models import Character, OwnedCharacter
 from ..player.repository import PlayerRepo
@@ -15,17 +16,21 @@ from ..common.exceptions import InsufficientParticipantsError, CriticalMatchErro
 
 logger = logging.getLogger(__name__)
 
+# Matches scenario placeholders like "[Character A]", capturing the letter
+_PLACEHOLDER_RE = re.compile(r"\[Character ([A-Z])\]")
+
 class MatchEngine:
     def __init__(self,
                  match_id: int,
                  config: Dict[str, Any],
-                 scenarios: Dict[str, List[Dict[str, str]]],
+                 scenarios: Dict[str, Sequence[Dict[str, str]]],
                  player_repo: PlayerRepo,
                  character_repo: CharacterRepo,
                  match_repo: MatchRepo,
                  event_repo: EventRepo,
                  item_repo: ItemRepo,
-                 random_seed: Optional[int] = None):
+                 random_seed: Optional[int] = None,
+                 on_round_end: Optional[Callable[[], None]] = None):
          # map event types → their effect‐handler methods
         self._effect_handlers = {
             "direct_kill":          self._handle_direct_kill,
@@ -46,6 +51,9 @@ class MatchEngine:
         self.event_repo = event_repo
         self.item_repo = item_repo
         self.random = SeedableRandom(random_seed)
+        # Called after each round's writes; the caller decides whether that
+        # is a transaction boundary
+        self.on_round_end = on_round_end
 
         self.match = self.match_repo.get_match_by_id(match_id)
         if not self.match:
@@ -60,7 +68,10 @@ class MatchEngine:
         self.alive_pool: Dict[int, Character] = {}
         self.dead_pool: Dict[int, Character] = {}
         self.round_number = 0
+        self.kills_by_player: Counter = Counter()
         self.match_log: List[str] = [] # Simple text log for printing simulation
+        # Debug records are built per event; skip constructing them unless enabled
+        self._debug = logger.isEnabledFor(logging.DEBUG)
 
         logger.info(
             "engine_initialized",
@@ -93,8 +104,7 @@ class MatchEngine:
 
     def _get_placeholder_count(self, text: str) -> int:
         """Counts unique placeholders like [Character A], [Character B] etc."""
-        placeholders = set(re.findall(r"\[Character ([A-Z])\]", text))
-        return len(placeholders)
+        return len(set(_PLACEHOLDER_RE.findall(text)))
 
     def _select_participants(self, count: int, source_pool: Dict[int, Character]) -> List[Character]:
         """Selects distinct participants uniformly from the given pool."""
@@ -108,7 +118,7 @@ class MatchEngine:
         """Substitutes [Character A], [B]... with participant display names.
         If there aren’t enough participants, raises InsufficientParticipantsError."""
         substituted_text = text
-        placeholders = sorted(set(re.findall(r"(\[Character [A-Z]\])", text)))
+        placeholders = [f"[Character {letter}]" for letter in sorted(set(_PLACEHOLDER_RE.findall(text)))]
         if len(participants) < len(placeholders):
             raise InsufficientParticipantsError(
                 f"{len(participants)} participants for {len(placeholders)} placeholders in '{text}'"
@@ -165,9 +175,8 @@ class MatchEngine:
         if len(participants) >= 2:
             victim, killer = participants[1], participants[0]
             self._apply_elimination(victim)
-            player = self.player_repo.get_player_by_id(killer.player_id)
-            if player:
-                self.player_repo.add_kill(player.id)
+            # Credited in one batch when the match ends
+            self.kills_by_player[killer.player_id] += 1
 
     def _handle_self_event(self, participants: List[Character]):
         # participants[0] is self-eliminated
@@ -194,22 +203,24 @@ class MatchEngine:
             self._apply_revival(participants[0])
 
     def _handle_story_event(self, participants: List[Character]):
-        logger.debug(
-            "story_no_pool_change",
-            extra={"match_id": self.match_id, "round": self.round_number}
-        )
+        if self._debug:
+            logger.debug(
+                "story_no_pool_change",
+                extra={"match_id": self.match_id, "round": self.round_number}
+            )
 
 
     def _process_event(self, event_type: str):
         """Handles a single event: sampling, substitution, application, logging."""
-        logger.debug(
-            "processing_event_type",
-            extra={
-            "match_id":    self.match_id,
-            "round":       self.round_number,
-            "event_type":  event_type
-            }
-        )
+        if self._debug:
+            logger.debug(
+                "processing_event_type",
+                extra={
+                "match_id":    self.match_id,
+                "round":       self.round_number,
+                "event_type":  event_type
+                }
+            )
         is_comeback = event_type == "comeback"
 
         # --- Determine Scenario Category --- 
@@ -278,14 +289,15 @@ class MatchEngine:
                     )
                     return
             else:
-                logger.debug(
-                    "comeback_no_dead_pool",
-                    extra={
-                        "match_id":   self.match_id,
-                        "round":      self.round_number,
-                        "event_type": event_type
-                    }
-                )
+                if self._debug:
+                    logger.debug(
+                        "comeback_no_dead_pool",
+                        extra={
+                            "match_id":   self.match_id,
+                            "round":      self.round_number,
+                            "event_type": event_type
+                        }
+                    )
                 return
         elif placeholder_count > 0:
             try:
@@ -387,7 +399,8 @@ class MatchEngine:
 
         if normalized_weights:
             primary_event_type = self.random.choices(allowed_primary_events, weights=normalized_weights, k=1)[0]
-            logger.debug("primary_event_chosen", extra={"match_id": self.match_id, "round": self.round_number, "event_type": primary_event_type})
+            if self._debug:
+                logger.debug("primary_event_chosen", extra={"match_id": self.match_id, "round": self.round_number, "event_type": primary_event_type})
             self._process_event(primary_event_type)
         else:
             logger.error(
@@ -404,10 +417,11 @@ class MatchEngine:
 
         # 2a. Extra Non-Lethal Story
         if self.random.random() < extra_config.non_lethal_story_chance:
-            logger.debug(
-            "extra_non_lethal_story_triggered",
-            extra={"match_id": self.match_id, "round": self.round_number}
-            )
+            if self._debug:
+                logger.debug(
+                "extra_non_lethal_story_triggered",
+                extra={"match_id": self.match_id, "round": self.round_number}
+                )
             self._process_event("non_lethal_story")
             if len(self.alive_pool) <= 1:
                 return
@@ -421,10 +435,11 @@ class MatchEngine:
                 lethal_chance += self.config.lethal_modifiers.cap_8_plus
             
             if self.random.random() < lethal_chance:
-                logger.debug(
-                "extra_lethal_triggered",
-                extra={"match_id": self.match_id, "round": self.round_number}
-                )
+                if self._debug:
+                    logger.debug(
+                    "extra_lethal_triggered",
+                    extra={"match_id": self.match_id, "round": self.round_number}
+                    )
                 self._process_event("extra_lethal")
                 if len(self.alive_pool) <= 1:
                     return
@@ -432,10 +447,11 @@ class MatchEngine:
         # 2c. Comeback
         if self.dead_pool: # Cannot occur if dead pool is empty
             if self.random.random() < extra_config.comeback_base_chance:
-                logger.debug(
-                "extra_comeback_triggered",
-                extra={"match_id": self.match_id, "round": self.round_number}
-                )
+                if self._debug:
+                    logger.debug(
+                    "extra_comeback_triggered",
+                    extra={"match_id": self.match_id, "round": self.round_number}
+                    )
                 self._process_event("comeback")
                 # No need to check alive pool count here, comeback increases it
         
@@ -447,6 +463,7 @@ class MatchEngine:
 
     def run_match(self, participants: List[Character]):
         """Runs the full match simulation."""
+        self._debug = logger.isEnabledFor(logging.DEBUG)
         logger.info(
             "match_started",
             extra={
@@ -459,6 +476,7 @@ class MatchEngine:
         self.alive_pool = {char.id: char for char in participants}
         self.dead_pool = {}
         self.round_number = 0
+        self.kills_by_player = Counter()
 
         # Update match status and start time in DB
         self.match_repo.update_match_status(self.match_id, "active")
@@ -466,6 +484,8 @@ class MatchEngine:
 
         while len(self.alive_pool) > 1:
             self._run_round()
+            if self.on_round_end is not None:
+                self.on_round_end()
             if self.config.round_delay_enabled:
                 delay = self.random.uniform(
                     self.config.round_delay_min,
@@ -506,6 +526,8 @@ class MatchEngine:
             )
             self.match_log.append("\n--- Match Over --- Error: No single winner! ---")
 
+        self.player_repo.add_kills(dict(self.kills_by_player))
+
         # Update match status and end time
         self.match_repo.update_match_status(self.match_id, "completed")
         self.match_repo.set_match_end_time(self.match_id)
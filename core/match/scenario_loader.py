@@ -1,9 +1,18 @@
 import json
 import os
-from typing import Dict, List
+from typing import Dict, List, Sequence, Tuple
 import logging
 from ..config.config_loader import load_config
 
+try:
+    import orjson
+
+    def _parse_json(raw: bytes):
+        return orjson.loads(raw)
+except ImportError:  # orjson is optional; stdlib json is the fallback
+    def _parse_json(raw: bytes):
+        return json.loads(raw)
+
 logger = logging.getLogger(__name__)
 
 config = load_config()
@@ -49,8 +58,8 @@ def load_scenarios(scenario_dir: str = SCENARIO_DIR) -> Dict[str, List[Dict[str,
 
         for category, filepath in scenario_files.items():
             try:
-                with open(filepath, "r") as f:
-                    data = json.load(f)
+                with open(filepath, "rb") as f:
+                    data = _parse_json(f.read())
                     if isinstance(data, list):
                         # Expecting a list of objects, each with at least a 'text' field
                         valid_scenarios = []
@@ -130,3 +139,37 @@ def load_scenarios(scenario_dir: str = SCENARIO_DIR) -> Dict[str, List[Dict[str,
         )
         return {category: [] for category in EXPECTED_CATEGORIES}
 
+
+
+# Loaded scenario sets keyed by directory, tagged with the newest file mtime
+_scenario_cache: Dict[str, Tuple[int, Dict[str, Sequence[Dict[str, str]]]]] = {}
+
+
+def _scenario_dir_mtime(scenario_dir: str) -> int:
+    with os.scandir(scenario_dir) as entries:
+        return max(
+            (e.stat().st_mtime_ns for e in entries if e.name.endswith(".json")),
+            default=0,
+        )
+
+
+def get_scenarios(scenario_dir: str = SCENARIO_DIR) -> Dict[str, Sequence[Dict[str, str]]]:
+    """Returns the scenarios for a directory, loading them at most once.
+
+    Every caller shares the same instance, so each category is frozen into a
+    tuple; callers must treat the scenario dicts as read-only. The set is
+    re-read only when a scenario file in the directory changes.
+    """
+    try:
+        mtime = _scenario_dir_mtime(scenario_dir)
+    except FileNotFoundError:
+        return load_scenarios(scenario_dir)
+    cached = _scenario_cache.get(scenario_dir)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    scenarios = {
+        category: tuple(items)
+        for category, items in load_scenarios(scenario_dir).items()
+    }
+    _scenario_cache[scenario_dir] = (mtime, scenarios)
+    return scenarios
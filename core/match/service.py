@@ -166,11 +166,10 @@ class MatchService:
         
         character = self.character_repo.create_character(
             name=f"Default_{player.username}_{match_id}",
-            player_id=player.id
+            player_id=player.id,
+            match_id=match_id
         )
         
-        self.character_repo.assign_character_to_match(character.id, match_id)
-        
         logger.info(
             "default_character_assigned",
             extra={
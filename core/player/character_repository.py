@@ -13,13 +13,14 @@ class CharacterRepo(BaseRepo):
     """Repository interface for character operations."""
     
     @abstractmethod
-    def create_character(self, name: str, player_id: int) -> Character:
+    def create_character(self, name: str, player_id: int, match_id: Optional[int] = None) -> Character:
         """
         Create a new character.
         
         Args:
             name: The character's name
             player_id: ID of the owner player
+            match_id: Optional ID of the match to enter the character into
             
         Returns:
             The created Character object
@@ -84,8 +85,8 @@ class CharacterRepo(BaseRepo):
 class SqlCharacterRepo(CharacterRepo):
     """SQL implementation of CharacterRepo interface."""
     
-    def create_character(self, name: str, player_id: int) -> Character:
-        db_character = Character(name=name, player_id=player_id)
+    def create_character(self, name: str, player_id: int, match_id: Optional[int] = None) -> Character:
+        db_character = Character(name=name, player_id=player_id, match_id=match_id)
         self.db.add(db_character)
         self.db.flush()
         return db_character
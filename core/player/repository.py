@@ -2,10 +2,12 @@
 Player repository implementation for database operations related to players.
 """
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from abc import abstractmethod
 
+from sqlalchemy import case, update
+
 from ..common.repository import BaseRepo
 from backend.app.models.models import Player, PlayerItem
 
@@ -40,6 +42,10 @@ class PlayerRepo(BaseRepo):
     def add_kill(self, player_id: int) -> Optional[Player]:
         pass
 
+    @abstractmethod
+    def add_kills(self, kills_by_player: Dict[int, int]) -> None:
+        pass
+
     @abstractmethod
     def add_earnings(self, player_id: int, amount: float) -> Optional[Player]:
         pass
@@ -86,29 +92,38 @@ class SqlPlayerRepo(PlayerRepo):
             player = self.create_player(wallet_address, username)
         return player
 
+    def _increment(self, player_id: int, **values) -> Optional[Player]:
+        # Single UPDATE ... RETURNING so the arithmetic happens in SQL and
+        # concurrent matches can't lose each other's increments
+        return self.db.scalars(
+            update(Player)
+            .where(Player.id == player_id)
+            .values(**values)
+            .returning(Player)
+        ).one_or_none()
+
     def update_player_balance(self, player_id: int, amount_change: float) -> Optional[Player]:
-        player = self.db.query(Player).filter(Player.id == player_id).first()
-        if player:
-            player.balance += amount_change
-        return player
+        return self._increment(player_id, balance=Player.balance + amount_change)
 
     def add_win(self, player_id: int) -> Optional[Player]:
-        player = self.db.query(Player).filter(Player.id == player_id).first()
-        if player:
-            player.wins += 1
-        return player
+        return self._increment(player_id, wins=Player.wins + 1)
 
     def add_kill(self, player_id: int) -> Optional[Player]:
-        player = self.db.query(Player).filter(Player.id == player_id).first()
-        if player:
-            player.kills += 1
-        return player
+        return self._increment(player_id, kills=Player.kills + 1)
+
+    def add_kills(self, kills_by_player: Dict[int, int]) -> None:
+        # One UPDATE ... SET kills = kills + CASE id WHEN ... for every killer
+        # in the match, instead of one UPDATE per kill
+        if not kills_by_player:
+            return
+        self.db.execute(
+            update(Player)
+            .where(Player.id.in_(kills_by_player))
+            .values(kills=Player.kills + case(kills_by_player, value=Player.id, else_=0))
+        )
 
     def add_earnings(self, player_id: int, amount: float) -> Optional[Player]:
-        player = self.db.query(Player).filter(Player.id == player_id).first()
-        if player:
-            player.total_earnings += amount
-        return player
+        return self._increment(player_id, total_earnings=Player.total_earnings + amount)
 
     def get_player_inventory(self, player_id: int) -> List[PlayerItem]:
         return self.db.query(PlayerItem).filter(PlayerItem.player_id == player_id).all()
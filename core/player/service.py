@@ -57,11 +57,10 @@ class CharacterService:
         
         character = self.character_repo.create_character(
             name=character_name,
-            player_id=player.id
+            player_id=player.id,
+            match_id=match_id
         )
         
-        self.character_repo.assign_character_to_match(character.id, match_id)
-        
         self.player_repo.update_player_balance(player.id, -match.entry_fee)
         
         logger.info(
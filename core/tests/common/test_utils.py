@@ -0,0 +1,16 @@
+"""Tests for character name sequencing."""
+
+from core.common import utils
+from core.common.utils import CHARACTER_NAMES, get_next_character_name, get_next_character_names
+
+
+def test_bulk_names_match_repeated_single_calls(monkeypatch):
+    count = len(CHARACTER_NAMES) + 5  # forces a wrap-around
+
+    monkeypatch.setattr(utils, "_name_index", 40)
+    expected = [get_next_character_name() for _ in range(count)]
+    expected_index = utils._name_index
+
+    monkeypatch.setattr(utils, "_name_index", 40)
+    assert get_next_character_names(count) == expected
+    assert utils._name_index == expected_index
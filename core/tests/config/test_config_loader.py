@@ -0,0 +1,44 @@
+"""Tests for load_config caching."""
+
+import os
+
+import yaml
+
+from core.config.config_loader import clear_config_cache, load_config, DEFAULT_CONFIG_PATH
+
+
+def _write_config(path, **overrides):
+    with open(DEFAULT_CONFIG_PATH) as f:
+        raw = yaml.safe_load(f)
+    raw.update(overrides)
+    with open(path, "w") as f:
+        yaml.safe_dump(raw, f)
+
+
+def test_repeated_loads_return_cached_instance(tmp_path):
+    path = str(tmp_path / "config.yaml")
+    _write_config(path)
+    assert load_config(path) is load_config(path)
+
+
+def test_reloads_when_file_changes(tmp_path):
+    path = str(tmp_path / "config.yaml")
+    _write_config(path, listing_fee=0.1)
+    first = load_config(path)
+
+    _write_config(path, listing_fee=0.25)
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    second = load_config(path)
+    assert second is not first
+    assert second.listing_fee == 0.25
+
+
+def test_clear_config_cache_forces_reparse(tmp_path):
+    path = str(tmp_path / "config.yaml")
+    _write_config(path)
+    first = load_config(path)
+
+    clear_config_cache()
+    assert load_config(path) is not first
@@ -88,6 +88,12 @@ class StubPlayerRepo:
             p.kills += 1
         return p
 
+    def add_kills(self, kills_by_player):
+        for player_id, kills in kills_by_player.items():
+            p = self._players.get(player_id)
+            if p:
+                p.kills += kills
+
     def add_win(self, player_id):
         p = self._players.get(player_id)
         if p:
@@ -197,6 +203,7 @@ def _make_engine(
     seed=42,
     match=None,
     character_repo=None,
+    on_round_end=None,
 ):
     m = match or StubMatch()
     cfg = config or MINIMAL_CONFIG
@@ -216,6 +223,7 @@ def _make_engine(
         event_repo=er,
         item_repo=ir,
         random_seed=seed,
+        on_round_end=on_round_end,
     )
 
 
@@ -252,6 +260,29 @@ class TestRunMatchConvergence:
         assert m.winner_character_id is not None
 
 
+    def test_kills_credited_once_at_match_end(self):
+        players, chars = _make_players_and_chars(3)
+        engine = _make_engine(players, chars)
+        engine.alive_pool = {c.id: c for c in chars}
+        engine.dead_pool = {}
+
+        engine._handle_direct_kill([chars[0], chars[1]])
+
+        assert players[1].kills == 0
+        assert engine.kills_by_player == {1: 1}
+
+        engine.run_match(chars)
+
+        assert sum(p.kills for p in players.values()) == sum(engine.kills_by_player.values())
+
+    def test_on_round_end_called_once_per_round(self):
+        players, chars = _make_players_and_chars(5)
+        rounds_seen = []
+        engine = _make_engine(players, chars, seed=3, on_round_end=lambda: rounds_seen.append(engine.round_number))
+        engine.run_match(chars)
+
+        assert rounds_seen == list(range(1, engine.round_number + 1))
+
 class TestPoolManagement:
 
     def test_elimination_moves_to_dead_pool(self):
@@ -0,0 +1,34 @@
+"""Tests for the shared scenario cache."""
+
+import json
+import os
+
+from core.match.scenario_loader import get_scenarios
+
+
+def _write_scenarios(directory, texts):
+    path = directory / "story.json"
+    path.write_text(json.dumps([{"text": t} for t in texts]))
+    return path
+
+
+def test_repeated_gets_return_shared_instance(tmp_path):
+    _write_scenarios(tmp_path, ["[Character A] finds a coin."])
+
+    first = get_scenarios(str(tmp_path))
+    assert first is get_scenarios(str(tmp_path))
+    assert isinstance(first["story"], tuple)
+    assert first["story"][0]["id"] == "story_000"
+
+
+def test_reloads_when_a_scenario_file_changes(tmp_path):
+    path = _write_scenarios(tmp_path, ["[Character A] finds a coin."])
+    first = get_scenarios(str(tmp_path))
+
+    _write_scenarios(tmp_path, ["[Character A] finds a coin.", "[Character A] naps."])
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    second = get_scenarios(str(tmp_path))
+    assert second is not first
+    assert len(second["story"]) == 2
@@ -0,0 +1,55 @@
+"""Tests for SqlPlayerRepo's set-based counter updates."""
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from backend.app.db.base_class import Base
+from backend.app.models.models import Player
+from core.player.repository import SqlPlayerRepo
+
+
+@pytest.fixture
+def db():
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    with Session(engine, expire_on_commit=False) as session:
+        yield session
+
+
+def _player(db, wallet, kills=0):
+    p = Player(wallet_address=wallet, kills=kills)
+    db.add(p)
+    db.commit()
+    return p
+
+
+def _kills(db, player_id):
+    return db.get(Player, player_id, populate_existing=True).kills
+
+
+def test_add_kills_applies_each_players_count(db):
+    a = _player(db, "0xa", kills=1)
+    b = _player(db, "0xb", kills=5)
+    bystander = _player(db, "0xc", kills=2)
+
+    SqlPlayerRepo(db).add_kills({a.id: 3, b.id: 1})
+    db.commit()
+
+    assert _kills(db, a.id) == 4
+    assert _kills(db, b.id) == 6
+    assert _kills(db, bystander.id) == 2
+
+
+def test_add_kills_with_no_kills_is_a_no_op(db):
+    a = _player(db, "0xa", kills=1)
+
+    SqlPlayerRepo(db).add_kills({})
+    db.commit()
+
+    assert _kills(db, a.id) == 1
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+One-off backfill of match_event_characters from match_events.affected_character_ids.
+
+Events written before the junction table existed only carry the CSV column,
+and the kill queries (get_killer_ids, count_kills_by_player, match results)
+read the table alone. Run this once after creating the table:
+
+Usage:
+    python scripts/backfill_match_event_characters.py
+    python scripts/backfill_match_event_characters.py --batch-size 5000
+
+Only events without any junction rows are touched, so re-running it (or
+running it while matches are being played) is safe.
+"""
+
+import argparse
+import os
+import sys
+
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from backend.app.db.session import SessionLocal
+from backend.app.models.models import MatchEvent, MatchEventCharacter
+
+
+def backfill(db: Session, batch_size: int = 1000) -> int:
+    """Split every unbackfilled event's CSV into junction rows.
+
+    Commits once per batch and returns the number of events backfilled.
+    """
+    has_rows = (
+        select(MatchEventCharacter.event_id)
+        .where(MatchEventCharacter.event_id == MatchEvent.id)
+        .exists()
+    )
+    done = 0
+    last_id = 0
+    while True:
+        events = db.execute(
+            select(MatchEvent.id, MatchEvent.affected_character_ids)
+            .where(
+                MatchEvent.id > last_id,
+                MatchEvent.affected_character_ids != "",
+                ~has_rows,
+            )
+            .order_by(MatchEvent.id)
+            .limit(batch_size)
+        ).all()
+        if not events:
+            return done
+        # Same parsing as MatchEvent._sync_characters
+        rows = [
+            {"event_id": event_id, "position": pos, "character_id": int(char_id)}
+            for event_id, csv in events
+            for pos, char_id in enumerate(i for i in csv.split(",") if i.strip())
+        ]
+        if rows:
+            db.execute(insert(MatchEventCharacter), rows)
+        db.commit()
+        done += len(events)
+        last_id = events[-1][0]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Backfill match_event_characters from affected_character_ids")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Events per transaction (default: 1000)")
+    args = parser.parse_args()
+
+    with SessionLocal() as db:
+        count = backfill(db, batch_size=args.batch_size)
+    print(f"Backfilled {count} match events")
+
+
+if __name__ == "__main__":
+    main()
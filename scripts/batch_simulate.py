@@ -2,18 +2,33 @@
 """
 Batch runner for simulate_match.py — tests edge cases and normal scenarios.
 
+Scenarios run in-process against a single shared config/scenario load.
+With --jobs N they are spread across N worker processes, each of which loads
+config/scenarios once at startup.
+
 Usage:
     python scripts/batch_simulate.py
     python scripts/batch_simulate.py --verbose
     python scripts/batch_simulate.py --filter boundary
+    python scripts/batch_simulate.py --jobs 4
 """
 
 import argparse
-import subprocess
+import io
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
 from dataclasses import dataclass
 from typing import List, Optional
-import re
+
+from simulate_match import (
+    SimulationContext,
+    SimulationResult,
+    build_parser,
+    prepare_simulation,
+    print_report,
+    run_simulation,
+)
 
 
 @dataclass
@@ -30,34 +45,21 @@ class ValidationResult:
     errors: List[str]
 
 
-def parse_output(output: str) -> dict:
-    """Extract key metrics from simulate_match.py output."""
-    metrics = {}
-    
-    # Extract numeric values
-    patterns = {
-        'players': r'Players:\s+(\d+)',
-        'total_chars': r'Total characters:\s+(\d+)',
-        'entry_fee': r'Entry fee:\s+([\d.]+)',
-        'kill_award_rate': r'Kill award rate:\s+([\d.]+)%',
-        'total_pool': r'Total pool:\s+([\d.]+)',
-        'protocol_fee': r'Protocol fee:\s+([\d.]+)',
-        'pool_after_protocol': r'Pool after protocol:\s+([\d.]+)',
-        'total_kill_awards': r'Total kill awards:\s+([\d.]+)',
-        'winner_payout': r'Winner payout:\s+([\d.]+)',
+def collect_metrics(sim: SimulationResult) -> dict:
+    """Key metrics for validation, read straight from the simulation result."""
+    result = sim.payouts
+    return {
+        'players': len(sim.chars_per_player_list),
+        'total_chars': len(sim.chars),
+        'entry_fee': sim.args.entry_fee,
+        'kill_award_rate': sim.args.kill_award_rate,
+        'total_pool': result.total_pool,
+        'protocol_fee': result.protocol_fee,
+        'pool_after_protocol': result.pool_after_protocol,
+        'total_kill_awards': result.total_kill_awards,
+        'winner_payout': result.winner_payout,
+        'char_distribution': sim.chars_per_player_list,
     }
-    
-    for key, pattern in patterns.items():
-        match = re.search(pattern, output)
-        if match:
-            metrics[key] = float(match.group(1))
-    
-    # Extract char distribution
-    dist_match = re.search(r'Char distribution:\s+\[([\d,\s]+)\]', output)
-    if dist_match:
-        metrics['char_distribution'] = [int(x.strip()) for x in dist_match.group(1).split(',')]
-    
-    return metrics
 
 
 def validate_economics(metrics: dict) -> ValidationResult:
@@ -92,39 +94,52 @@ def validate_economics(metrics: dict) -> ValidationResult:
     return ValidationResult(passed=len(errors) == 0, errors=errors)
 
 
-def run_scenario(scenario: Scenario, verbose: bool = False) -> tuple[bool, Optional[dict], Optional[ValidationResult]]:
-    """Run a single scenario and validate results."""
-    cmd = ['python', 'scripts/simulate_match.py'] + scenario.args
-    
+def run_scenario(
+    scenario: Scenario, ctx: SimulationContext, verbose: bool = False,
+) -> tuple[bool, Optional[dict], Optional[ValidationResult]]:
+    """Run a single scenario in-process and validate results."""
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
-        
-        if result.returncode != 0:
-            if verbose:
-                print(f"  STDERR: {result.stderr}")
-            return False, None, None
-        
-        metrics = parse_output(result.stdout)
+        args = build_parser(ctx.config).parse_args(scenario.args)
+        sim = run_simulation(ctx, args)
+
+        # Validate from the numbers themselves; the report is only rendered
+        # when it will be shown
+        metrics = collect_metrics(sim)
         validation = validate_economics(metrics)
-        
-        if verbose and result.stdout:
-            print(result.stdout)
-        
+
+        if verbose:
+            buf = io.StringIO()
+            with redirect_stdout(buf):
+                print_report(sim)
+            print(buf.getvalue())
+
         return True, metrics, validation
-        
-    except subprocess.TimeoutExpired:
-        return False, None, None
-    except Exception as e:
+
+    except (Exception, SystemExit) as e:
         if verbose:
-            print(f"  Exception: {e}")
+            print(f"  Exception: {e!r}")
         return False, None, None
 
 
+# Per-process context for --jobs workers, set by _init_worker
+_worker_ctx: Optional[SimulationContext] = None
+
+
+def _init_worker() -> None:
+    global _worker_ctx
+    _worker_ctx = prepare_simulation()
+
+
+def _run_scenario_in_worker(
+    scenario: Scenario, verbose: bool,
+) -> tuple[tuple[bool, Optional[dict], Optional[ValidationResult]], str]:
+    """Run a scenario in a pool worker, returning its result and captured output."""
+    buf = io.StringIO()
+    with redirect_stdout(buf):
+        result = run_scenario(scenario, _worker_ctx, verbose)
+    return result, buf.getvalue()
+
+
 def define_scenarios() -> List[Scenario]:
     """Define all test scenarios."""
     scenarios = []
@@ -300,6 +315,7 @@ def main():
     parser = argparse.ArgumentParser(description="Batch test simulate_match.py")
     parser.add_argument('--verbose', '-v', action='store_true', help="Show full output")
     parser.add_argument('--filter', '-f', type=str, help="Filter by category")
+    parser.add_argument('--jobs', '-j', type=int, default=1, help="Worker processes (default: 1, in-process)")
     args = parser.parse_args()
     
     scenarios = define_scenarios()
@@ -311,6 +327,18 @@ def main():
             sys.exit(1)
     
     print(f"Running {len(scenarios)} scenarios...\n")
+
+    if args.jobs > 1:
+        # Scenarios are independent (each seeds its own engine), so results
+        # are identical to a serial run; map() keeps them in scenario order.
+        with ProcessPoolExecutor(max_workers=args.jobs, initializer=_init_worker) as pool:
+            results = list(pool.map(
+                _run_scenario_in_worker, scenarios, [args.verbose] * len(scenarios),
+            ))
+    else:
+        # Config and scenarios are identical for every run; load them once
+        ctx = prepare_simulation()
+        results = None
     
     passed = 0
     failed = 0
@@ -320,7 +348,11 @@ def main():
         print(f"[{i}/{len(scenarios)}] {scenario.name} ({scenario.category})")
         print(f"    {scenario.description}")
         
-        success, metrics, validation = run_scenario(scenario, args.verbose)
+        if results is not None:
+            (success, metrics, validation), output = results[i - 1]
+            print(output, end="")
+        else:
+            success, metrics, validation = run_scenario(scenario, ctx, args.verbose)
         
         if not success:
             print("    ❌ FAILED (execution error)")
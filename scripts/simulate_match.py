@@ -11,18 +11,24 @@ Usage:
 import argparse
 import sys
 import os
-from typing import Dict, List, Optional
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
 from unittest.mock import MagicMock
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from core.config.config_loader import load_config
-from core.match.scenario_loader import load_scenarios
+from core.config.game_config import GameConfig
+from core.match.scenario_loader import get_scenarios
 from core.match.engine import MatchEngine
 from backend.app.services.payout_calculator import (
     CharacterInfo,
     KillEvent,
+    PayoutResult,
     calculate_payouts,
+    protocol_fee_rate,
+    protocol_fee_rates,
 )
 
 
@@ -97,6 +103,12 @@ class SimPlayerRepo:
         if p:
             p.kills += 1
 
+    def add_kills(self, kills_by_player: Dict[int, int]):
+        for player_id, kills in kills_by_player.items():
+            p = self._players.get(player_id)
+            if p:
+                p.kills += kills
+
     def add_win(self, player_id: int):
         p = self._players.get(player_id)
         if p:
@@ -157,23 +169,46 @@ def compute_protocol_fee(
     entry_fee: float,
     fee_tiers: Dict[int, float],
 ) -> float:
-    """Per-player tiered protocol fee, summed across all players."""
-    max_tier = max(fee_tiers.keys())
+    """Per-player tiered protocol fee, summed across all players.
+
+    Players entering the same number of characters pay the same rate, so the
+    fee is accumulated once per distinct count rather than once per player.
+    """
+    rates = protocol_fee_rates(fee_tiers)
     total = 0.0
-    for count in chars_per_player_list:
-        tier_key = min(count, max_tier)
-        rate = fee_tiers[tier_key] / 100.0
-        total += count * entry_fee * rate
+    for count, num_players in Counter(chars_per_player_list).items():
+        total += num_players * count * entry_fee * protocol_fee_rate(rates, count)
     return total
 
 
 # ---------------------------------------------------------------------------
-# Main
+# Simulation
 # ---------------------------------------------------------------------------
 
-def main() -> None:
+@dataclass
+class SimulationContext:
+    """Config and scenarios shared by every simulation in a process."""
+    config: GameConfig
+    scenarios: Dict[str, Sequence[Dict[str, str]]]
+
+
+@dataclass
+class SimulationResult:
+    args: argparse.Namespace
+    chars_per_player_list: List[int]
+    players: Dict[int, SimPlayer]
+    chars: List[SimCharacter]
+    match_log: List[str]
+    payouts: PayoutResult
+
+
+def prepare_simulation() -> SimulationContext:
+    """Load config and scenarios once; reuse the context across runs."""
     config = load_config()
+    return SimulationContext(config=config, scenarios=get_scenarios(config.scenario_dir))
+
 
+def build_parser(config: GameConfig) -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Simulate a match")
     parser.add_argument("--players", type=int, default=config.num_players_default)
     parser.add_argument("--chars-per-player", type=int, default=1)
@@ -186,16 +221,16 @@ def main() -> None:
     parser.add_argument("--entry-fee", type=float, default=config.default_fee)
     parser.add_argument("--kill-award-rate", type=float, default=config.kill_award_rate_default)
     parser.add_argument("--seed", type=int, default=42)
-    args = parser.parse_args()
+    return parser
+
+
+def run_simulation(ctx: SimulationContext, args: argparse.Namespace) -> SimulationResult:
+    config = ctx.config
 
     if args.char_distribution is not None:
         chars_per_player_list = [int(x.strip()) for x in args.char_distribution.split(",")]
-        num_players = len(chars_per_player_list)
     else:
-        num_players = args.players
-        chars_per_player_list = [args.chars_per_player] * num_players
-
-    scenarios = load_scenarios(config.scenario_dir)
+        chars_per_player_list = [args.chars_per_player] * args.players
 
     match = SimMatch(match_id=1, entry_fee=args.entry_fee, kill_award_rate=args.kill_award_rate)
     players, chars = build_participants(chars_per_player_list)
@@ -209,7 +244,7 @@ def main() -> None:
     engine = MatchEngine(
         match_id=match.id,
         config=config,
-        scenarios=scenarios,
+        scenarios=ctx.scenarios,
         player_repo=player_repo,
         character_repo=character_repo,
         match_repo=match_repo,
@@ -220,13 +255,6 @@ def main() -> None:
 
     winner, match_log = engine.run_match(chars)
 
-    # --- Print match log ---
-    print("=" * 60)
-    print("MATCH LOG")
-    print("=" * 60)
-    for line in match_log:
-        print(line)
-
     # --- Payout calculation ---
     kill_events = [
         KillEvent(killer_character_id=int(e["affected_character_ids"].split(",")[0].strip()))
@@ -254,14 +282,36 @@ def main() -> None:
         winner_character_id=match.winner_character_id,
     )
 
+    return SimulationResult(
+        args=args,
+        chars_per_player_list=chars_per_player_list,
+        players=players,
+        chars=chars,
+        match_log=match_log,
+        payouts=result,
+    )
+
+
+def print_report(sim: SimulationResult) -> None:
+    args = sim.args
+    players = sim.players
+    result = sim.payouts
+
+    # --- Print match log ---
+    print("=" * 60)
+    print("MATCH LOG")
+    print("=" * 60)
+    for line in sim.match_log:
+        print(line)
+
     # --- Print economic summary ---
     print()
     print("=" * 60)
     print("ECONOMIC SUMMARY")
     print("=" * 60)
-    print(f"Players:              {num_players}")
-    print(f"Char distribution:    {chars_per_player_list}")
-    print(f"Total characters:     {len(chars)}")
+    print(f"Players:              {len(sim.chars_per_player_list)}")
+    print(f"Char distribution:    {sim.chars_per_player_list}")
+    print(f"Total characters:     {len(sim.chars)}")
     print(f"Entry fee:            {args.entry_fee:.2f}")
     print(f"Kill award rate:      {args.kill_award_rate:.2%}")
     print(f"Seed:                 {args.seed}")
@@ -286,5 +336,15 @@ def main() -> None:
         print("\nNo winner determined.")
 
 
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def main() -> None:
+    ctx = prepare_simulation()
+    args = build_parser(ctx.config).parse_args()
+    print_report(run_simulation(ctx, args))
+
+
 if __name__ == "__main__":
     main()